@@ -1896,6 +1896,8 @@ run_video_cut() {
         cmd+=("-ss" "$start_time")
     fi
 
+    # Position of the main input; -hwaccel is spliced in here once encode is final.
+    local main_input_idx=${#cmd[@]}
     cmd+=("-i" "$input_file")
     local output_time_opts=()
 
@@ -2019,6 +2021,16 @@ run_video_cut() {
         encode=1
     fi
 
+    # Hardware decode pairs with the VideoToolbox encoder; frames are handed
+    # back to system memory automatically for the CPU subtitle/overlay filters.
+    # Decided only now, after subtitles/overlays/guest tags may have set encode=1.
+    if [[ $encode -eq 1 ]]; then
+        detect_render_encoder
+        if [[ "$MEDIA_RENDER_ENCODER" == "h264_videotoolbox" ]]; then
+            cmd=("${cmd[@]:0:$main_input_idx}" "-hwaccel" "videotoolbox" "${cmd[@]:$main_input_idx}")
+        fi
+    fi
+
     # Provide stable overlay sources via dedicated ffmpeg inputs (instead of movie filter sources).
     if [[ $banner_overlay_enabled -eq 1 && -n "$subtitle_banner_image" && -f "$subtitle_banner_image" ]]; then
         banner_input_idx=$next_filter_input_idx
@@ -2049,6 +2061,7 @@ run_video_cut() {
         local target_h=""
         # Default to input video height when no render resolution is provided.
         target_h=$(ffprobe -v error -select_streams v:0 -show_entries stream=height -of default=noprint_wrappers=1:nokey=1 "$input_file" 2>/dev/null)
+        local input_h="$target_h"
         [[ -z "$target_h" || ! "$target_h" =~ ^[0-9]+$ ]] && target_h=$(get_config "video" "resolution" "720")
         local quality=$(get_config "video" "quality" "70")
 
@@ -2059,7 +2072,8 @@ run_video_cut() {
         
         # Hardware Detection & Smart Encoder Selection
         # Always use H.264 for maximum compatibility (Telegram, QuickTime, etc.)
-        local encoder="libx264"
+        [[ -n "$MEDIA_RENDER_ENCODER" ]] || detect_render_encoder
+        local encoder="$MEDIA_RENDER_ENCODER"
         
         # Bitrate Logic (Match Input)
         local bitrate_flags=()
@@ -2271,6 +2285,19 @@ run_video_cut() {
         local crf_val=$(( (100 - quality) * 51 / 100 ))
         [[ $crf_val -lt 18 ]] && crf_val=18
 
+        local venc_args=("-c:v" "libx264" "-crf" "$crf_val" "${bitrate_flags[@]}" "-preset" "medium" "-pix_fmt" "yuv420p")
+        if [[ "$encoder" == "h264_videotoolbox" ]]; then
+            # VideoToolbox has no CRF: target input bitrate × quality/100, and shrink it
+            # with the pixel count when rendering below the source height.
+            local vt_bitrate
+            vt_bitrate=$(calculate_target_bitrate "$input_bitrate" "$quality" "$encoder")
+            if [[ "$input_h" =~ ^[0-9]+$ && "$target_h" =~ ^[0-9]+$ && "$target_h" -gt 0 && "$target_h" -lt "$input_h" ]]; then
+                vt_bitrate=$(awk -v br="$vt_bitrate" -v th="$target_h" -v ih="$input_h" \
+                    'BEGIN { t = br * (th / ih) * (th / ih); if (t < 100000) t = 100000; printf "%d", t }')
+            fi
+            venc_args=("-c:v" "h264_videotoolbox" "-b:v" "$vt_bitrate" "${bitrate_flags[@]}" "-realtime" "1" "-allow_sw" "1" "-pix_fmt" "yuv420p")
+        fi
+
         if $use_cover_frame; then
             local _fc=""
             if [[ -n "$overlay_fc" ]]; then
@@ -2280,14 +2307,18 @@ run_video_cut() {
                 [[ -n "$final_filter" ]] && _vprep="$final_filter"
                 _fc="[0:v]${_vprep}[vmain];[${cover_input_idx}:v][vmain]scale2ref=w=main_w:h=main_h:force_original_aspect_ratio=decrease[cover_scaled][vref];[cover_scaled]scale=w='iw*min(1\,sar)':h='ih*min(1\,1/sar)',setsar=1[cover_fixed];[vref]drawbox=x=0:y=0:w=iw:h=ih:color=black:t=fill:enable='lte(t,0.08)'[vref_bg];[vref_bg][cover_fixed]overlay=(W-w)/2:(H-h)/2:enable='lte(t,0.08)':eof_action=pass[vout]"
             fi
-            cmd+=("-filter_complex" "$_fc" "-map" "[vout]" "-map" "0:a?" "-c:v" "libx264" "-crf" "$crf_val" "${bitrate_flags[@]}" "-preset" "medium" "-pix_fmt" "yuv420p" "-c:a" "copy")
+            cmd+=("-filter_complex" "$_fc" "-map" "[vout]" "-map" "0:a?" "${venc_args[@]}" "-c:a" "copy")
         elif [[ -n "$overlay_fc" ]]; then
-            cmd+=("-filter_complex" "$overlay_fc" "-map" "[${overlay_out_label}]" "-map" "0:a?" "-c:v" "libx264" "-crf" "$crf_val" "${bitrate_flags[@]}" "-preset" "medium" "-pix_fmt" "yuv420p" "-c:a" "copy")
+            cmd+=("-filter_complex" "$overlay_fc" "-map" "[${overlay_out_label}]" "-map" "0:a?" "${venc_args[@]}" "-c:a" "copy")
         elif [[ -n "$final_filter" ]]; then
-            cmd+=("-vf" "$final_filter" "-c:v" "libx264" "-crf" "$crf_val" "${bitrate_flags[@]}" "-preset" "medium" "-pix_fmt" "yuv420p" "-c:a" "copy")
+            cmd+=("-vf" "$final_filter" "${venc_args[@]}" "-c:a" "copy")
         else
             # No filters path
-            cmd+=("-c:v" "libx264" "-crf" "23" "${bitrate_flags[@]}" "-preset" "medium" "-c:a" "copy")
+            if [[ "$encoder" == "h264_videotoolbox" ]]; then
+                cmd+=("${venc_args[@]}" "-c:a" "copy")
+            else
+                cmd+=("-c:v" "libx264" "-crf" "23" "${bitrate_flags[@]}" "-preset" "medium" "-c:a" "copy")
+            fi
         fi
     else
         echo "🚀 Mode: Stream Copy (Instant)"
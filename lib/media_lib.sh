@@ -51,6 +51,18 @@ detect_encoder() {
     # If no HW encoder found, falls back to CPU defaults set above
 }
 
+# Pick the H.264 encoder used for subtitle/overlay renders.
+# Usage: detect_render_encoder
+# Sets: MEDIA_RENDER_ENCODER (h264_videotoolbox when available, else libx264)
+# Set AMIR_RENDER_CPU=1 to force libx264.
+detect_render_encoder() {
+    MEDIA_RENDER_ENCODER="libx264"
+    [[ "${AMIR_RENDER_CPU:-0}" == "1" ]] && return 0
+    if "${FFMPEG_EXEC:-ffmpeg}" -hide_banner -encoders 2>/dev/null | grep -q "h264_videotoolbox"; then
+        MEDIA_RENDER_ENCODER="h264_videotoolbox"
+    fi
+}
+
 # ==============================================================================
 # 2. MEDIA PROBING (Duration, Bitrate, Info)
 # ==============================================================================
@@ -1,10 +1,16 @@
 import sys
 import os
 import re
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 import arabic_reshaper
 from bidi.algorithm import get_display
 
+@lru_cache(maxsize=4096)
+def process_rtl(text):
+    # The word-wrap loop below reshapes the same growing prefixes repeatedly.
+    return get_display(arabic_reshaper.reshape(text))
+
 def is_latin(char):
     return ord(char) < 0x0600
 
@@ -85,9 +91,6 @@ def render_markdown(input_path, output_path, font_path, fallback_path):
     with open(input_path, 'r', encoding='utf-8') as f:
         lines = f.readlines()
 
-    def process_rtl(text):
-        return get_display(arabic_reshaper.reshape(text))
-
     for line in lines:
         line = line.strip()
         if not line:
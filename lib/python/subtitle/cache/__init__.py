@@ -1,29 +1,57 @@
 from .checkpoint import (
     clear_checkpoint,
     get_checkpoint_path,
+    legacy_checkpoint_path,
     load_checkpoint,
     save_checkpoint,
 )
 from .helpers import (
+    atomic_write_bytes,
+    count_legacy_translations,
     create_balanced_batches,
+    dump_json_bytes,
+    legacy_local_cache_key,
+    load_json_bytes,
     load_local_translation_cache,
     local_cache_key,
     log_cost_savings,
     lookup_local_cache,
+    lookup_transcript_cache,
+    lookup_translation_cache_db,
+    lookup_translation_cache_db_many,
+    open_translation_cache_db,
     save_local_translation_cache,
     store_local_cache,
+    store_transcript_cache,
+    store_translation_cache_db,
+    take_legacy_translations,
+    transcript_cache_key,
 )
 
 __all__ = [
+    "atomic_write_bytes",
     "create_balanced_batches",
+    "dump_json_bytes",
+    "load_json_bytes",
     "save_checkpoint",
     "load_checkpoint",
     "clear_checkpoint",
     "get_checkpoint_path",
+    "legacy_checkpoint_path",
     "local_cache_key",
+    "legacy_local_cache_key",
     "load_local_translation_cache",
     "save_local_translation_cache",
     "lookup_local_cache",
     "store_local_cache",
+    "open_translation_cache_db",
+    "lookup_translation_cache_db",
+    "lookup_translation_cache_db_many",
+    "store_translation_cache_db",
+    "count_legacy_translations",
+    "take_legacy_translations",
+    "transcript_cache_key",
+    "lookup_transcript_cache",
+    "store_transcript_cache",
     "log_cost_savings",
 ]
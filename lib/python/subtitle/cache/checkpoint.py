@@ -1,42 +1,46 @@
-import json
+import hashlib
 from pathlib import Path
 from typing import Optional
 
 from subtitle.models import ProcessingCheckpoint, ProcessingStage
 
+from .helpers import atomic_write_bytes, dump_json_bytes, load_json_bytes
+
 
 def get_checkpoint_path(cache_dir: Path, video_path: str) -> Path:
-    import hashlib
+    video_hash = hashlib.blake2b(video_path.encode(), digest_size=4).hexdigest()
+    return cache_dir / f"checkpoint_{video_hash}.json"
+
 
+def legacy_checkpoint_path(cache_dir: Path, video_path: str) -> Path:
+    """MD5-keyed path used by checkpoints written before the blake2b switch."""
     video_hash = hashlib.md5(video_path.encode()).hexdigest()[:8]
     return cache_dir / f"checkpoint_{video_hash}.json"
 
 
 def save_checkpoint(cache_dir: Path, checkpoint: ProcessingCheckpoint) -> None:
     checkpoint_file = get_checkpoint_path(cache_dir, checkpoint.video_path)
-    with open(checkpoint_file, "w", encoding="utf-8") as f:
-        json.dump(
-            {
-                "video_path": checkpoint.video_path,
-                "stage": checkpoint.stage.value,
-                "source_lang": checkpoint.source_lang,
-                "target_langs": checkpoint.target_langs,
-                "timestamp": checkpoint.timestamp,
-                "data": checkpoint.data,
-            },
-            f,
-            indent=2,
-        )
+    payload = {
+        "video_path": checkpoint.video_path,
+        "stage": checkpoint.stage.value,
+        "source_lang": checkpoint.source_lang,
+        "target_langs": checkpoint.target_langs,
+        "timestamp": checkpoint.timestamp,
+        "data": checkpoint.data,
+    }
+    atomic_write_bytes(checkpoint_file, dump_json_bytes(payload, indent=True))
 
 
 def load_checkpoint(cache_dir: Path, video_path: str) -> Optional[ProcessingCheckpoint]:
     checkpoint_file = get_checkpoint_path(cache_dir, video_path)
     if not checkpoint_file.exists():
-        return None
+        checkpoint_file = legacy_checkpoint_path(cache_dir, video_path)
+        if not checkpoint_file.exists():
+            return None
 
     try:
-        with open(checkpoint_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(checkpoint_file, "rb") as f:
+            data = load_json_bytes(f.read())
 
         return ProcessingCheckpoint(
             video_path=data["video_path"],
@@ -51,6 +55,9 @@ def load_checkpoint(cache_dir: Path, video_path: str) -> Optional[ProcessingChec
 
 
 def clear_checkpoint(cache_dir: Path, video_path: str) -> None:
-    checkpoint_file = get_checkpoint_path(cache_dir, video_path)
-    if checkpoint_file.exists():
-        checkpoint_file.unlink()
+    for checkpoint_file in (
+        get_checkpoint_path(cache_dir, video_path),
+        legacy_checkpoint_path(cache_dir, video_path),
+    ):
+        if checkpoint_file.exists():
+            checkpoint_file.unlink()
@@ -1,7 +1,49 @@
 import hashlib
 import json
+import os
+import sqlite3
+import tempfile
+from bisect import bisect_right
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dump_json_bytes(payload: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when installed, stdlib otherwise)."""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(payload, option=option)
+    return json.dumps(payload, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def load_json_bytes(raw: bytes) -> Any:
+    """Parse JSON from bytes (orjson when installed, stdlib otherwise)."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write via a sibling temp file + os.replace so readers never see partial content."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 def create_balanced_batches(
@@ -11,25 +53,25 @@ def create_balanced_batches(
     max_chars: int = 5000,
     logger=None,
 ) -> List[List[int]]:
-    """Split indices into balanced batches by count and char budget."""
-    batches: List[List[int]] = []
-    current_batch: List[int] = []
-    current_chars = 0
+    """Split indices into balanced batches by count and char budget.
 
-    for idx in indices:
-        text_len = len(texts[idx])
-        if len(current_batch) >= max_batch_size or (
-            current_batch and current_chars + text_len > max_chars
-        ):
-            batches.append(current_batch)
-            current_batch = []
-            current_chars = 0
+    A batch closes when it holds max_batch_size entries or the next entry
+    would push it past max_chars (an oversized entry still gets a batch of
+    its own). Batch ends are found by bisecting a prefix sum of lengths, so
+    the Python-level work is per batch rather than per entry.
+    """
+    n = len(indices)
+    max_batch_size = max(1, max_batch_size)
+    prefix = [0]
+    prefix.extend(accumulate(len(texts[idx]) for idx in indices))
 
-        current_batch.append(idx)
-        current_chars += text_len
-
-    if current_batch:
-        batches.append(current_batch)
+    batches: List[List[int]] = []
+    start = 0
+    while start < n:
+        end = bisect_right(prefix, prefix[start] + max_chars, start + 1) - 1
+        end = min(max(end, start + 1), start + max_batch_size, n)
+        batches.append(indices[start:end])
+        start = end
 
     if logger is not None:
         logger.debug(
@@ -41,6 +83,11 @@ def create_balanced_batches(
 
 def local_cache_key(text: str, target_lang: str) -> str:
     """Stable hash key for local translation cache."""
+    return hashlib.blake2b(f"{text}|||{target_lang}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def legacy_local_cache_key(text: str, target_lang: str) -> str:
+    """MD5 key used by translation caches written before the blake2b switch."""
     return hashlib.md5(f"{text}|||{target_lang}".encode("utf-8")).hexdigest()
 
 
@@ -48,8 +95,8 @@ def load_local_translation_cache(cache_path: Path, logger=None) -> Dict[str, str
     """Load persisted local translation cache from disk."""
     try:
         if cache_path.exists():
-            with open(cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(cache_path, "rb") as f:
+                data = load_json_bytes(f.read())
             if isinstance(data, dict):
                 if logger is not None:
                     logger.debug(f"💾 Local translation cache loaded: {len(data)} entries")
@@ -63,9 +110,7 @@ def load_local_translation_cache(cache_path: Path, logger=None) -> Dict[str, str
 def save_local_translation_cache(cache_path: Path, cache_data: Dict[str, str], logger=None) -> bool:
     """Persist local translation cache to disk. Returns True on success."""
     try:
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f, ensure_ascii=False, indent=None)
+        atomic_write_bytes(cache_path, dump_json_bytes(cache_data))
         return True
     except Exception as e:
         if logger is not None:
@@ -86,14 +131,171 @@ def store_local_cache(cache_data: Dict[str, str], text: str, target_lang: str, t
     return False
 
 
+def open_translation_cache_db(
+    db_path: Path,
+    legacy_json_path: Optional[Path] = None,
+    logger=None,
+) -> Optional[sqlite3.Connection]:
+    """Open the SQLite translation cache (WAL mode). Returns None on failure.
+
+    A legacy JSON cache found at ``legacy_json_path`` is imported once and renamed.
+    MD5-keyed rows (the JSON import, and databases written before the blake2b
+    switch) are kept apart in ``tx_legacy`` until a lookup re-keys them; see
+    take_legacy_translations().
+    """
+    try:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS tx(key TEXT PRIMARY KEY, text TEXT)")
+            conn.execute("CREATE TABLE IF NOT EXISTS tx_legacy(key TEXT PRIMARY KEY, text TEXT)")
+            conn.execute("CREATE TABLE IF NOT EXISTS transcripts(key TEXT PRIMARY KEY, lang TEXT, srt TEXT)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta(key TEXT PRIMARY KEY, value TEXT)")
+            scheme = conn.execute("SELECT value FROM meta WHERE key='key_scheme'").fetchone()
+            if scheme is None:
+                # Unmarked database: its rows predate blake2b keys (or may mix both).
+                conn.execute("INSERT OR IGNORE INTO tx_legacy(key, text) SELECT key, text FROM tx")
+                conn.execute("DELETE FROM tx")
+                conn.execute("INSERT INTO meta(key, value) VALUES ('key_scheme', 'blake2b')")
+    except Exception as e:
+        if logger is not None:
+            logger.warning(f"Could not open translation cache database: {e}")
+        return None
+
+    if legacy_json_path is not None and legacy_json_path.exists():
+        legacy = load_local_translation_cache(legacy_json_path, logger=logger)
+        if store_translation_cache_db(conn, legacy.items(), logger=logger, table="tx_legacy"):
+            try:
+                legacy_json_path.rename(legacy_json_path.with_name(legacy_json_path.name + ".migrated"))
+            except OSError:
+                pass
+            if logger is not None and legacy:
+                logger.info(f"💾 Migrated {len(legacy)} cached translations to {db_path.name}")
+    return conn
+
+
+def lookup_translation_cache_db(conn: sqlite3.Connection, key: str) -> Optional[str]:
+    """Return cached translation for a key from the SQLite cache, or None."""
+    try:
+        row = conn.execute("SELECT text FROM tx WHERE key=?", (key,)).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def lookup_translation_cache_db_many(
+    conn: sqlite3.Connection,
+    keys: List[str],
+    chunk_size: int = 900,
+    table: str = "tx",
+) -> Dict[str, str]:
+    """Resolve many keys with ``IN (...)`` queries, chunked below SQLite's parameter limit."""
+    found: Dict[str, str] = {}
+    unique_keys = list(dict.fromkeys(keys))
+    try:
+        for start in range(0, len(unique_keys), chunk_size):
+            chunk = unique_keys[start:start + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(f"SELECT key, text FROM {table} WHERE key IN ({placeholders})", chunk)
+            found.update(rows)
+    except sqlite3.Error:
+        pass
+    return found
+
+
+def store_translation_cache_db(
+    conn: sqlite3.Connection,
+    items: Iterable[Tuple[str, str]],
+    logger=None,
+    table: str = "tx",
+) -> bool:
+    """Write (key, translation) pairs in a single transaction. Returns True on success."""
+    try:
+        with conn:
+            conn.executemany(f"INSERT OR REPLACE INTO {table}(key, text) VALUES (?, ?)", items)
+        return True
+    except sqlite3.Error as e:
+        if logger is not None:
+            logger.warning(f"Could not save translation cache: {e}")
+        return False
+
+
+def count_legacy_translations(conn: sqlite3.Connection) -> int:
+    """Number of rows still waiting in ``tx_legacy``."""
+    try:
+        return conn.execute("SELECT COUNT(*) FROM tx_legacy").fetchone()[0]
+    except sqlite3.Error:
+        return 0
+
+
+def take_legacy_translations(
+    conn: sqlite3.Connection,
+    rekey: Dict[str, str],
+    logger=None,
+) -> Tuple[Dict[str, str], int]:
+    """Move legacy rows found under ``rekey``'s keys into ``tx`` under the mapped keys.
+
+    Returns ({new_key: translation}, rows left in ``tx_legacy``). The move is a
+    single transaction, so a row is never in neither table.
+    """
+    found = lookup_translation_cache_db_many(conn, list(rekey), table="tx_legacy")
+    moved = {rekey[key]: text for key, text in found.items() if text}
+    if found:
+        try:
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO tx(key, text) VALUES (?, ?)", moved.items())
+                conn.executemany("DELETE FROM tx_legacy WHERE key=?", [(key,) for key in found])
+        except sqlite3.Error as e:
+            if logger is not None:
+                logger.warning(f"Could not re-key legacy translation cache rows: {e}")
+    return moved, count_legacy_translations(conn)
+
+
+def transcript_cache_key(video_path: str, *settings: Any) -> Optional[str]:
+    """Key a transcription by file identity (path, size, mtime) and the settings that shape it.
+
+    Returns None when the file cannot be stat'ed.
+    """
+    try:
+        st = os.stat(video_path)
+    except OSError:
+        return None
+    ident = "|".join(map(str, (os.path.abspath(video_path), st.st_size, st.st_mtime_ns, *settings)))
+    return hashlib.blake2b(ident.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def lookup_transcript_cache(conn: sqlite3.Connection, key: str) -> Optional[Tuple[str, str]]:
+    """Return (lang, srt_text) for a cached transcription, or None."""
+    try:
+        row = conn.execute("SELECT lang, srt FROM transcripts WHERE key=?", (key,)).fetchone()
+    except sqlite3.Error:
+        return None
+    return (row[0], row[1]) if row else None
+
+
+def store_transcript_cache(conn: sqlite3.Connection, key: str, lang: str, srt_text: str, logger=None) -> bool:
+    """Remember a finished transcription. Returns True on success."""
+    try:
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO transcripts(key, lang, srt) VALUES (?, ?, ?)", (key, lang, srt_text))
+        return True
+    except sqlite3.Error as e:
+        if logger is not None:
+            logger.warning(f"Could not save transcript cache: {e}")
+        return False
+
+
 def log_cost_savings(cost_savings: Dict[str, int], logger) -> None:
     """Print accumulated cost savings summary."""
     total_local = cost_savings.get("local_cache_hits", 0)
     ds_cached = cost_savings.get("deepseek_cache_hit_tokens", 0)
     grok_cached = cost_savings.get("grok_cache_hit_tokens", 0)
     gem_cached = cost_savings.get("gemini_cached_tokens", 0)
+    litellm_cached = cost_savings.get("litellm_cached_tokens", 0)
 
-    if total_local + ds_cached + grok_cached + gem_cached == 0:
+    if total_local + ds_cached + grok_cached + gem_cached + litellm_cached == 0:
         return
 
     logger.info("──────────────────────────────────────────")
@@ -106,4 +308,6 @@ def log_cost_savings(cost_savings: Dict[str, int], logger) -> None:
         logger.info(f"   • Grok cached tokens: {grok_cached:,} (discounted)")
     if gem_cached:
         logger.info(f"   • Gemini cached tokens: {gem_cached:,} (guaranteed discount)")
+    if litellm_cached:
+        logger.info(f"   • LiteLLM cached tokens: {litellm_cached:,} (provider prompt cache)")
     logger.info("──────────────────────────────────────────")
@@ -1,3 +1,5 @@
+from .aimd import AIMDController, is_throttle_error
+from .batches import run_batches
 from .locks import (
     acquire_global_workflow_slot,
     acquire_workflow_lock,
@@ -5,6 +7,8 @@ from .locks import (
     release_global_workflow_slot,
     release_workflow_lock,
 )
+from .log_queue import queued_file_handler, stop_log_listeners
+from .rate_limit import RateLimiter, translate_request_rate
 
 __all__ = [
     "is_pid_alive",
@@ -12,4 +16,11 @@ __all__ = [
     "release_workflow_lock",
     "acquire_global_workflow_slot",
     "release_global_workflow_slot",
+    "queued_file_handler",
+    "stop_log_listeners",
+    "RateLimiter",
+    "run_batches",
+    "AIMDController",
+    "is_throttle_error",
+    "translate_request_rate",
 ]
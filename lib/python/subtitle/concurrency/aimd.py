@@ -0,0 +1,133 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+# Status codes that mean "slow down" rather than "this request is wrong".
+_THROTTLE_STATUS = frozenset({429, 500, 502, 503, 504})
+_THROTTLE_MARKERS = ("429", "rate limit", "ratelimit", "resource_exhausted", "overloaded", "503", "too many requests")
+
+
+def _error_status(err: BaseException) -> Optional[int]:
+    for attr in ("status_code", "code", "status"):
+        value = getattr(err, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(err, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def _retry_after_seconds(err: BaseException) -> Optional[float]:
+    """Retry-After from the HTTP response attached to an SDK error, if any."""
+    headers = getattr(getattr(err, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_throttle_error(err: BaseException) -> bool:
+    """True for 429/5xx-style errors that call for backing off."""
+    status = _error_status(err)
+    if status is not None:
+        return status in _THROTTLE_STATUS
+    text = str(err).lower()
+    return any(marker in text for marker in _THROTTLE_MARKERS)
+
+
+class AIMDController:
+    """Additive-increase / multiplicative-decrease limit on in-flight API calls.
+
+    slot() blocks while ``limit`` calls are already running. Each on_success
+    under the latency target grows the limit by alpha/limit (about +alpha per
+    round of calls); a throttling error multiplies it by beta. A Retry-After
+    from the provider holds next_backoff() until it has passed. Shared by all
+    batch threads of a processor.
+
+    The same signals size future batches: every ``window`` successes under
+    the latency target grow ``budget_scale`` by 10% (up to 2x), a throttling
+    error halves it (down to 1/4); see batch_char_budget().
+    """
+
+    def __init__(
+        self,
+        c_min: int = 1,
+        c_max: int = 32,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        latency_target: float = 8.0,
+        window: int = 5,
+    ):
+        self.c_min = max(1, c_min)
+        self.c_max = max(self.c_min, c_max)
+        self.alpha = alpha
+        self.beta = beta
+        self.latency_target = latency_target
+        self.window = max(1, window)
+        self.limit = float(self.c_max)
+        self.budget_scale = 1.0
+        self._fast_streak = 0
+        self.avg_latency = 0.0
+        self._in_flight = 0
+        self._retry_at = 0.0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify()
+
+    def on_success(self, latency: float) -> None:
+        with self._cond:
+            self.avg_latency = latency if not self.avg_latency else 0.8 * self.avg_latency + 0.2 * latency
+            if self.avg_latency <= self.latency_target:
+                grown = min(self.c_max, self.limit + self.alpha / self.limit)
+                if int(grown) > int(self.limit):
+                    self._cond.notify_all()
+                self.limit = grown
+                self._fast_streak += 1
+                if self._fast_streak >= self.window:
+                    self.budget_scale = min(2.0, self.budget_scale * 1.1)
+                    self._fast_streak = 0
+            else:
+                self._fast_streak = 0
+
+    def on_error(self, err: BaseException) -> None:
+        if not is_throttle_error(err):
+            return
+        retry_after = _retry_after_seconds(err)
+        with self._cond:
+            self.limit = max(float(self.c_min), self.limit * self.beta)
+            self.budget_scale = max(0.25, self.budget_scale * 0.5)
+            self._fast_streak = 0
+            if retry_after:
+                self._retry_at = max(self._retry_at, time.monotonic() + retry_after)
+
+    def batch_char_budget(self, base_chars: int) -> int:
+        """Per-batch character budget scaled by how the provider has been coping."""
+        return max(1, int(base_chars * self.budget_scale))
+
+    def next_backoff(self, attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+        """Jittered delay before retry number ``attempt`` (1-based), in seconds.
+
+        Drawn from [base, base * 3**attempt] (capped), so threads that failed
+        together do not retry together; never shorter than a pending Retry-After.
+        """
+        upper = min(cap, base * 3 ** max(1, attempt))
+        delay = random.uniform(base, max(base, upper))
+        with self._cond:
+            hold = self._retry_at - time.monotonic()
+        return max(delay, hold)
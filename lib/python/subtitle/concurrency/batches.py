@@ -0,0 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def run_batches(
+    fn: Callable[[int, T], None],
+    batches: Sequence[T],
+    workers: int,
+    thread_name_prefix: str = "batch",
+) -> None:
+    """Call fn(i, batch) for every batch on up to ``workers`` threads.
+
+    Batches must not depend on each other's results; completion order is
+    arbitrary. The first exception is re-raised after cancelling batches
+    that have not started. One worker (or one batch) runs inline.
+    """
+    workers = min(len(batches), workers)
+    if workers <= 1:
+        for i, batch in enumerate(batches):
+            fn(i, batch)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix) as pool:
+        futures = [pool.submit(fn, i, batch) for i, batch in enumerate(batches)]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
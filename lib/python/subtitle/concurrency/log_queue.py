@@ -0,0 +1,42 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import List
+
+_listeners: List[QueueListener] = []
+
+
+def queued_file_handler(log_file, formatter: logging.Formatter, level: int = logging.DEBUG) -> QueueHandler:
+    """Return a handler that hands records to a background thread writing log_file.
+
+    Logging calls from hot loops become queue puts; the FileHandler's disk
+    writes happen on the listener thread. The listener is drained and stopped
+    at interpreter exit so no records are lost.
+    """
+    file_h = logging.FileHandler(log_file)
+    file_h.setLevel(level)
+    file_h.setFormatter(formatter)
+
+    q: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(q, file_h, respect_handler_level=True)
+    listener.start()
+    if not _listeners:
+        atexit.register(stop_log_listeners)
+    _listeners.append(listener)
+
+    handler = QueueHandler(q)
+    handler.setLevel(level)
+    return handler
+
+
+def stop_log_listeners() -> None:
+    """Flush queued records to disk and stop every listener thread."""
+    while _listeners:
+        listener = _listeners.pop()
+        try:
+            listener.stop()
+        except Exception:
+            pass
+        for h in listener.handlers:
+            h.close()
@@ -0,0 +1,41 @@
+import os
+import threading
+import time
+
+
+def translate_request_rate() -> float:
+    """Translation API requests per second shared by concurrent batches.
+
+    AMIR_TRANSLATE_RPS overrides the default of 5; 0 disables pacing.
+    """
+    val = os.environ.get("AMIR_TRANSLATE_RPS", "").strip()
+    if val:
+        try:
+            return max(0.0, float(val))
+        except ValueError:
+            pass
+    return 5.0
+
+
+class RateLimiter:
+    """Spaces wait() returns at least 1/rate seconds apart across threads.
+
+    Each caller reserves the next free slot under the lock and sleeps
+    outside it, so concurrent batches queue up instead of bursting.
+    A rate of 0 (or less) never waits.
+    """
+
+    def __init__(self, rate_per_sec: float):
+        self.interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
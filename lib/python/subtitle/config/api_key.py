@@ -1,6 +1,39 @@
 import configparser
 import os
 
+_KEY_NAMES = ("DEEPSEEK_API_KEY", "DEEPSEEK_API")
+_PLACEHOLDER_KEYS = ("REPLACE_WITH_YOUR_KEY", "sk-your-key")
+
+
+def _is_real_key(key: str) -> bool:
+    return bool(key) and key not in _PLACEHOLDER_KEYS
+
+
+def _key_from_env_lines(content: str) -> str:
+    for line in content.splitlines():
+        line = line.strip()
+        for key_name in _KEY_NAMES:
+            if line.startswith(key_name + "="):
+                key = line.split("=", 1)[1].strip().strip('"').strip("'")
+                if _is_real_key(key):
+                    return key
+    return ""
+
+
+def _key_from_ini(content: str) -> str:
+    try:
+        config = configparser.ConfigParser()
+        config.read_string(content)
+    except configparser.Error:
+        return ""
+    if "DEFAULT" in config:
+        for key_name in _KEY_NAMES:
+            if key_name in config["DEFAULT"]:
+                key = config["DEFAULT"][key_name].strip()
+                if _is_real_key(key):
+                    return key
+    return ""
+
 
 def load_api_key(config_file: str = ".config") -> str:
     """Load API key from env, .env file, or config."""
@@ -17,35 +50,26 @@ def load_api_key(config_file: str = ".config") -> str:
         os.path.expanduser("~/.env"),
     ]
 
+    seen = set()
     for path in search_paths:
-        if not os.path.exists(path):
+        abs_path = os.path.abspath(path)
+        if abs_path in seen or not os.path.isfile(abs_path):
             continue
+        seen.add(abs_path)
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith("DEEPSEEK_API_KEY="):
-                        key = line.split("=", 1)[1].strip().strip('"').strip("'")
-                        if key and key not in ["REPLACE_WITH_YOUR_KEY", "sk-your-key"]:
-                            return key
-                    elif line.startswith("DEEPSEEK_API="):
-                        key = line.split("=", 1)[1].strip().strip('"').strip("'")
-                        if key and key not in ["REPLACE_WITH_YOUR_KEY", "sk-your-key"]:
-                            return key
-        except Exception:
-            pass
-
-        try:
-            config = configparser.ConfigParser()
-            config.read(path)
-            if "DEFAULT" in config:
-                for key_name in ["DEEPSEEK_API_KEY", "DEEPSEEK_API"]:
-                    if key_name in config["DEFAULT"]:
-                        key = config["DEFAULT"][key_name].strip()
-                        if key and key not in ["REPLACE_WITH_YOUR_KEY", "sk-your-key"]:
-                            return key
-        except Exception:
+            with open(abs_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
             continue
 
+        key = _key_from_env_lines(content)
+        if key:
+            return key
+        # Plain KEY=value dotenv files never need the INI parser.
+        if not abs_path.endswith(".env"):
+            key = _key_from_ini(content)
+            if key:
+                return key
+
     return ""
@@ -1,8 +1,9 @@
-from dataclasses import dataclass
-from typing import Optional
+import re
+from dataclasses import dataclass, field
+from typing import Optional, Pattern
 
 
-@dataclass
+@dataclass(slots=True)
 class LanguageConfig:
     """Configuration for a specific language."""
 
@@ -10,6 +11,13 @@ class LanguageConfig:
     name: str
     char_range: Optional[tuple] = None
     rtl: bool = False
+    char_pattern: Optional[Pattern] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Script detection runs per subtitle line; compile the range once so the scan stays in C.
+        if self.char_range:
+            start, end = self.char_range
+            self.char_pattern = re.compile(f"[{re.escape(start)}-{re.escape(end)}]")
 
 
 LANGUAGE_REGISTRY = {
@@ -64,5 +72,4 @@ def has_target_language_chars(text: str, lang_code: str) -> bool:
     if not lang_config.char_range:
         return True
 
-    char_start, char_end = lang_config.char_range
-    return any(char_start <= c <= char_end for c in text)
+    return lang_config.char_pattern.search(text) is not None
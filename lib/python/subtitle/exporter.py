@@ -38,11 +38,18 @@ def _get_lang_meta(lang: str) -> dict:
     return LANG_META.get(lang, {"name": lang.upper(), "native": lang, "rtl": False, "font": "Inter"})
 
 
+_BIDI_CONTROL_RE = re.compile(r"[\u200e\u200f\u202a-\u202e\u2066-\u2069]")
+_WS_RE = re.compile(r"\s+")
+_BLANK_LINE_RE = re.compile(r'\n\s*\n')
+_INDEX_LINE_RE = re.compile(r'^\d+$')
+_TIMING_LINE_RE = re.compile(r'^(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})$')
+
+
 def _clean_subtitle_text(text: str) -> str:
     """Remove BiDi control marks and normalize subtitle text spacing."""
     # Remove invisible directional controls commonly injected in RTL pipelines.
-    text = re.sub(r"[\u200e\u200f\u202a-\u202e\u2066-\u2069]", "", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _BIDI_CONTROL_RE.sub("", text)
+    text = _WS_RE.sub(" ", text).strip()
     return text
 
 
@@ -62,7 +69,7 @@ def _parse_srt_entries(srt_path: str) -> List[dict]:
         s, ms = s_ms.split(',')
         return int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000.0
 
-    blocks = re.split(r'\n\s*\n', content.strip())
+    blocks = _BLANK_LINE_RE.split(content.strip())
     for block in blocks:
         lines = block.strip().split('\n')
         if len(lines) < 3:
@@ -72,13 +79,10 @@ def _parse_srt_entries(srt_path: str) -> List[dict]:
         end_sec = 0.0
         text_lines = []
         for i, line in enumerate(lines):
-            if i == 0 and re.match(r'^\d+$', line.strip()):
+            if i == 0 and _INDEX_LINE_RE.match(line.strip()):
                 continue
             if '-->' in line:
-                m = re.match(
-                    r'^(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})$',
-                    line.strip(),
-                )
+                m = _TIMING_LINE_RE.match(line.strip())
                 if m:
                     start_sec = _to_sec(m.group(1))
                     end_sec = _to_sec(m.group(2))
@@ -192,7 +196,7 @@ def export_md(text: str, output_path: str, title: str, lang: str) -> bool:
     """Export as Markdown document with title and language header."""
     meta = _get_lang_meta(lang)
     
-    paragraphs = [p.strip() for p in re.split(r'\n\s*\n', text) if p.strip()]
+    paragraphs = [p.strip() for p in _BLANK_LINE_RE.split(text) if p.strip()]
     
     # Build Markdown
     md_lines = [
@@ -221,7 +225,7 @@ def export_html(text: str, output_path: str, title: str, lang: str) -> bool:
     text_align = "right" if meta["rtl"] else "left"
     font = meta["font"]
     
-    paragraphs = [p.strip() for p in re.split(r'\n\s*\n', text) if p.strip()]
+    paragraphs = [p.strip() for p in _BLANK_LINE_RE.split(text) if p.strip()]
     
     body_html = '\n'.join(f'    <p>{p}</p>' for p in paragraphs if p.strip())
     
@@ -3,12 +3,25 @@ from .media_io import (
     bundle_outputs_zip,
     collect_existing_output_files,
     detect_video_dimensions,
+    drop_page_cache,
     ensure_safe_input_filename,
     get_video_duration,
+    link_or_clone_file,
     sanitize_stem_for_fs,
 )
-from .srt_parser import parse_srt_file, validate_srt_file
-from .srt_time import format_time, normalize_digits, parse_to_sec
+from .srt_parser import parse_srt_content, parse_srt_file, validate_srt_file
+from .srt_writer import (
+    LiveSrtCheckpoint,
+    flush_live_checkpoint,
+    format_srt,
+    format_translated_srt,
+    live_checkpoint,
+    srt_headers,
+    write_srt_file,
+    write_srt_text,
+    write_translated_srt_file,
+)
+from .srt_time import format_time, normalize_digits, parse_to_sec, to_srt_precision
 
 __all__ = [
     "sanitize_stem_for_fs",
@@ -17,12 +30,25 @@ __all__ = [
     "bundle_outputs_zip",
     "detect_video_dimensions",
     "get_video_duration",
+    "link_or_clone_file",
+    "drop_page_cache",
     "parse_to_sec",
     "format_time",
+    "to_srt_precision",
     "normalize_digits",
     "to_persian_digits",
     "srt_duration_str",
     "format_total_seconds",
+    "parse_srt_content",
     "parse_srt_file",
     "validate_srt_file",
+    "format_srt",
+    "write_srt_file",
+    "write_srt_text",
+    "format_translated_srt",
+    "write_translated_srt_file",
+    "srt_headers",
+    "LiveSrtCheckpoint",
+    "live_checkpoint",
+    "flush_live_checkpoint",
 ]
@@ -1,10 +1,11 @@
 from typing import Dict, List
 
+_ASCII_TO_PERSIAN_DIGITS = str.maketrans("0123456789", "۰۱۲۳۴۵۶۷۸۹")
+
 
 def to_persian_digits(value) -> str:
     """Convert Arabic/Latin digits to Persian-Indic numerals (۰–۹)."""
-    arabic_to_persian = str.maketrans("0123456789", "۰۱۲۳۴۵۶۷۸۹")
-    return str(value).translate(arabic_to_persian)
+    return str(value).translate(_ASCII_TO_PERSIAN_DIGITS)
 
 
 def format_total_seconds(total_sec: float, lang: str = "fa") -> str:
@@ -1,6 +1,8 @@
 import os
 import re
+import shutil
 import subprocess
+import sys
 import unicodedata
 import zipfile
 from pathlib import Path
@@ -58,6 +60,88 @@ def ensure_safe_input_filename(file_path: str, logger=None) -> str:
     return candidate
 
 
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+
+def _clone_file(src: str, dst: str) -> bool:
+    """Copy-on-write clone (APFS clonefile / btrfs+xfs FICLONE); False if unsupported."""
+    try:
+        if sys.platform == "darwin":
+            import ctypes
+            import ctypes.util
+
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+        if sys.platform.startswith("linux"):
+            import fcntl
+
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return True
+    except (OSError, AttributeError):
+        pass
+    if os.path.exists(dst):
+        try:
+            os.remove(dst)
+        except OSError:
+            pass
+    return False
+
+
+def link_or_clone_file(src: str, dst: str) -> str:
+    """Expose src at dst as cheaply as possible; returns the method used.
+
+    Tries a symlink, a hard link, then a copy-on-write clone, and only then
+    falls back to a full byte copy.
+    """
+    src = os.path.abspath(src)
+    try:
+        os.symlink(src, dst)
+        return "symlink"
+    except OSError:
+        pass
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        pass
+    if _clone_file(src, dst):
+        return "clone"
+    shutil.copy(src, dst)
+    return "copy"
+
+
+def drop_page_cache(path: str, written: bool = False) -> bool:
+    """Tell the kernel the cached pages of a one-shot media file won't be reused.
+
+    Only POSIX_FADV_DONTNEED is worth issuing from here: it acts on the
+    shared page cache, whereas SEQUENTIAL only tunes readahead for the fd it
+    was issued on, and ffmpeg opens its own. DONTNEED skips dirty pages, so
+    for a freshly written file (written=True) the data is flushed with
+    fdatasync first. No-op where posix_fadvise is unavailable (macOS, Windows).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    flags = os.O_RDONLY | getattr(os, "O_NOATIME", 0)
+    try:
+        try:
+            fd = os.open(path, flags)
+        except PermissionError:
+            # O_NOATIME is refused on files we do not own.
+            fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        if written:
+            os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
 def collect_existing_output_files(result: Dict[str, Any]) -> List[str]:
     files: List[str] = []
 
@@ -1,28 +1,66 @@
 import os
 import re
+from collections import Counter
 from pathlib import Path
-from typing import Callable, Dict, List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 
 
-def parse_srt_file(srt_path: str) -> List[Dict]:
-    with open(srt_path, "r", encoding="utf-8-sig") as f:
-        content = f.read()
+_TIMESTAMP_RE = re.compile(r"\d{2}:\d{2}:\d{2},\d{3}")
+
+
+def _parse_srt_block(block: str) -> Optional[Dict]:
+    """Parse one blank-line-delimited SRT block, or return None if malformed."""
+    if " --> " not in block:
+        return None
+    lines = block.strip("\n").split("\n", 2)
+    if len(lines) < 2:
+        return None
+    index = lines[0].strip()
+    if not index.isdigit():
+        return None
+    start, _, end = lines[1].partition(" --> ")
+    start = start.strip()
+    end = end.strip()
+    if not (_TIMESTAMP_RE.fullmatch(start) and _TIMESTAMP_RE.fullmatch(end)):
+        return None
+    text = lines[2].strip().replace("\n", " ") if len(lines) > 2 else ""
+    return {"index": index, "start": start, "end": end, "text": text}
 
-    pattern = re.compile(
-        r"(\d+)\n(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})\n((?:(?!\n\n).)*)",
-        re.DOTALL,
-    )
 
+def _iter_srt_blocks(lines: Iterable[str]) -> Iterator[str]:
+    """Yield SRT blocks from a line iterator, holding at most one block in memory."""
+    buf: List[str] = []
+    for line in lines:
+        if line == "\n" or line == "":
+            if buf:
+                yield "".join(buf)
+                buf = []
+            continue
+        buf.append(line)
+    if buf:
+        yield "".join(buf)
+
+
+def parse_srt_content(content: str) -> List[Dict]:
+    """Parse SRT text by splitting on blank lines (no backtracking regex)."""
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
     entries: List[Dict] = []
-    for m in pattern.finditer(content):
-        entries.append(
-            {
-                "index": m.group(1),
-                "start": m.group(2),
-                "end": m.group(3),
-                "text": m.group(4).strip().replace("\n", " "),
-            }
-        )
+    for block in content.split("\n\n"):
+        entry = _parse_srt_block(block)
+        if entry is not None:
+            entries.append(entry)
+    return entries
+
+
+def parse_srt_file(srt_path: str) -> List[Dict]:
+    # Text mode uses universal newlines, so CRLF files arrive as "\n" lines.
+    entries: List[Dict] = []
+    with open(srt_path, "r", encoding="utf-8-sig") as f:
+        for block in _iter_srt_blocks(f):
+            entry = _parse_srt_block(block)
+            if entry is not None:
+                entries.append(entry)
     return entries
 
 
@@ -51,7 +89,7 @@ def validate_srt_file(
                 )
             return False
 
-        texts = [e["text"].strip() for e in entries if e["text"].strip()]
+        texts = [t for t in (e["text"].strip() for e in entries) if t]
         if not texts:
             return False
 
@@ -66,12 +104,7 @@ def validate_srt_file(
                 return False
 
         if len(texts) > 50:
-            counts = {}
-            for t in texts:
-                counts[t] = counts.get(t, 0) + 1
-
-            most_common_text = max(counts, key=counts.get)
-            max_repeat = counts[most_common_text]
+            most_common_text, max_repeat = Counter(texts).most_common(1)[0]
 
             if max_repeat > len(texts) * 0.05:
                 if logger is not None:
@@ -1,6 +1,3 @@
-from datetime import timedelta
-
-
 def parse_to_sec(t_str: str) -> float:
     """Convert SRT time format to seconds."""
     try:
@@ -11,18 +8,31 @@ def parse_to_sec(t_str: str) -> float:
         return 0.0
 
 
+def _total_ms(seconds: float) -> int:
+    # Round to microseconds first so float noise (0.9999999) does not lose a millisecond.
+    return max(0, round(float(seconds) * 1_000_000)) // 1000
+
+
 def format_time(seconds: float) -> str:
-    """Convert seconds into SRT time format."""
-    td = timedelta(seconds=float(seconds))
-    total_seconds = int(td.total_seconds())
+    """Convert seconds into SRT time format (milliseconds truncated)."""
+    total_seconds, milliseconds = divmod(_total_ms(seconds), 1000)
     hours, remainder = divmod(total_seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
-    milliseconds = int(td.microseconds / 1000)
     return f"{hours:02}:{minutes:02}:{seconds:02},{milliseconds:03}"
 
 
+def to_srt_precision(seconds: float) -> float:
+    """Equal to parse_to_sec(format_time(seconds)), without the string round-trip."""
+    whole_sec, ms = divmod(_total_ms(seconds), 1000)
+    return whole_sec + ms / 1000
+
+
+# Built once; normalize_digits runs on every line of every model response.
+_DIGITS_TO_ASCII = str.maketrans("۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩", "01234567890123456789")
+
+
 def normalize_digits(text: str) -> str:
     """Normalize Persian/Arabic-Indic digits to ASCII for robust parsing."""
     if not text:
         return text
-    return text.translate(str.maketrans("۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩", "01234567890123456789"))
+    return text.translate(_DIGITS_TO_ASCII)
@@ -0,0 +1,146 @@
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence
+
+
+def format_srt(entries: Iterable[Dict]) -> str:
+    """Render subtitle entries as a single SRT document (numbered from 1)."""
+    return "".join(
+        f"{i}\n{e['start']} --> {e['end']}\n{e['text']}\n\n" for i, e in enumerate(entries, 1)
+    )
+
+
+def srt_headers(entries: Iterable[Dict]) -> List[str]:
+    """Pre-format the "index + timing" header of every entry.
+
+    Headers only depend on the source timings, so callers that rewrite the
+    same file many times (per batch, per target language) build them once.
+    """
+    return [f"{i}\n{e['start']} --> {e['end']}\n" for i, e in enumerate(entries, 1)]
+
+
+def format_translated_srt(
+    entries: Sequence[Dict],
+    translated: Sequence[Optional[str]],
+    headers: Optional[Sequence[str]] = None,
+) -> str:
+    """Render source timings with translated texts; missing translations keep the source text."""
+    if headers is None:
+        headers = srt_headers(entries)
+    n = len(translated)
+    return "".join(
+        f"{h}{translated[i] if i < n and translated[i] is not None else e['text']}\n\n"
+        for i, (h, e) in enumerate(zip(headers, entries))
+    )
+
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def write_srt_text(srt_path: str, content: str) -> None:
+    """Write pre-rendered SRT text as UTF-8 with BOM (same bytes as utf-8-sig).
+
+    The body is encoded once and the BOM written as a literal prefix, so the
+    stateful utf-8-sig incremental encoder is never involved.
+    """
+    with open(srt_path, "wb") as f:
+        f.write(_UTF8_BOM)
+        f.write(content.encode("utf-8"))
+
+
+def write_srt_file(srt_path: str, entries: Iterable[Dict]) -> None:
+    """Write subtitle entries to disk with one buffered write (UTF-8 with BOM)."""
+    write_srt_text(srt_path, format_srt(entries))
+
+
+def write_translated_srt_file(
+    srt_path: str,
+    entries: Sequence[Dict],
+    translated: Sequence[Optional[str]],
+    headers: Optional[Sequence[str]] = None,
+) -> None:
+    """Write a translated SRT (see format_translated_srt) with one buffered write."""
+    write_srt_text(srt_path, format_translated_srt(entries, translated, headers))
+
+
+class LiveSrtCheckpoint:
+    """Live translation checkpoint for one output SRT, updated batch by batch.
+
+    Keeps one rendered block per entry, so update() only re-renders the
+    indices a batch touched. The file is rewritten once ``flush_every``
+    updates are pending or ``min_interval`` seconds have passed since the
+    last write (whichever comes first), and on flush(), via a sibling temp
+    file and os.replace, so a crash never leaves a half-written SRT. Safe
+    to share between threads.
+    """
+
+    def __init__(
+        self,
+        srt_path: str,
+        entries: Sequence[Dict],
+        translated: Optional[Sequence[Optional[str]]] = None,
+        flush_every: int = 5,
+        min_interval: float = 2.0,
+    ):
+        self.srt_path = srt_path
+        self.flush_every = max(1, flush_every)
+        self.min_interval = min_interval
+        self._headers = srt_headers(entries)
+        self._source = [e["text"] for e in entries]
+        self._blocks = [f"{h}{t}\n\n" for h, t in zip(self._headers, self._source)]
+        if translated:
+            self._render(range(len(translated)), translated)
+        self._pending = 0
+        self._last_write = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _render(self, indices: Iterable[int], translated: Sequence[Optional[str]]) -> None:
+        n = min(len(self._blocks), len(translated))
+        for i in indices:
+            if 0 <= i < n:
+                t = translated[i]
+                self._blocks[i] = f"{self._headers[i]}{t if t is not None else self._source[i]}\n\n"
+
+    def update(self, indices: Iterable[int], translated: Sequence[Optional[str]]) -> None:
+        """Take translated[i] for each index (source text when None); writes when due."""
+        with self._lock:
+            self._render(indices, translated)
+            self._pending += 1
+            if (self._pending >= self.flush_every
+                    or time.monotonic() - self._last_write >= self.min_interval):
+                self._write()
+
+    def flush(self) -> None:
+        """Write any updates not yet on disk."""
+        with self._lock:
+            if self._pending:
+                self._write()
+
+    def _write(self) -> None:
+        tmp_path = f"{self.srt_path}.tmp"
+        write_srt_text(tmp_path, "".join(self._blocks))
+        os.replace(tmp_path, self.srt_path)
+        self._pending = 0
+        self._last_write = time.monotonic()
+
+
+def live_checkpoint(
+    srt_path: Optional[str],
+    entries: Optional[Sequence[Dict]],
+    translated: Optional[Sequence[Optional[str]]] = None,
+) -> Optional[LiveSrtCheckpoint]:
+    """LiveSrtCheckpoint for srt_path, or None when there is no path or no entries."""
+    if not srt_path or not entries:
+        return None
+    return LiveSrtCheckpoint(srt_path, entries, translated)
+
+
+def flush_live_checkpoint(live: Optional[LiveSrtCheckpoint]) -> None:
+    """Write checkpointed batches not yet on disk (best effort; None is a no-op)."""
+    if live is None:
+        return
+    try:
+        live.flush()
+    except Exception:
+        pass
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Persistent mlx-whisper transcription worker.
+
+Reads one JSON job per stdin line, transcribes it with mlx-whisper (verbose
+segment lines go to stdout for progress tracking, preceded by an
+``AMIR_DURATION:<seconds>`` line once the audio is decoded), writes the word list to
+the job's result_json_path and prints a ``WORKER_DONE <ok|error>`` line.
+mlx-whisper keeps the last model loaded, so only the first job pays for the
+model load. Exits with os._exit on stdin EOF to hand all Metal memory back.
+"""
+
+import json
+import os
+import sys
+
+DONE_MARKER = "WORKER_DONE"
+DURATION_MARKER = "AMIR_DURATION:"
+
+
+def _transcribe(job: dict) -> None:
+    import mlx_whisper
+
+    kwargs = {
+        "path_or_hf_repo": job["repo"],
+        "word_timestamps": True,
+        "verbose": True,
+        "condition_on_previous_text": False,
+        "no_speech_threshold": 0.6,
+        "logprob_threshold": -1.0,
+        "compression_ratio_threshold": 2.4,
+        "temperature": (0.0, 0.2, 0.4, 0.6, 0.8),
+    }
+    if job.get("language"):
+        kwargs["language"] = job["language"]
+    # Decode once here so the parent learns the duration without its own ffprobe.
+    audio = job["video_path"]
+    try:
+        from mlx_whisper.audio import SAMPLE_RATE, load_audio
+
+        audio = load_audio(job["video_path"])
+        print(f"{DURATION_MARKER}{len(audio) / SAMPLE_RATE:.3f}", flush=True)
+    except Exception:
+        audio = job["video_path"]
+    result = mlx_whisper.transcribe(audio, **kwargs)
+
+    # Parallel arrays rather than a dict per word: smaller file, and the
+    # parent zips them straight into WordObj.
+    starts, ends, texts = [], [], []
+    for segment in result.get("segments", []):
+        for w in segment.get("words", []):
+            starts.append(w["start"])
+            ends.append(w["end"])
+            texts.append(w["word"])
+
+    payload = {"language": result.get("language", ""), "starts": starts, "ends": ends, "texts": texts}
+    with open(job["result_json_path"], "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+
+
+def main() -> None:
+    try:
+        import mlx.core as mx
+    except Exception:
+        mx = None
+    else:
+        try:
+            mx.set_cache_limit(1024 * 1024 * 512)
+        except Exception:
+            pass
+
+    while True:
+        raw = sys.stdin.readline()
+        if not raw:
+            break
+        raw = raw.strip()
+        if not raw:
+            continue
+
+        status = "ok"
+        try:
+            _transcribe(json.loads(raw))
+        except Exception as e:
+            print(f"WORKER_ERROR: {e}")
+            status = "error"
+
+        if mx is not None:
+            try:
+                mx.clear_cache()
+            except Exception:
+                pass
+        print(f"{DONE_MARKER} {status}", flush=True)
+
+    sys.stdout.flush()
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,7 +25,7 @@ class ProcessingStage(Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+@dataclass(slots=True)
 class StyleConfig:
     name: str
     font_name: str
@@ -44,14 +44,15 @@ class StyleConfig:
     secondary_font_size: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WordObj:
+    # One instance per transcribed word (10k+ per hour of audio): slots keep it compact.
     start: float
     end: float
     word: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingCheckpoint:
     video_path: str
     stage: ProcessingStage
@@ -10,6 +10,7 @@ This version includes:
 - All helper methods
 """
 
+import dataclasses
 import os
 import re
 import subprocess
@@ -27,9 +28,11 @@ import tempfile
 import shutil
 import threading
 import zipfile
-from datetime import timedelta
-from collections import deque
-from typing import List, Dict, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from collections import Counter, deque
+from typing import List, Dict, FrozenSet, Optional, Any, Tuple
 from pathlib import Path
 
 from subtitle.config import (
@@ -42,32 +45,47 @@ from subtitle.config import (
 )
 from subtitle.cache import (
     clear_checkpoint,
+    count_legacy_translations,
     create_balanced_batches,
     get_checkpoint_path,
+    legacy_local_cache_key,
+    load_json_bytes,
     load_local_translation_cache,
     load_checkpoint,
     local_cache_key,
     log_cost_savings,
     save_checkpoint,
-    lookup_local_cache,
+    lookup_transcript_cache,
+    lookup_translation_cache_db_many,
+    open_translation_cache_db,
     save_local_translation_cache,
     store_local_cache,
+    store_transcript_cache,
+    store_translation_cache_db,
+    take_legacy_translations,
+    transcript_cache_key,
 )
 from subtitle.concurrency import (
+    AIMDController,
+    RateLimiter,
     acquire_global_workflow_slot,
     acquire_workflow_lock,
     is_pid_alive,
+    queued_file_handler,
     release_global_workflow_slot,
     release_workflow_lock,
+    translate_request_rate,
 )
 from subtitle.io import (
     bundle_outputs_zip,
     collect_existing_output_files,
     detect_video_dimensions,
     ensure_safe_input_filename,
+    flush_live_checkpoint,
     format_total_seconds,
     format_time,
     get_video_duration,
+    live_checkpoint,
     normalize_digits,
     parse_to_sec,
     parse_srt_file,
@@ -75,22 +93,32 @@ from subtitle.io import (
     sanitize_stem_for_fs,
     to_persian_digits,
     validate_srt_file,
+    write_srt_file,
+    write_srt_text,
 )
 from subtitle.transcription import (
-    build_mlx_worker_script,
+    MLX_WORKER_DONE,
+    MLX_WORKER_DURATION,
     cleanup_paths,
+    cuda_device_count,
     ensure_whisper_server,
     flush_partial_entries,
+    get_mlx_worker,
+    iter_worker_output_lines,
     get_whisper_server_socket_path,
     is_whisper_server_ready,
     parse_verbose_segment_line,
     parse_whisper_progress_time,
     resolve_mlx_repo_path,
+    run_chunked_transcription,
+    transcribe_batch as run_transcribe_batch,
     whisper_server_enabled,
+    words_from_worker_payload,
 )
 from subtitle.translation import (
     apply_final_target_text_fixes,
     build_contextual_batch_text,
+    build_translation_prompt,
     filter_gemini_generation_models,
     parse_translated_batch_output,
     rank_gemini_model_name,
@@ -116,9 +144,12 @@ from subtitle.social import (
 )
 from subtitle.workflow import (
     detect_subtitle_geometry,
+    find_subtitle_fonts_dir,
+    find_up_to_date_render,
     migrate_legacy_resolution_srt,
     prepare_source_srt,
     prepare_runtime_execution,
+    render_options_signature,
     resolve_workflow_base,
     run_finalize_stage,
     run_rendering_stage,
@@ -135,7 +166,6 @@ from subtitle.segmentation import (
 )
 from subtitle.sanitization import (
     apply_semantic_splitting,
-    deduplicate_consecutive_entries,
     normalize_and_fix_timing,
     postprocess_orphans_and_collocations,
 )
@@ -151,7 +181,6 @@ from subtitle.models import (
     ProcessingCheckpoint,
     ProcessingStage,
     STYLE_PRESETS,
-    StyleConfig,
     SubtitleStyle,
     WordObj,
 )
@@ -187,18 +216,19 @@ except ImportError:
         os.path.expanduser('~/.env'),  # Home directory
     ]
     
-    for env_path in env_paths:
-        if os.path.exists(env_path):
-            try:
-                with open(env_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if '=' in line and not line.startswith('#'):
-                            key, value = line.split('=', 1)
-                            os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
-            except:
-                pass
-            break
+    # One KEY=value per line; comments and blank lines never match.
+    _ENV_LINE_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*["\']?(.*?)["\']?[ \t\r]*$', re.MULTILINE)
+
+    # Only the first existing file is read.
+    env_path = next((p for p in env_paths if os.path.exists(p)), None)
+    if env_path:
+        try:
+            with open(env_path, 'r') as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
+            content = ''
+        for key, value in _ENV_LINE_RE.findall(content):
+            os.environ.setdefault(key, value)
 
 try:
     import static_ffmpeg
@@ -217,6 +247,10 @@ try:
 except ImportError:
     HAS_PLATFORM = False
 
+# Host facts do not change while the process runs; resolve them once.
+IS_APPLE_SILICON = HAS_PLATFORM and platform_module.system() == "Darwin" and platform_module.machine() == "arm64"
+USE_MLX = HAS_MLX and IS_APPLE_SILICON
+
 # Non-heavy imports
 from tqdm import tqdm
 try:
@@ -250,6 +284,17 @@ except ImportError:
     def get_default_quality(): return 65
     def detect_best_hw_encoder(): return {'encoder': 'libx264', 'codec': 'h264', 'platform': 'cpu'}
 
+# Encoder probing shells out to ffmpeg; the answer cannot change within a run.
+detect_best_hw_encoder = lru_cache(maxsize=1)(detect_best_hw_encoder)
+
+# Patterns used per entry / per word; compiled once instead of via re's string cache.
+_WS_RE = re.compile(r'\s+')
+_SPACE_RE = re.compile(r'\s')
+_SENTENCE_END_SPACE_RE = re.compile(r'(?<=[.!?])\s')
+_HARD_BREAK_RE = re.compile(r'\\h+')
+_LANG_CODE_RE = re.compile(r"[a-z]{2,3}")
+_TEMP_PREFIX_RE = re.compile(r'^(temp_\d+_|safe_)')
+
 # ==================== MAIN PROCESSOR ====================
 
 class SubtitleProcessor:
@@ -327,7 +372,7 @@ class SubtitleProcessor:
         
         # FIX: Copy the preset to avoid modifying the global dictionary
         base_style = STYLE_PRESETS.get(style, STYLE_PRESETS[SubtitleStyle.LECTURE])
-        self.style_config = StyleConfig(**base_style.__dict__)
+        self.style_config = dataclasses.replace(base_style)
         self.original_font_size = self.style_config.font_size
         
         self.en_font_scale = 1.0
@@ -358,13 +403,11 @@ class SubtitleProcessor:
                 self.logger.warning(f"Could not load media.json subtitle styles: {e}")
             
         # Apply overrides from CLI arguments
-        self.style_config.max_lines = max_lines
-        if alignment is not None: self.style_config.alignment = alignment
-        if font_size is not None: self.style_config.font_size = font_size
-        if shadow is not None: self.style_config.shadow = shadow
-        if outline is not None: self.style_config.outline = outline
-        if back_color is not None: self.style_config.back_color = back_color
-        if primary_color is not None: self.style_config.primary_color = primary_color
+        cli_overrides = dict(alignment=alignment, font_size=font_size, shadow=shadow, outline=outline,
+                             back_color=back_color, primary_color=primary_color)
+        self.style_config = dataclasses.replace(
+            self.style_config, max_lines=max_lines, **{k: v for k, v in cli_overrides.items() if v is not None}
+        )
         
         # Finally, apply the english font scaling factor
         self.style_config.font_size = int(self.style_config.font_size * self.en_font_scale)
@@ -379,6 +422,8 @@ class SubtitleProcessor:
             else:
                 # If no secondary size defined, default to 75% of primary size, scaled
                 self.sec_font_size = int(self.style_config.font_size * 0.75 * self.fa_font_scale)
+        # Configured style, before detect_subtitle_geometry adapts style_config to a video in place.
+        self._configured_style = dataclasses.replace(self.style_config)
         
         self.fail_on_translation_error = fail_on_translation_error
         self.use_openai_fallback = use_openai_fallback
@@ -397,17 +442,27 @@ class SubtitleProcessor:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
         # === COST SAVING INFRASTRUCTURE ===
-        # Local hash cache: avoids API calls for already-translated sentences
-        self._local_cache_path = self.cache_dir / "translation_cache.json"
+        # Local hash cache: avoids API calls for already-translated sentences.
+        # Backed by a single SQLite file; _local_cache buffers unsaved writes
+        # (or holds the whole cache when falling back to the legacy JSON file).
+        self._local_cache_path = self.cache_dir / "translations.db"
+        self._legacy_cache_path = self.cache_dir / "translation_cache.json"
+        self._local_cache_db = None
         self._local_cache: Dict[str, str] = {}
         self._local_cache_dirty = False  # Track if we need to save
+        # MD5-keyed entries from before the blake2b switch are only looked up while some remain.
+        self._local_cache_has_legacy = False
+        # Target languages translate on worker threads; they share this cache.
+        self._local_cache_lock = threading.RLock()
         
         # Gemini explicit CachedContent: stores the system prompt server-side (reused per session)
         # key = target_lang, value = cache_name from Gemini API
         self._gemini_content_cache: Dict[str, str] = {}
+        self._gemini_cache_lock = threading.Lock()
         
-        # Cost tracking (accumulated per session)
-        self._cost_savings = {"local_cache_hits": 0, "deepseek_cache_hit_tokens": 0, "grok_cache_hit_tokens": 0, "gemini_cached_tokens": 0}
+        # Cost tracking (accumulated per session; batch threads update it via _add_cost_savings)
+        self._cost_savings = {"local_cache_hits": 0, "deepseek_cache_hit_tokens": 0, "grok_cache_hit_tokens": 0, "gemini_cached_tokens": 0, "litellm_cached_tokens": 0}
+        self._cost_savings_lock = threading.Lock()
         
         # Target words per subtitle line (adaptive: set by run_workflow based on video orientation)
         self.target_words_per_line = 7
@@ -420,12 +475,25 @@ class SubtitleProcessor:
                 self.max_concurrent_workflows = 0
         except Exception:
             self.max_concurrent_workflows = 0
+        # Translation batches in flight per target language (AMIR_TRANSLATE_CONCURRENCY, default 4).
+        try:
+            self.translate_concurrency = max(1, int(os.environ.get('AMIR_TRANSLATE_CONCURRENCY', '4')))
+        except ValueError:
+            self.translate_concurrency = 4
+        # Shrinks in-flight Gemini/LiteLLM calls below that on 429/5xx, grows back on success.
+        self.backpressure = AIMDController(c_max=self.translate_concurrency)
+        self.translate_limiter = RateLimiter(translate_request_rate())  # shared by all targets: AMIR_TRANSLATE_RPS is process-wide
         self.low_ram_mode = False
         self._disable_shared_whisper_server = False
         self._disable_mlx_fallback = False
         self._available_ram_gb: Optional[float] = None
         self._free_disk_gb: Optional[float] = None
         self._model = None
+        self._model_lock = threading.Lock()
+        self._deepseek_client = None
+        self._gemini_client = None
+        self._grok_client = None
+        self._client_lock = threading.Lock()
         self.logger = logger or self._setup_logger()
         self._check_disk_space()
         self._configure_resource_profile()
@@ -451,21 +519,20 @@ class SubtitleProcessor:
             logger.addHandler(console)
             
             log_file = self.cache_dir / "subtitle_processor.log"
-            file_h = logging.FileHandler(log_file)
-            file_h.setLevel(logging.DEBUG)
-            file_h.setFormatter(fmt)
-            logger.addHandler(file_h)
+            # File writes run on a listener thread so log calls in progress loops never block on disk.
+            logger.addHandler(queued_file_handler(log_file, fmt))
         
         return logger
 
     def _check_disk_space(self, min_gb: int = 10):
         try:
-            total, used, free = shutil.disk_usage(self.cache_dir)
-            free_gb = free // (2**30)
-            if free_gb < min_gb:
-                self.logger.warning(f"Resource threshold warning: available disk space is {free_gb}GB (minimum requirement: {min_gb}GB)")
-        except:
-            pass
+            free = shutil.disk_usage(self.cache_dir).free
+        except OSError:
+            return
+        self._free_disk_gb = free / (2 ** 30)
+        free_gb = free >> 30
+        if free_gb < min_gb:
+            self.logger.warning(f"Resource threshold warning: available disk space is {free_gb}GB (minimum requirement: {min_gb}GB)")
 
     @staticmethod
     def _get_available_ram_gb() -> Optional[float]:
@@ -510,12 +577,12 @@ class SubtitleProcessor:
     def _configure_resource_profile(self):
         """Enable low-RAM safety knobs automatically when the system is constrained."""
         self._available_ram_gb = self._get_available_ram_gb()
-        self._free_disk_gb = None
-        try:
-            total, used, free = shutil.disk_usage(self.cache_dir)
-            self._free_disk_gb = free / (2 ** 30)
-        except Exception:
-            pass
+        # _check_disk_space already sampled the cache volume during __init__.
+        if self._free_disk_gb is None:
+            try:
+                self._free_disk_gb = shutil.disk_usage(self.cache_dir).free / (2 ** 30)
+            except OSError:
+                pass
 
         mode_env = str(os.environ.get("AMIR_LOW_RAM_MODE", "")).strip().lower()
         forced_mode: Optional[bool]
@@ -806,45 +873,98 @@ class SubtitleProcessor:
 
         return words, detected_lang
 
+    # ==================== API CLIENTS ====================
+
+    @property
+    def deepseek_client(self):
+        """Lazily created DeepSeek client, reused so its HTTP connection pool stays warm."""
+        if self._deepseek_client is None:
+            if not HAS_OPENAI:
+                raise ImportError("OpenAI package required for DeepSeek translation. Please install with 'pip install openai'")
+            with self._client_lock:
+                if self._deepseek_client is None:
+                    self._deepseek_client = OpenAI(api_key=self.api_key, base_url="https://api.deepseek.com/v1")
+        return self._deepseek_client
+
+    @property
+    def gemini_client(self):
+        """Lazily created google-genai client, shared by all Gemini calls and batch threads."""
+        if self._gemini_client is None:
+            from google import genai
+            with self._client_lock:
+                if self._gemini_client is None:
+                    self._gemini_client = genai.Client(api_key=self.google_api_key)
+        return self._gemini_client
+
+    @property
+    def grok_client(self):
+        """Lazily created xAI (OpenAI-compatible) client for Grok."""
+        if self._grok_client is None:
+            if not HAS_OPENAI:
+                raise ImportError("OpenAI package required for Grok translation. Please install with 'pip install openai'")
+            with self._client_lock:
+                if self._grok_client is None:
+                    self._grok_client = OpenAI(api_key=self.grok_api_key, base_url="https://api.x.ai/v1")
+        return self._grok_client
+
     # ==================== MODEL MANAGEMENT ====================
 
     @property
     def model(self):
         """Lazy load Whisper model"""
         if self._model is None:
-            force_faster = os.environ.get("AMIR_FORCE_FASTER_WHISPER", "0") == "1"
-            if not force_faster and HAS_MLX and HAS_PLATFORM and platform_module.system() == "Darwin" and platform_module.machine() == "arm64":
-                self.logger.info(f"Utilizing MLX acceleration for {self.model_size}")
-                self._model = "MLX"
-                return self._model
-            
-            from faster_whisper import WhisperModel
-            self.logger.info(f"Loading Whisper neural model ({self.model_size})")
-            device = "cpu"
-            try:
-                import torch
-                if HAS_TORCH and torch.cuda.is_available():
-                    device = "cuda"
-            except:
-                pass
+            with self._model_lock:
+                if self._model is None:
+                    force_faster = os.environ.get("AMIR_FORCE_FASTER_WHISPER", "0") == "1"
+                    if not force_faster and USE_MLX:
+                        self.logger.info(f"Utilizing MLX acceleration for {self.model_size}")
+                        self._model = "MLX"
+                    else:
+                        self.logger.info(f"Loading Whisper neural model ({self.model_size})")
+                        self._model = self._load_whisper_model(low_ram=self.low_ram_mode)
 
-            if self.low_ram_mode:
-                try:
-                    self._model = WhisperModel(
-                        self.model_size,
-                        device=device,
-                        compute_type="int8",
-                        cpu_threads=1,
-                        num_workers=1,
-                    )
-                except TypeError:
-                    # Backward compatibility with older faster-whisper signatures.
-                    self._model = WhisperModel(self.model_size, device=device, compute_type="int8")
-            else:
-                self._model = WhisperModel(self.model_size, device=device, compute_type="int8")
-        
         return self._model
 
+    @staticmethod
+    def _whisper_device() -> str:
+        try:
+            import torch
+            if HAS_TORCH and torch.cuda.is_available():
+                return "cuda"
+        except Exception:
+            pass
+        return "cpu"
+
+    def _load_whisper_model(self, low_ram: bool = False, device: Optional[str] = None):
+        """Create a faster-whisper model for the best available device.
+
+        CUDA uses int8 weights with float16 compute (tensor cores); CPU keeps int8.
+        AMIR_WHISPER_COMPUTE_TYPE overrides the choice.
+        """
+        from faster_whisper import WhisperModel
+
+        device = device or self._whisper_device()
+        compute_type = (
+            os.environ.get("AMIR_WHISPER_COMPUTE_TYPE", "").strip()
+            or ("int8_float16" if device == "cuda" else "int8")
+        )
+        if low_ram:
+            try:
+                return WhisperModel(
+                    self.model_size,
+                    device=device,
+                    compute_type=compute_type,
+                    cpu_threads=1,
+                    num_workers=1,
+                )
+            except TypeError:
+                # Backward compatibility with older faster-whisper signatures.
+                pass
+        gpus = cuda_device_count() if device == "cuda" else 0
+        # One CTranslate2 replica per GPU so concurrent transcribe() calls (transcribe_batch) spread out.
+        multi_gpu = {"device_index": list(range(gpus)), "num_workers": gpus} if gpus > 1 else {}
+        return WhisperModel(self.model_size, device=device, compute_type=compute_type, **multi_gpu)
+
     def __enter__(self):
         return self
 
@@ -881,20 +1001,74 @@ class SubtitleProcessor:
         return local_cache_key(text, target_lang)
 
     def _load_local_translation_cache(self):
-        self._local_cache = load_local_translation_cache(self._local_cache_path, logger=self.logger)
+        self._local_cache_db = open_translation_cache_db(
+            self._local_cache_path, legacy_json_path=self._legacy_cache_path, logger=self.logger
+        )
+        if self._local_cache_db is None:
+            self._local_cache = load_local_translation_cache(self._legacy_cache_path, logger=self.logger)
+            self._local_cache_has_legacy = bool(self._local_cache)
+        else:
+            self._local_cache_has_legacy = count_legacy_translations(self._local_cache_db) > 0
 
     def _save_local_translation_cache(self):
-        if not self._local_cache_dirty:
-            return
-        if save_local_translation_cache(self._local_cache_path, self._local_cache, logger=self.logger):
-            self._local_cache_dirty = False
+        with self._local_cache_lock:
+            if not self._local_cache_dirty:
+                return
+            if self._local_cache_db is not None:
+                if store_translation_cache_db(self._local_cache_db, self._local_cache.items(), logger=self.logger):
+                    self._local_cache.clear()
+                    self._local_cache_dirty = False
+            elif save_local_translation_cache(self._legacy_cache_path, self._local_cache, logger=self.logger):
+                self._local_cache_dirty = False
 
     def _lookup_local_cache(self, text: str, target_lang: str) -> Optional[str]:
-        return lookup_local_cache(self._local_cache, text, target_lang)
+        return self._lookup_local_cache_many([text], target_lang).get(text)
+
+    def _lookup_local_cache_many(self, texts: List[str], target_lang: str) -> Dict[str, str]:
+        """Batch cache lookup. Returns {text: translation} for every cached text."""
+        hits = self._lookup_local_cache_keys({text: local_cache_key(text, target_lang) for text in texts})
+        misses = [text for text in texts if text not in hits]
+        if misses and self._local_cache_has_legacy:
+            hits.update(self._take_legacy_local_cache(misses, target_lang))
+        return hits
+
+    def _take_legacy_local_cache(self, texts: List[str], target_lang: str) -> Dict[str, str]:
+        """Look texts up under their pre-blake2b MD5 keys and re-key the hits."""
+        keys = {text: local_cache_key(text, target_lang) for text in texts}
+        with self._local_cache_lock:
+            if self._local_cache_db is None:
+                # JSON fallback: plain dict lookups; re-keyed on the next save.
+                found = {}
+                for text in texts:
+                    translation = self._local_cache.get(legacy_local_cache_key(text, target_lang))
+                    if translation and store_local_cache(self._local_cache, text, target_lang, translation):
+                        self._local_cache_dirty = True
+                        found[text] = translation
+                return found
+            # Also map new keys: a database unmarked before the migration may hold both kinds.
+            rekey = {legacy_local_cache_key(text, target_lang): key for text, key in keys.items()}
+            rekey.update({key: key for key in keys.values()})
+            moved, remaining = take_legacy_translations(self._local_cache_db, rekey, logger=self.logger)
+            if not remaining:
+                self._local_cache_has_legacy = False
+        return {text: moved[key] for text, key in keys.items() if key in moved}
+
+    def _lookup_local_cache_keys(self, keys: Dict[str, str]) -> Dict[str, str]:
+        found: Dict[str, str] = {}
+        with self._local_cache_lock:
+            if self._local_cache_db is not None:
+                found = lookup_translation_cache_db_many(self._local_cache_db, list(keys.values()))
+            if self._local_cache:
+                for key in keys.values():
+                    pending = self._local_cache.get(key)
+                    if pending:
+                        found[key] = pending
+        return {text: found[key] for text, key in keys.items() if found.get(key)}
 
     def _store_local_cache(self, text: str, target_lang: str, translation: str):
-        if store_local_cache(self._local_cache, text, target_lang, translation):
-            self._local_cache_dirty = True
+        with self._local_cache_lock:
+            if store_local_cache(self._local_cache, text, target_lang, translation):
+                self._local_cache_dirty = True
 
     def _get_gemini_content_cache(self, target_lang: str) -> Optional[str]:
         """
@@ -907,14 +1081,18 @@ class SubtitleProcessor:
         if not HAS_GEMINI or not self.google_api_key:
             return None
         
+        # One CachedContent per language: concurrent batches must not each create (and pay for) one
+        with self._gemini_cache_lock:
+            return self._get_gemini_content_cache_locked(target_lang)
+
+    def _get_gemini_content_cache_locked(self, target_lang: str) -> Optional[str]:
         # Return existing cache for this session
         if target_lang in self._gemini_content_cache:
             return self._gemini_content_cache[target_lang]
         
         try:
-            from google import genai
             from google.genai import types as genai_types
-            client = genai.Client(api_key=self.google_api_key)
+            client = self.gemini_client
             
             system_instruction = self.get_translation_prompt(target_lang)
             model = self.llm_models["gemini"]
@@ -935,6 +1113,10 @@ class SubtitleProcessor:
             self.logger.debug(f"Gemini explicit cache unavailable (falling back to implicit): {e}")
             return None
 
+    def _add_cost_savings(self, key: str, amount: int) -> None:
+        with self._cost_savings_lock:
+            self._cost_savings[key] = self._cost_savings.get(key, 0) + amount
+
     def _log_cost_savings(self):
         log_cost_savings(self._cost_savings, self.logger)
 
@@ -961,7 +1143,7 @@ class SubtitleProcessor:
                 pass
 
             detected = str(getattr(info, "language", "") or "").strip().lower()
-            if re.fullmatch(r"[a-z]{2,3}", detected):
+            if _LANG_CODE_RE.fullmatch(detected):
                 self.logger.info(f"🌐 Auto-detected source language: {detected}")
                 return detected
         except Exception as e:
@@ -977,25 +1159,73 @@ class SubtitleProcessor:
         language: str = 'auto',
         correct: bool = False,
         detect_speakers: bool = False,
-        dur: float = 0
+        dur: float = 0,
+        keep_model: bool = False
     ) -> str:
-        """Main transcription gate"""
+        """Main transcription gate.
+
+        keep_model=True leaves the shared Whisper model loaded (transcribe_batch
+        unloads it once after the whole batch).
+        """
         _lang = (language or 'auto').strip().lower()
         force_faster = os.environ.get("AMIR_FORCE_FASTER_WHISPER", "0") == "1"
-        if (not force_faster) and HAS_MLX and HAS_PLATFORM and platform_module.system() == "Darwin" and platform_module.machine() == "arm64":
+        base = os.path.splitext(video_path)[0]
+        use_mlx = (not force_faster) and USE_MLX
+        cache_key = self._transcript_cache_key(video_path, _lang, correct, detect_speakers, "mlx" if use_mlx else "faster")
+        cached = None
+        if cache_key:
+            with self._local_cache_lock:
+                cached = lookup_transcript_cache(self._local_cache_db, cache_key)
+        if cached:
+            srt_path = f"{base}_{cached[0]}.srt"
+            write_srt_text(srt_path, cached[1])
+            self.logger.info(f"♻️ Reusing cached transcription: {Path(srt_path).name}")
+            return srt_path
+
+        srt_path = None
+        if use_mlx:
             try:
-                return self.transcribe_video_mlx(video_path, _lang, correct, detect_speakers, dur_override=dur)
+                srt_path = self.transcribe_video_mlx(video_path, _lang, correct, detect_speakers, dur_override=dur, keep_model=keep_model)
             except Exception as e:
                 self.logger.warning(f"⚠️ MLX transcription failed, falling back to Whisper: {e}")
         elif force_faster:
             self.logger.info("🧠 Low-RAM mode: forcing faster-whisper path (MLX disabled for this run).")
-        return self.transcribe_video_whisper(video_path, _lang, correct, detect_speakers)
+        if srt_path is None:
+            srt_path = self.transcribe_video_whisper(video_path, _lang, correct, detect_speakers)
+            if use_mlx and cache_key:
+                # Store under the engine that actually produced the SRT.
+                cache_key = self._transcript_cache_key(video_path, _lang, correct, detect_speakers, "faster")
+
+        if cache_key and srt_path and srt_path.startswith(base + "_") and srt_path.endswith(".srt"):
+            try:
+                with open(srt_path, "r", encoding="utf-8-sig") as f:
+                    srt_text = f.read()
+                with self._local_cache_lock:
+                    store_transcript_cache(self._local_cache_db, cache_key, srt_path[len(base) + 1:-4], srt_text, logger=self.logger)
+            except OSError:
+                pass
+        return srt_path
+
+    def _transcript_cache_key(self, video_path: str, lang: str, correct: bool, detect_speakers: bool, engine: str) -> Optional[str]:
+        """Cross-session transcript cache key, or None when the cache is off (AMIR_TRANSCRIPT_CACHE=0)."""
+        if self._local_cache_db is None or os.environ.get("AMIR_TRANSCRIPT_CACHE", "1").strip() == "0":
+            return None
+        # Everything that changes the SRT: engine + decoding settings + segmentation limits.
+        return transcript_cache_key(
+            video_path, engine, self.model_size, lang, self.multilingual,
+            correct, detect_speakers, self.initial_prompt, self.temperature, self.use_vad, self.whisper_timing,
+            getattr(self.style_config, 'max_chars', 42), getattr(self.style_config, 'max_lines', 2),
+            getattr(self, 'is_vertical_video', None), self.low_ram_mode, repr(get_segmentation_config().config),
+        )
+
+    def transcribe_batch(self, video_paths: List[str], language: str = 'auto', max_workers: Optional[int] = None) -> Dict[str, Optional[str]]:
+        """Transcribe several files; one concurrent job per CUDA device by default."""
+        return run_transcribe_batch(self, video_paths, language=language, max_workers=max_workers)
 
     def _run_faster_whisper_slice(self, video_path: str, max_duration: int = 60) -> Tuple[List[WordObj], str]:
         """Extracts the first N seconds using FFmpeg and transcribes with Faster-Whisper + VAD to fix MLX hallucination bugs."""
         import subprocess
         import tempfile
-        from faster_whisper import WhisperModel
         
         # 1. Extract audio slice
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
@@ -1011,27 +1241,7 @@ class SubtitleProcessor:
             subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
             
             # 2. Transcribe slice
-            device = "cpu"
-            try:
-                import torch
-                if HAS_TORCH and torch.cuda.is_available():
-                    device = "cuda"
-            except Exception:
-                pass
-                
-            if self.low_ram_mode:
-                try:
-                    model = WhisperModel(
-                        self.model_size,
-                        device=device,
-                        compute_type="int8",
-                        cpu_threads=1,
-                        num_workers=1,
-                    )
-                except TypeError:
-                    model = WhisperModel(self.model_size, device=device, compute_type="int8")
-            else:
-                model = WhisperModel(self.model_size, device=device, compute_type="int8")
+            model = self._load_whisper_model(low_ram=self.low_ram_mode)
             segments, info = model.transcribe(
                 slice_path,
                 word_timestamps=True,
@@ -1074,7 +1284,7 @@ class SubtitleProcessor:
         """
         return all_words
 
-    def _run_faster_whisper_full(self, video_path: str, language: str = '', force_chunked: bool = False) -> Tuple[List[WordObj], str]:
+    def _run_faster_whisper_full(self, video_path: str, language: str = '', force_chunked: bool = False, use_vad: Optional[bool] = None) -> Tuple[List[WordObj], str]:
         """Full-video transcription using faster-whisper + VAD.
 
         This is the production-grade, hallucination-free transcription path.
@@ -1083,10 +1293,9 @@ class SubtitleProcessor:
         - Falls back gracefully to an empty list on error (caller handles fallback).
         - force_chunked=True skips the shared server (which locks a single language for the
           full video) and uses per-chunk language auto-detection for multilingual content.
+        - use_vad overrides self.use_vad for this call only (the shared processor is left untouched).
         """
-        import tempfile
-        from faster_whisper import WhisperModel
-
+        use_vad = self.use_vad if use_vad is None else use_vad
         _lang = (language or 'auto').strip().lower()
         _lang_for_engine = None if _lang in ('auto', 'detect', '') else _lang
         low_ram = bool(getattr(self, 'low_ram_mode', False))
@@ -1106,7 +1315,7 @@ class SubtitleProcessor:
                 server_words, server_lang = self._transcribe_via_server(
                     video_path,
                     language=_lang_for_engine or '',
-                    use_vad=self.use_vad,
+                    use_vad=use_vad,
                     min_silence_duration_ms=700,
                     speech_pad_ms=400,
                 )
@@ -1130,28 +1339,8 @@ class SubtitleProcessor:
         self.logger.info(f"🔬 Full-video faster-whisper VAD pass ({total_dur:.0f}s)...")
 
         # Load model once
-        device = "cpu"
         try:
-            import torch
-            if HAS_TORCH and torch.cuda.is_available():
-                device = "cuda"
-        except Exception:
-            pass
-        
-        try:
-            if low_ram:
-                try:
-                    model = WhisperModel(
-                        self.model_size,
-                        device=device,
-                        compute_type="int8",
-                        cpu_threads=1,
-                        num_workers=1,
-                    )
-                except TypeError:
-                    model = WhisperModel(self.model_size, device=device, compute_type="int8")
-            else:
-                model = WhisperModel(self.model_size, device=device, compute_type="int8")
+            model = self._load_whisper_model(low_ram=low_ram)
         except Exception as e:
             self.logger.warning(f"⚠️ faster-whisper model load failed: {e}. Falling back to MLX.")
             return [], ''
@@ -1170,103 +1359,12 @@ class SubtitleProcessor:
         else:
             CHUNK = 600
             OVERLAP = 5
-        all_words: List[WordObj] = []
-        detected_lang = ''
-        seen_ends: set = set()
-
-        start = 0.0
-        chunk_idx = 0
-        tmp_wav = None
         try:
-            while True:
-                end = min(start + CHUNK, total_dur) if total_dur > 0 else start + CHUNK
-                duration = end - start
-
-                # Extract audio chunk
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                    tmp_wav = f.name
-
-                cmd = [
-                    'ffmpeg', '-y', '-i', video_path,
-                    '-ss', str(start), '-t', str(duration + OVERLAP),
-                    '-q:a', '0', '-vn', '-f', 'wav', tmp_wav
-                ]
-                subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
-
-                kw = dict(
-                    word_timestamps=True,
-                    initial_prompt=self.initial_prompt or "Clear punctuation and case sensitivity.",
-                    temperature=self.temperature,
-                    vad_filter=self.use_vad,
-                    vad_parameters=dict(min_silence_duration_ms=700, speech_pad_ms=400),
-                )
-                if _lang_for_engine:
-                    kw['language'] = _lang_for_engine
-                
-                segments, info = model.transcribe(tmp_wav, **kw)
-
-                if chunk_idx == 0 and not detected_lang:
-                    detected_lang = str(getattr(info, 'language', '') or '').strip().lower()
-
-                chunk_words = 0
-                for seg in segments:
-                    if not seg.words:
-                        continue
-                    for w in seg.words:
-                        abs_start = w.start + start
-                        abs_end = w.end + start
-                        # De-duplicate words from overlap window
-                        key = round(abs_end, 2)
-                        if key in seen_ends:
-                            continue
-                        seen_ends.add(key)
-                        all_words.append(WordObj(abs_start, abs_end, w.word))
-                        chunk_words += 1
-
-                # Per-chunk word-loop detection: if the same word appears
-                # >=4 times consecutively in this chunk's output, truncate.
-                if chunk_words > 4:
-                    deduped_words: List[WordObj] = []
-                    run_count = 1
-                    for wi in range(len(all_words) - chunk_words, len(all_words)):
-                        wobj = all_words[wi]
-                        if deduped_words and wobj.word.strip().lower() == deduped_words[-1].word.strip().lower():
-                            run_count += 1
-                        else:
-                            run_count = 1
-                        if run_count <= 3:
-                            deduped_words.append(wobj)
-                    # Replace chunk portion with deduped version
-                    kept_before = all_words[:len(all_words) - chunk_words]
-                    all_words = kept_before + deduped_words
-                    if len(deduped_words) < chunk_words:
-                        removed = chunk_words - len(deduped_words)
-                        self.logger.warning(f"⚠️ Removed {removed} looped words in chunk {chunk_idx+1}")
-                        chunk_words = len(deduped_words)
-
-                pct = int((end / total_dur) * 100) if total_dur > 0 else 0
-                self.logger.info(f"PROGRESS:{5 + int(pct * 0.44)}:🎙️ VAD Transcription ({pct}%)")
-                self.logger.info(f"  ✅ Chunk {chunk_idx+1}: +{chunk_words} words (total {len(all_words)})")
-
-                os.remove(tmp_wav)
-                tmp_wav = None
-
-                if low_ram:
-                    gc.collect()
-
-                chunk_idx += 1
-                if total_dur > 0 and start + CHUNK >= total_dur:
-                    break
-                start += CHUNK
-                if total_dur <= 0 and chunk_words == 0:
-                    # No more audio
-                    break
-
+            all_words, detected_lang = run_chunked_transcription(
+                self, model, video_path, total_dur, CHUNK, OVERLAP, _lang_for_engine, low_ram=low_ram, use_vad=use_vad
+            )
         except Exception as e:
             self.logger.warning(f"⚠️ faster-whisper full-video pass error: {e}. Falling back to MLX.")
-            if tmp_wav and os.path.exists(tmp_wav):
-                try: os.remove(tmp_wav)
-                except: pass
             return [], ''
 
         self.logger.info(f"✅ Full-video VAD transcription complete: {len(all_words)} words, lang={detected_lang or 'auto'}")
@@ -1282,8 +1380,6 @@ class SubtitleProcessor:
         detect_speakers: bool = False
     ) -> str:
         """Transcribe video with Whisper (Standard Torch)"""
-        from faster_whisper import WhisperModel
-
         _lang = (language or 'auto').strip().lower()
         _lang_for_engine = None if _lang in ('auto', 'detect', '') else _lang
         _multilingual = getattr(self, 'multilingual', False)
@@ -1297,15 +1393,13 @@ class SubtitleProcessor:
                 force_chunked=_multilingual,
             )
             if all_words:
-                out_lang = _lang if _lang_for_engine else (detected_lang if re.fullmatch(r"[a-z]{2,3}", detected_lang) else 'en')
+                out_lang = _lang if _lang_for_engine else (detected_lang if _LANG_CODE_RE.fullmatch(detected_lang) else 'en')
                 if _lang_for_engine is None and out_lang:
                     self.logger.info(f"🌐 Whisper detected source language: {out_lang}")
 
                 entries = self.resegment_to_sentences(all_words, None)
                 srt_path = os.path.splitext(video_path)[0] + f"_{out_lang}.srt"
-                with open(srt_path, 'w', encoding='utf-8-sig') as f:
-                    for i, entry in enumerate(entries, 1):
-                        f.write(f"{i}\n{entry['start']} --> {entry['end']}\n{entry['text']}\n\n")
+                write_srt_file(srt_path, entries)
 
                 self.logger.info(f"Asset preservation complete: {Path(srt_path).name}")
                 return srt_path
@@ -1322,15 +1416,13 @@ class SubtitleProcessor:
                     speech_pad_ms=400,
                 )
                 if all_words:
-                    out_lang = _lang if _lang_for_engine else (detected_lang if re.fullmatch(r"[a-z]{2,3}", detected_lang) else 'en')
+                    out_lang = _lang if _lang_for_engine else (detected_lang if _LANG_CODE_RE.fullmatch(detected_lang) else 'en')
                     if _lang_for_engine is None and out_lang:
                         self.logger.info(f"🌐 Whisper detected source language: {out_lang}")
 
                     entries = self.resegment_to_sentences(all_words, None)
                     srt_path = os.path.splitext(video_path)[0] + f"_{out_lang}.srt"
-                    with open(srt_path, 'w', encoding='utf-8-sig') as f:
-                        for i, entry in enumerate(entries, 1):
-                            f.write(f"{i}\n{entry['start']} --> {entry['end']}\n{entry['text']}\n\n")
+                    write_srt_file(srt_path, entries)
 
                     self.logger.info(f"Asset preservation complete: {Path(srt_path).name}")
                     return srt_path
@@ -1343,28 +1435,30 @@ class SubtitleProcessor:
                 force_chunked=True,
             )
             if all_words:
-                out_lang = _lang if _lang_for_engine else (detected_lang if re.fullmatch(r"[a-z]{2,3}", detected_lang) else 'en')
+                out_lang = _lang if _lang_for_engine else (detected_lang if _LANG_CODE_RE.fullmatch(detected_lang) else 'en')
                 entries = self.resegment_to_sentences(all_words, None)
                 srt_path = os.path.splitext(video_path)[0] + f"_{out_lang}.srt"
-                with open(srt_path, 'w', encoding='utf-8-sig') as f:
-                    for i, entry in enumerate(entries, 1):
-                        f.write(f"{i}\n{entry['start']} --> {entry['end']}\n{entry['text']}\n\n")
+                write_srt_file(srt_path, entries)
                 self.logger.info(f"Asset preservation complete: {Path(srt_path).name}")
                 return srt_path
         
         model = self.model
         if not hasattr(model, "transcribe"):
             # On Apple Silicon, self.model can be a sentinel string when MLX path is preferred.
-            device = "cpu"
+            model = self._load_whisper_model()
+
+        transcribe_fn = model.transcribe
+        batch_kwargs = {}
+        if self._whisper_device() == "cuda":
+            # faster-whisper >= 1.1 can decode VAD chunks in parallel batches on GPU.
             try:
-                import torch
-                if HAS_TORCH and torch.cuda.is_available():
-                    device = "cuda"
-            except Exception:
-                pass
-            model = WhisperModel(self.model_size, device=device, compute_type="int8")
+                from faster_whisper import BatchedInferencePipeline
+                transcribe_fn = BatchedInferencePipeline(model=model).transcribe
+                batch_kwargs["batch_size"] = int(os.environ.get("AMIR_WHISPER_BATCH_SIZE", "16") or 16)
+            except (ImportError, ValueError):
+                transcribe_fn = model.transcribe
 
-        segments, info = model.transcribe(
+        segments, info = transcribe_fn(
             video_path,
             language=_lang_for_engine,
             word_timestamps=True,
@@ -1372,42 +1466,43 @@ class SubtitleProcessor:
             temperature=self.temperature,
             vad_filter=True,
             vad_parameters=dict(min_silence_duration_ms=700, speech_pad_ms=400),
+            **batch_kwargs,
         )
 
         detected_lang = str(getattr(info, 'language', '') or '').strip().lower()
-        out_lang = _lang if _lang_for_engine else (detected_lang if re.fullmatch(r"[a-z]{2,3}", detected_lang) else 'en')
+        out_lang = _lang if _lang_for_engine else (detected_lang if _LANG_CODE_RE.fullmatch(detected_lang) else 'en')
         if _lang_for_engine is None and out_lang:
             self.logger.info(f"🌐 Whisper detected source language: {out_lang}")
         
         all_words = []
-        pbar = tqdm(total=int(info.duration), unit="s", desc="  Processing")
+        # Whisper decoding dominates; coalesce redraws instead of refreshing per segment.
+        total = int(info.duration)
+        pbar = tqdm(total=total, unit="s", desc="  Processing", mininterval=1.0, maxinterval=5.0)
         
         last_end = 0
+        extend = all_words.extend
         for segment in segments:
-            diff = int(segment.end) - last_end
-            if diff > 0:
-                pbar.update(diff)
-                last_end = int(segment.end)
-            
-            if segment.words:
-                all_words.extend(segment.words)
+            # Whole seconds only: most segments end within the same second and skip tqdm.
+            seg_end = int(segment.end)
+            if seg_end > last_end:
+                pbar.update(seg_end - last_end)
+                last_end = seg_end
+            extend(segment.words or ())
         
-        if last_end < int(info.duration):
-            pbar.update(int(info.duration) - last_end)
+        if last_end < total:
+            pbar.update(total - last_end)
         
         pbar.close()
         
         entries = self.resegment_to_sentences(all_words, None)
         
         srt_path = os.path.splitext(video_path)[0] + f"_{out_lang}.srt"
-        with open(srt_path, 'w', encoding='utf-8-sig') as f:
-            for i, entry in enumerate(entries, 1):
-                f.write(f"{i}\n{entry['start']} --> {entry['end']}\n{entry['text']}\n\n")
+        write_srt_file(srt_path, entries)
         
         self.logger.info(f"Asset preservation complete: {Path(srt_path).name}")
         return srt_path
 
-    def transcribe_video_mlx(self, video_path: str, language: str, correct: bool, detect_speakers: bool, dur_override: float = 0) -> str:
+    def transcribe_video_mlx(self, video_path: str, language: str, correct: bool, detect_speakers: bool, dur_override: float = 0, keep_model: bool = False) -> str:
         """Transcription: faster-whisper + VAD for hallucination-free output (primary path),
         with MLX subprocess as fallback for speed on Apple Silicon."""
         _lang = (language or 'auto').strip().lower()
@@ -1438,12 +1533,7 @@ class SubtitleProcessor:
             self.logger.warning(
                 "⚠️ Low-RAM mode: MLX fallback is disabled; retrying chunked faster-whisper without VAD."
             )
-            _orig_vad = self.use_vad
-            try:
-                self.use_vad = False
-                retry_words, retry_lang = self._run_faster_whisper_full(video_path, language=_lang_for_worker)
-            finally:
-                self.use_vad = _orig_vad
+            retry_words, retry_lang = self._run_faster_whisper_full(video_path, language=_lang_for_worker, use_vad=False)
 
             if retry_words:
                 all_words = retry_words
@@ -1458,43 +1548,22 @@ class SubtitleProcessor:
             with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
                 result_json_path = f.name
             
-            # 2. Create the worker script
+            # 2. Hand the job to the persistent MLX worker (model stays loaded across videos)
             repo_path = resolve_mlx_repo_path(self.model_size)
-            worker_script = build_mlx_worker_script(
-                repo_path=repo_path,
-                language=_lang_for_worker,
-                video_path=video_path,
-                result_json_path=result_json_path,
-            )
-            with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as f:
-                worker_path = f.name
-                f.write(worker_script.encode('utf-8'))
-                
+            worker = get_mlx_worker()
+            job_status = None
+
             try:
                 # 3. Run the worker with streaming output
-                # Get video duration for progress bar
+                # Without a known duration the worker reports one (AMIR_DURATION line) once it has decoded the audio.
                 dur = dur_override or 0
-                if dur <= 0:
-                    try:
-                        dur_cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-                                   '-of', 'default=noprint_wrappers=1:nokey=1', video_path]
-                        res = subprocess.run(dur_cmd, capture_output=True, text=True)
-                        output = res.stdout.strip()
-                        if output:
-                            dur = float(output)
-                    except:
-                        pass
-                
+                proc = worker.submit({"repo": repo_path, "language": _lang_for_worker,
+                                      "video_path": video_path, "result_json_path": result_json_path})
                 if dur > 0:
                     self.logger.info(f"📊 Tracking progress over {dur:.1f}s duration.")
-                else:
-                    self.logger.warning("⚠️ Could not detect duration; progress bar will be limited.")
-
-                cmd = ["python3", "-u", worker_path]
-                # Use Popen to stream stdout/stderr
-                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1)
                 
-                pbar = tqdm(total=100, unit="%", desc=f"  Transcribing ({(_lang_for_worker or 'AUTO').upper()})")
+                # Verbose workers emit far more lines than a terminal can show; tqdm throttles the redraws.
+                pbar = tqdm(total=100, unit="%", desc=f"  Transcribing ({(_lang_for_worker or 'AUTO').upper()})", mininterval=0.3)
 
                 # --- Incremental checkpoint setup ---
                 partial_srt_path = os.path.splitext(video_path)[0] + f"_{_lang_for_worker or 'auto'}.partial.srt"
@@ -1502,51 +1571,59 @@ class SubtitleProcessor:
 
                 _last_emitted_pct = [4]  # Start below 5 so first emission fires at 5%
                 stdout_tail = []
-                while True:
-                    line = proc.stdout.readline()
-                    if not line and proc.poll() is not None:
+                stderr_tail = []
+                last_pct = 0
+                for line in iter_worker_output_lines(proc, stderr_tail):
+                    if line.startswith(MLX_WORKER_DONE):
+                        job_status = line[len(MLX_WORKER_DONE):].strip()
                         break
-                    
-                    if line:
-                        stdout_tail.append(line.strip())
-                        if len(stdout_tail) > 80:
-                            stdout_tail = stdout_tail[-80:]
-                        # Log errors from worker if any
-                        if "WORKER_ERROR" in line:
-                            self.logger.error(f"  {line.strip()}")
-
-                        # Incremental checkpoint: save every 20 parsed segments
-                        seg = parse_verbose_segment_line(line)
-                        if seg:
-                            partial_entries.append(seg)
-                            if len(partial_entries) % 20 == 0:
-                                try:
-                                    flush_partial_entries(partial_entries, partial_srt_path)
-                                except Exception:
-                                    pass
-                            
-                        curr_time = parse_whisper_progress_time(line)
-                        if curr_time and dur > 0:
-                            pct = min(100, (curr_time / dur) * 100)
-                            pbar.n = int(pct)
-                            pbar.refresh()
-                            # Map 0-100% transcription → PROGRESS 5-50% (leaves headroom for translation)
-                            _trans_pct = max(5, min(50, int(5 + pct * 0.45)))
-                            if _trans_pct - _last_emitted_pct[0] >= 5:
-                                self.logger.info(f"PROGRESS:{_trans_pct}:🎙️ Transcription ({int(pct)}%)")
-                                _last_emitted_pct[0] = _trans_pct
-                
-                proc.wait()
-                pbar.n = 100
-                pbar.refresh()
+                    if line.startswith(MLX_WORKER_DURATION):
+                        if dur <= 0:
+                            try:
+                                dur = float(line[len(MLX_WORKER_DURATION):])
+                                self.logger.info(f"📊 Tracking progress over {dur:.1f}s duration.")
+                            except ValueError:
+                                pass
+                        continue
+                    stdout_tail.append(line.strip())
+                    if len(stdout_tail) > 80:
+                        stdout_tail = stdout_tail[-80:]
+                    # Log errors from worker if any
+                    if "WORKER_ERROR" in line:
+                        self.logger.error(f"  {line.strip()}")
+
+                    # Incremental checkpoint: save every 20 parsed segments
+                    seg = parse_verbose_segment_line(line)
+                    if seg:
+                        partial_entries.append(seg)
+                        if len(partial_entries) % 20 == 0:
+                            try:
+                                flush_partial_entries(partial_entries, partial_srt_path)
+                            except Exception:
+                                pass
+
+                    curr_time = parse_whisper_progress_time(line)
+                    if curr_time and dur > 0:
+                        pct = min(100, (curr_time / dur) * 100)
+                        if int(pct) > last_pct:
+                            pbar.update(int(pct) - last_pct)
+                            last_pct = int(pct)
+                        # Map 0-100% transcription → PROGRESS 5-50% (leaves headroom for translation)
+                        _trans_pct = max(5, min(50, int(5 + pct * 0.45)))
+                        if _trans_pct - _last_emitted_pct[0] >= 5:
+                            self.logger.info(f"PROGRESS:{_trans_pct}:🎙️ Transcription ({int(pct)}%)")
+                            _last_emitted_pct[0] = _trans_pct
+
+                if last_pct < 100:
+                    pbar.update(100 - last_pct)
                 pbar.close()
                 try:
                     flush_partial_entries(partial_entries, partial_srt_path)
                 except Exception:
                     pass
                 
-                if proc.returncode != 0:
-                    stderr = proc.stderr.read()
+                if job_status != "ok":
+                    stderr = "\n".join(stderr_tail)
                     stdout_excerpt = "\n".join(stdout_tail[-30:])
                     combined = (f"stderr:\n{stderr.strip()}\n\nstdout:\n{stdout_excerpt.strip()}").strip()
                     self.logger.error(f"❌ Isolated worker failed: {combined}")
@@ -1556,22 +1633,15 @@ class SubtitleProcessor:
                 if not os.path.exists(result_json_path):
                     raise RuntimeError("Isolated worker exited without producing results.")
                     
-                with open(result_json_path, 'r', encoding='utf-8') as f:
-                    payload = json.load(f)
+                with open(result_json_path, 'rb') as f:
+                    payload = load_json_bytes(f.read())
 
-                if isinstance(payload, dict):
-                    word_dicts = payload.get('words', [])
-                    detected_lang = str(payload.get('language', '') or '').strip().lower()
-                else:
-                    word_dicts = payload
-                    detected_lang = ''
-                
-                all_words = [WordObj(w['start'], w['end'], w['word']) for w in word_dicts]
+                all_words, detected_lang = words_from_worker_payload(payload)
                 self.logger.info(f"✅ MLX fallback complete. {len(all_words)} words retrieved.")
                 
             finally:
-                # Cleanup worker files
-                cleanup_paths([worker_path, result_json_path])
+                worker.release(job_status)
+                cleanup_paths([result_json_path])
                 # Remove incremental checkpoint now that the final SRT is written
                 try:
                     if os.path.exists(partial_srt_path):
@@ -1582,20 +1652,19 @@ class SubtitleProcessor:
         entries = self.resegment_to_sentences(all_words, None)
         
         # Final cleanup for the main process just in case
-        self.cleanup()
+        if not keep_model:
+            self.cleanup()
         
         # Use original video name for SRT output
         final_video_name = Path(video_path).stem
         if "safe_input" in video_path or "temp_" in video_path:
-            final_video_name = re.sub(r'^(temp_\d+_|safe_)', '', final_video_name)
+            final_video_name = _TEMP_PREFIX_RE.sub('', final_video_name)
             
-        out_lang = _lang if _lang_for_worker else (detected_lang if re.fullmatch(r"[a-z]{2,3}", detected_lang) else 'en')
+        out_lang = _lang if _lang_for_worker else (detected_lang if _LANG_CODE_RE.fullmatch(detected_lang) else 'en')
         if _lang_for_worker == '' and out_lang:
             self.logger.info(f"🌐 Auto-detected source language: {out_lang}")
         srt_path = os.path.splitext(video_path)[0] + f"_{out_lang}.srt"
-        with open(srt_path, 'w', encoding='utf-8-sig') as f:
-            for i, entry in enumerate(entries, 1):
-                f.write(f"{i}\n{entry['start']} --> {entry['end']}\n{entry['text']}\n\n")
+        write_srt_file(srt_path, entries)
 
         self.logger.info(f"MLX asset preservation complete: {Path(srt_path).name}")
         return srt_path
@@ -1685,9 +1754,11 @@ class SubtitleProcessor:
         if not text:
             return text
         # Remove \h (hard breaks) and replace with space
-        text = re.sub(r'\\h+', ' ', text)
-        # Clean up multiple spaces
-        text = re.sub(r'\s+', ' ', text)
+        if '\\h' in text:
+            text = _HARD_BREAK_RE.sub(' ', text)
+        # Clean up multiple spaces (only runs or non-space whitespace, all non-printable)
+        if '  ' in text or not text.isprintable():
+            text = _WS_RE.sub(' ', text)
         return text.strip()
 
     @staticmethod
@@ -1742,22 +1813,23 @@ class SubtitleProcessor:
             # Layer 1: intra-entry word-level loop dedup
             e['text'] = self._dedup_word_loops(e['text'])
 
-            current_text = e['text'].strip().lower()
+            # Both cleaners return stripped text; lower-case it once per entry.
+            current_text = e['text'].lower()
 
             # Layer 2: exact entry repetition
             if current_text == last_text:
                 continue
 
-            # Layer 3: fuzzy substring repetition
-            if len(current_text) > 10 and len(last_text) > 10:
+            # Layer 3: fuzzy substring repetition (length check first; it rejects
+            # almost every pair without scanning either string)
+            cur_len, last_len = len(current_text), len(last_text)
+            if cur_len > 10 and last_len > 10 and abs(cur_len - last_len) < 5:
                 if current_text in last_text or last_text in current_text:
-                    if abs(len(current_text) - len(last_text)) < 5:
-                        continue
+                    continue
 
             # Layer 4: single-word domination check
             words = current_text.split()
             if len(words) >= 4:
-                from collections import Counter
                 freq = Counter(words)
                 most_common_word, most_common_count = freq.most_common(1)[0]
                 if most_common_count / len(words) > 0.7:
@@ -1766,7 +1838,7 @@ class SubtitleProcessor:
                     current_text = most_common_word
 
             # Skip empty results
-            if not e['text'].strip():
+            if not current_text:
                 continue
 
             clean.append(e)
@@ -1837,6 +1909,8 @@ class SubtitleProcessor:
         MAX_WORDS  = constraints['max_words']
         MAX_SEG_SEC = seg_config.max_segment_seconds
         MIN_NEXT_CLAUSE = max(4, MIN_WORDS - 1)  # lookahead: next clause must stand alone
+        soft_min_chars = limit * 0.6  # buffer fill needed before a soft (conjunction/comma) break
+        lookahead_limit = hard_limit + (20 if max_lines > 1 else 6)  # ceiling when a sentence end is near
 
         self.logger.debug(
             f"Segmentation config: is_vertical={is_vertical}, low_ram={low_ram}, "
@@ -1876,30 +1950,35 @@ class SubtitleProcessor:
 
         # ── main pass ────────────────────────────────────────────────────────
         entries: List[Dict] = []
-        buf: List = []          # WordObj items
+        buf: List[int] = []     # indices into words / stripped
         buf_chars = 0
+        # Strip every word once up front; the loop and its look-aheads index into this.
+        stripped = [w.word.strip() for w in words]
+        format_time = self.format_time
 
         def _flush_buf():
             nonlocal buf, buf_chars
             if not buf:
                 return
-            text = ' '.join(w.word.strip() for w in buf)
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = ' '.join([stripped[k] for k in buf])
+            # Words are stripped and non-empty, so only inner runs or non-space
+            # whitespace (all non-printable) need the collapsing regex.
+            if '  ' in text or not text.isprintable():
+                text = _WS_RE.sub(' ', text).strip()
             entries.append({
-                'start': self.format_time(buf[0].start),
-                'end':   self.format_time(buf[-1].end),
+                'start': format_time(words[buf[0]].start),
+                'end':   format_time(words[buf[-1]].end),
                 'text':  text,
             })
             buf = []
             buf_chars = 0
 
         total = len(words)
-        for i, word_obj in enumerate(words):
-            text = word_obj.word.strip()
+        for i, text in enumerate(stripped):
             if not text:
                 continue
 
-            buf.append(word_obj)
+            buf.append(i)
             buf_chars += len(text) + 1
 
             is_last = (i == total - 1)
@@ -1907,7 +1986,7 @@ class SubtitleProcessor:
             # peek at next non-empty word
             next_text = ''
             for j in range(i + 1, min(i + 4, total)):
-                nt = words[j].word.strip()
+                nt = stripped[j]
                 if nt:
                     next_text = nt
                     break
@@ -1938,7 +2017,7 @@ class SubtitleProcessor:
                 if not is_vertical:
                     remaining_until_next_end = 0
                     for k in range(i + 1, min(i + 5, total)):
-                        nw = words[k].word.strip()
+                        nw = stripped[k]
                         if not nw:
                             continue
                         remaining_until_next_end += 1
@@ -1957,7 +2036,7 @@ class SubtitleProcessor:
             if buf_chars > hard_limit:
                 found_end_nearby = False
                 for k in range(i + 1, min(i + 5, total)):
-                    w = words[k].word.strip()
+                    w = stripped[k]
                     if not w:
                         continue
                     if w.endswith(('.', '?', '!', '...')):
@@ -1966,8 +2045,7 @@ class SubtitleProcessor:
                     if w.endswith((',', ';', ':')):
                         break
                 # Allow extra chars to reach a nearby sentence end, but cap strict for 1-liners
-                lookahead_allowance = 20 if max_lines > 1 else 6
-                if found_end_nearby and buf_chars < hard_limit + lookahead_allowance:
+                if found_end_nearby and buf_chars < lookahead_limit:
                     continue
                 _flush_buf()
                 continue
@@ -1979,7 +2057,7 @@ class SubtitleProcessor:
                 continue
 
             # 4. Time ceiling — long silence / run-on speech
-            seg_dur = buf[-1].end - buf[0].start
+            seg_dur = words[buf[-1]].end - words[buf[0]].start
             if seg_dur >= MAX_SEG_SEC and buf_words >= MIN_WORDS and not next_is_clause_starter:
                 _flush_buf()
                 continue
@@ -1993,7 +2071,7 @@ class SubtitleProcessor:
 
             # 6. Coordinating conjunction at start of next fragment:
             #    good break if buffer is already substantial
-            if next_is_coord and buf_words >= MIN_WORDS and buf_chars >= limit * 0.6:
+            if next_is_coord and buf_words >= MIN_WORDS and buf_chars >= soft_min_chars:
                 _flush_buf()
                 continue
 
@@ -2002,7 +2080,7 @@ class SubtitleProcessor:
             #    AND the next word is NOT a subordinate clause starter (but pre-break is OK).
             if (text.endswith(soft_break_chars)
                     and buf_words >= MIN_WORDS
-                    and buf_chars >= limit * 0.6
+                    and buf_chars >= soft_min_chars
                     and not next_is_clause_starter):
                 next_clause_len = peek_next_clause_words(words, i)
                 if next_clause_len >= MIN_NEXT_CLAUSE:
@@ -2038,7 +2116,6 @@ class SubtitleProcessor:
         max_chars = getattr(self.style_config, 'max_chars', 42)
 
         # Get minimum word count constraint from segmentation config
-        from .config.segmentation import get_segmentation_config
         seg_config = get_segmentation_config()
         is_vertical = getattr(self, 'is_vertical_video', None)
         if not isinstance(is_vertical, bool):
@@ -2064,18 +2141,17 @@ class SubtitleProcessor:
         if self.whisper_timing:
             # Requested passthrough: keep Whisper timing untouched by our
             # timing normalization layer (min-duration/gap/overlap rules).
-            cleaned = entries
-            deduped = cleaned
+            deduped = entries
             removed_count = 0
         else:
-            cleaned = normalize_and_fix_timing(
+            deduped = normalize_and_fix_timing(
                 entries,
                 min_duration=min_duration,
                 parse_to_sec_fn=self.parse_to_sec,
                 format_time_fn=self.format_time,
+                merge_duplicates=True,
             )
-            deduped = deduplicate_consecutive_entries(cleaned)
-            removed_count = len(cleaned) - len(deduped)
+            removed_count = len(entries) - len(deduped)
             if removed_count > 0:
                 self.logger.warning(f"⚠️ Removed {removed_count} duplicate entries (Whisper hallucination suppression)")
 
@@ -2091,13 +2167,10 @@ class SubtitleProcessor:
         )
 
 
-    @staticmethod
-    def parse_to_sec(t_str: str) -> float:
-        return parse_to_sec(t_str)
-
-    @staticmethod
-    def format_time(seconds: float) -> str:
-        return format_time(seconds)
+    # Called for every timestamp in every pass: bind the io.srt_time
+    # functions directly instead of wrapping them in another frame.
+    parse_to_sec = staticmethod(parse_to_sec)
+    format_time = staticmethod(format_time)
 
     @staticmethod
     def _normalize_digits(text: str) -> str:
@@ -2137,21 +2210,23 @@ class SubtitleProcessor:
             i += 1
         return merged
 
-    def _load_collocations(self) -> set:
-        """Load small collocations list from data file into a set of lowercase bigrams."""
+    def _load_collocations(self) -> FrozenSet[Tuple[str, str]]:
+        """Load small collocations list from data file as lowercase (left, right) word pairs."""
         if getattr(self, '_collocations_cache', None) is not None:
             return self._collocations_cache
 
         # repository layout: lib/python/subtitle -> go up 2 to reach lib
         coll_path = Path(__file__).parent.parent.parent / 'data' / 'collocations_small.txt'
-        coll = set()
+        coll = frozenset()
         try:
             if coll_path.exists():
                 with open(coll_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line: continue
-                        coll.add(line.lower())
+                    # Callers look up (left.lower(), right.lower()) directly; only two-word lines can match.
+                    coll = frozenset(
+                        (parts[0], parts[1])
+                        for parts in (line.lower().split() for line in f)
+                        if len(parts) == 2
+                    )
         except Exception:
             pass
 
@@ -2166,83 +2241,112 @@ class SubtitleProcessor:
         # 1. Candidate selection: Look in the middle 60% of the string
         start_idx = int(len(text) * 0.2)
         end_idx = int(len(text) * 0.8)
+        center = len(text) / 2
         
         collocations = self._load_collocations()
-        
-        candidates = []
-        for match in re.finditer(r'\s', text[start_idx:end_idx]):
-            pos = start_idx + match.start()
-            
+
+        def _score(pos: int, bonus: int) -> float:
             # Base score: Distance from absolute center (lower distance is better)
-            center = len(text) / 2
-            score = 100 - abs(pos - center)
-            
-            # --- PUNCTUATION BONUSES ---
-            char_before = text[pos-1] if pos > 0 else ""
-            if char_before in ('.', '!', '?', '...'): score += 80
-            if char_before in (',', '،', ';', ':', '-'): score += 50
-            
+            score = 100 + bonus - abs(pos - center)
             # --- COLLOCATION PENALTY ---
             # Don't break common pairs
-            words_before = text[:pos].split()
-            words_after = text[pos+1:].split()
-            if words_before and words_after:
-                pair = f"{words_before[-1].lower()} {words_after[0].lower()}"
-                if pair in collocations:
-                    score -= 150 # Massive penalty
+            if collocations:
+                words_before = text[:pos].rsplit(None, 1)
+                words_after = text[pos+1:].split(None, 1)
+                if words_before and words_after:
+                    if (words_before[-1].lower(), words_after[0].lower()) in collocations:
+                        score -= 150 # Massive penalty
+            return score
+
+        # 2. Sentence enders first: one scoring above 150 (the best any other
+        # space can reach) wins outright, so the full scan is skipped.
+        best = max(
+            ((m.start(), _score(m.start(), 80)) for m in _SENTENCE_END_SPACE_RE.finditer(text, start_idx, end_idx)),
+            key=itemgetter(1), default=None,
+        )
+        if best is not None and best[1] > 150:
+            return best[0]
+
+        # Running argmax: strict '>' keeps the first of equally scored spaces.
+        best_pos, best_score = -1, float('-inf')
+        for match in _SPACE_RE.finditer(text, start_idx, end_idx):
+            pos = match.start()  # pos/endpos search: offsets are already absolute
             
-            candidates.append((pos, score))
+            # --- PUNCTUATION BONUSES ---
+            char_before = text[pos-1] if pos > 0 else ""
+            bonus = 0
+            if char_before in ('.', '!', '?'): bonus = 80
+            elif char_before in (',', '،', ';', ':', '-'): bonus = 50
             
-        if not candidates:
-            return -1
+            score = _score(pos, bonus)
+            if score > best_score:
+                best_pos, best_score = pos, score
             
-        # Return index of highest scoring space
-        candidates.sort(key=lambda x: x[1], reverse=True)
-        return candidates[0][0]
+        # Index of highest scoring space, or -1 when there is none
+        return best_pos
 
     def _split_at_best_point(self, entry: Dict, max_chars: int = 42) -> List[Dict]:
-        """Recursively split an entry at its most semantic middle point."""
-        text = self._clean_bidi(entry['text'])
-        if len(text) <= max_chars:
-            return [entry]
-            
-        split_pos = self._find_best_split_point(text, max_chars)
-        if split_pos == -1:
-            # Word-boundary-only fallback: never split inside a word.
-            # Try nearest spaces around the center, then nearest before max_chars.
-            center = len(text) // 2
-            left_space = text.rfind(' ', 0, center)
-            right_space = text.find(' ', center)
-
-            candidates = [p for p in (left_space, right_space) if p > 0]
-            if not candidates:
-                split_pos = text.rfind(' ', 0, max_chars)
-                if split_pos <= 0:
-                    # Single-token text: keep it unsplit rather than breaking characters.
-                    return [entry]
-            else:
-                split_pos = min(candidates, key=lambda p: abs(p - center))
-            
-        # Time interpolation
-        s_sec = self.parse_to_sec(entry['start'])
-        e_sec = self.parse_to_sec(entry['end'])
-        duration = e_sec - s_sec
-        mid_time = s_sec + (duration * (split_pos / len(text)))
-        
-        part1 = {
-            'index': entry.get('index', '0'),
-            'start': entry['start'],
-            'end': self.format_time(mid_time),
-            'text': entry['text'][:split_pos].strip()
-        }
-        part2 = {
-            'index': entry.get('index', '0'),
-            'start': self.format_time(mid_time),
-            'end': entry['end'],
-            'text': entry['text'][split_pos:].strip()
-        }
-        
-        return self._split_at_best_point(part1, max_chars) + self._split_at_best_point(part2, max_chars)
+        """Split an entry at its most semantic middle point until every part fits.
+
+        Works through an explicit stack (right half pushed first, so parts come
+        out in reading order) and carries each part's times as floats, so
+        sub-splits never re-parse timestamps.
+        """
+        clean_bidi = self._clean_bidi
+        find_best_split_point = self._find_best_split_point
+        parse_to_sec = self.parse_to_sec
+        format_time = self.format_time
+
+        out: List[Dict] = []
+        stack: List[Tuple[Dict, Optional[float], Optional[float]]] = [(entry, None, None)]
+        while stack:
+            entry, s_sec, e_sec = stack.pop()
+            text = clean_bidi(entry['text'])
+            if len(text) <= max_chars:
+                out.append(entry)
+                continue
+
+            split_pos = find_best_split_point(text, max_chars)
+            if split_pos == -1:
+                # Word-boundary-only fallback: never split inside a word.
+                # Try nearest spaces around the center, then nearest before max_chars.
+                center = len(text) // 2
+                left_space = text.rfind(' ', 0, center)
+                right_space = text.find(' ', center)
+
+                candidates = [p for p in (left_space, right_space) if p > 0]
+                if not candidates:
+                    split_pos = text.rfind(' ', 0, max_chars)
+                    if split_pos <= 0:
+                        # Single-token text: keep it unsplit rather than breaking characters.
+                        out.append(entry)
+                        continue
+                else:
+                    split_pos = min(candidates, key=lambda p: abs(p - center))
+
+            # Time interpolation
+            if s_sec is None:
+                s_sec = parse_to_sec(entry['start'])
+                e_sec = parse_to_sec(entry['end'])
+            mid_time = s_sec + ((e_sec - s_sec) * (split_pos / len(text)))
+            mid_str = format_time(mid_time)
+
+            part1 = {
+                'index': entry.get('index', '0'),
+                'start': entry['start'],
+                'end': mid_str,
+                'text': entry['text'][:split_pos].strip()
+            }
+            part2 = {
+                'index': entry.get('index', '0'),
+                'start': mid_str,
+                'end': entry['end'],
+                'text': entry['text'][split_pos:].strip()
+            }
+            stack.append((part2, mid_time, e_sec))
+            stack.append((part1, s_sec, mid_time))
+
+        return out
 
     def _ensure_bert(self):
         """Lazy-load a masked-LM model for lightweight collocation scoring if requested.
@@ -2265,6 +2369,9 @@ class SubtitleProcessor:
             self._bert_tokenizer = AutoTokenizer.from_pretrained(model_name)
             self._bert_model = AutoModelForMaskedLM.from_pretrained(model_name)
             self._bert_model.eval()
+            import torch
+            self._bert_device = "cuda" if torch.cuda.is_available() else "cpu"
+            self._bert_model.to(self._bert_device)
             self._bert_available = True
         except Exception:
             self._bert_available = False
@@ -2281,26 +2388,22 @@ class SubtitleProcessor:
 
         try:
             import torch
-            toks = self._bert_tokenizer.tokenize(phrase)
+            tok = self._bert_tokenizer
+            toks = tok.tokenize(phrase)
             if not toks:
                 return None
-            scores = []
-            for i, tok in enumerate(toks):
-                toks_masked = toks.copy()
-                toks_masked[i] = self._bert_tokenizer.mask_token
-                inputs = self._bert_tokenizer.convert_tokens_to_ids([self._bert_tokenizer.cls_token] + toks_masked + [self._bert_tokenizer.sep_token])
-                input_ids = torch.tensor([inputs])
-                with torch.no_grad():
-                    outputs = self._bert_model(input_ids)
-                    logits = outputs.logits
-                # index of original token in vocab
-                orig_id = self._bert_tokenizer.convert_tokens_to_ids(tok)
-                # masked position index in input_ids
-                mask_pos = 1 + i
-                logit = logits[0, mask_pos, orig_id].item()
-                # convert to negative logit as proxy (higher is better)
-                scores.append(-float(logit))
-            return sum(scores) / max(1, len(scores))
+            # One forward pass for all positions: row i is the phrase with token i masked.
+            n = len(toks)
+            ids = tok.convert_tokens_to_ids([tok.cls_token] + toks + [tok.sep_token])
+            input_ids = torch.tensor([ids] * n, device=self._bert_device)
+            positions = torch.arange(1, n + 1, device=self._bert_device)
+            rows = torch.arange(n, device=self._bert_device)
+            orig_ids = input_ids[rows, positions].clone()
+            input_ids[rows, positions] = tok.mask_token_id
+            with torch.inference_mode():
+                logits = self._bert_model(input_ids).logits
+            # Negative logit of the original token at its masked position (lower is better).
+            return -float(logits[rows, positions, orig_ids].mean().item())
         except Exception:
             return None
 
@@ -2431,7 +2534,7 @@ class SubtitleProcessor:
             self.logger.warning("GROK_API_KEY not found. Falling back to DeepSeek.")
             return self.translate_with_deepseek(texts, target_lang, source_lang, 25, original_entries, output_srt, existing_translations)
 
-        client = OpenAI(api_key=self.grok_api_key, base_url="https://api.x.ai/v1")
+        client = self.grok_client
         model_name = "grok-4-1-fast-reasoning"
 
         indices = list(range(len(texts)))
@@ -2449,6 +2552,7 @@ class SubtitleProcessor:
         batch_indices_list = self._create_balanced_batches(indices_to_translate, texts, batch_size)
         batch_count = len(batch_indices_list)
         pbar = tqdm(total=len(indices_to_translate), unit="item", desc=f"  Groq-Translating ({target_lang.upper()})")
+        live = live_checkpoint(output_srt, original_entries, final_result)
 
         for i, batch_indices in enumerate(batch_indices_list):
             batch = [texts[idx] for idx in batch_indices]
@@ -2497,7 +2601,7 @@ class SubtitleProcessor:
                         for t in trans_list:
                             if not t or not t.strip():
                                 processed_list.append(t)
-                            elif not any('\u0600' <= c <= '\u06FF' for c in t):
+                            elif not has_target_language_chars(t, 'fa'):
                                 processed_list.append(t)
                             else:
                                 processed_list.append(self.fix_persian_text(self.strip_english_echo(t)))
@@ -2507,14 +2611,8 @@ class SubtitleProcessor:
                         for rel_idx, trans in enumerate(trans_list[:len(batch)]):
                             final_result[batch_indices[rel_idx]] = trans
 
-                        if output_srt and original_entries:
-                            tgt_entries_live = original_entries[:]
-                            for k, v in enumerate(final_result):
-                                if v is not None and k < len(tgt_entries_live):
-                                    tgt_entries_live[k] = {**tgt_entries_live[k], 'text': v}
-                            with open(output_srt, 'w', encoding='utf-8-sig') as f:
-                                for idx2, entry in enumerate(tgt_entries_live, 1):
-                                    f.write(f"{idx2}\n{entry['start']} --> {entry['end']}\n{entry['text']}\n\n")
+                        if live is not None:
+                            live.update(batch_indices, final_result)
 
                         pbar.update(len(batch))
                         success_batch = True
@@ -2540,52 +2638,21 @@ class SubtitleProcessor:
                     ds_result = self.translate_with_deepseek(ds_texts, target_lang, source_lang, len(ds_texts))
                     for rel_idx, trans in enumerate(ds_result[:len(batch)]):
                         final_result[batch_indices[rel_idx]] = trans
+                    if live is not None:
+                        live.update(batch_indices, final_result)
                     pbar.update(len(batch))
                 except Exception as de:
                     pbar.close()
+                    flush_live_checkpoint(live)
                     raise RuntimeError(f"Grok+DeepSeek both failed on batch {i+1}: {de}")
 
         pbar.close()
+        flush_live_checkpoint(live)
         return final_result
 
     def get_translation_prompt(self, target_lang: str) -> str:
         """Universal translation prompt with structural constraints"""
-        lang_config = get_language_config(target_lang)
-        lang_name = lang_config.name
-        
-        # Special handling for Persian (informal tone)
-        if target_lang == 'fa':
-            return (
-                f"You are a professional {lang_name} subtitle translator.\n"
-                "SYSTEM: Tehrani informal tone.\n"
-                "FORMAT: Return ONLY a valid JSON object where keys are the input line numbers and values are the translations.\n"
-                "EXAMPLE: {\"1\": \"سلام\", \"2\": \"چطوری؟\"}\n"
-                f"RULE: For ACRONYMS ONLY (API, AGI, CapEx), write the {lang_name} translation first, then the English acronym in parentheses. "
-                "For ALL other words, translate directly into Persian WITHOUT any English in parentheses.\n"
-                "CRITICAL 1: You MUST translate EACH numbered item independently. The output JSON must have the EXACT SAME NUMBER of keys as the input items.\n"
-                "CRITICAL 2: Each item is a RAW SUBTITLE SEGMENT — it may be an incomplete sentence fragment that continues from the previous line or continues into the next. "
-                "Translate ONLY the exact words given. Do NOT complete the thought. Do NOT add words from context. Do NOT summarize multiple items into one.\n"
-                "CRITICAL 3: The translation for line N MUST cover the SAME semantic content as the input for line N — nothing more, nothing less. "
-                "If the input is short (e.g. 'guy but it almost'), the translation must also be short and faithful.\n"
-                "CRITICAL 4: NEVER echo or repeat the original English source text in your output.\n"
-                "CRITICAL 5: NEVER put English words inside parentheses as clarification. "
-                "Do NOT write things like 'اطلاعاتی (intelligence)' — just write 'اطلاعاتی'. "
-                "If a fragment seems incomplete, translate what is given faithfully without annotation.\n"
-                "NO commentary, NO extra text."
-            )
-
-        # Generic prompt for other languages
-        return (
-            f"You are a professional {lang_name} subtitle translator.\n"
-            "FORMAT: Return ONLY a valid JSON object where keys are the input line numbers and values are the translations.\n"
-            "EXAMPLE: {\"1\": \"Hello\", \"2\": \"How are you?\"}\n"
-            "CRITICAL 1: You MUST translate EACH line strictly independently. Do NOT merge two lines into one key. The output JSON must have the EXACT SAME NUMBER of keys as the input TARGET LINES, with NO skipped numbers.\n"
-            "CRITICAL 2: Each item is a RAW SUBTITLE SEGMENT and may be an incomplete sentence fragment. "
-            "Translate ONLY the exact words given — do NOT complete the thought or add words from surrounding context.\n"
-            "CRITICAL 3: The translation for line N MUST correspond EXACTLY to the English text in line N. Do NOT shift translations up or down keys.\n"
-            "CRITICAL 4: NEVER add parenthetical clarifications with English words. Translate directly without annotation.\n"
-            "NO commentary, NO extra text."
-        )
+        return build_translation_prompt(target_lang)
 
     @staticmethod
     def fix_persian_text(text: str) -> str:
@@ -2634,9 +2701,7 @@ class SubtitleProcessor:
         try:
             val = None
             if HAS_GEMINI and self.google_api_key and self.llm_choice == "gemini":
-                from google import genai
-                client = genai.Client(api_key=self.google_api_key)
-                response = client.models.generate_content(
+                response = self.gemini_client.models.generate_content(
                     model="gemini-2.0-flash", # Fast model for single lines
                     contents=f"{system_prompt}\n\n{context_prompt}"
                 )
@@ -2657,10 +2722,7 @@ class SubtitleProcessor:
             else:
                 selected_model = 'deepseek-v4-flash'
 
-                if not HAS_OPENAI:
-                    raise ImportError("OpenAI package required for DeepSeek translation. Please install with 'pip install openai'")
-                
-                client = OpenAI(api_key=self.api_key, base_url="https://api.deepseek.com/v1")
+                client = self.deepseek_client
                 response = client.chat.completions.create(
                     model=selected_model,
                     messages=[
@@ -2773,7 +2835,7 @@ class SubtitleProcessor:
         """
         pseudo_words: List[WordObj] = []
         for entry in entries or []:
-            text = re.sub(r"\s+", " ", str(entry.get("text", "") or "")).strip()
+            text = _WS_RE.sub(" ", str(entry.get("text", "") or "")).strip()
             if not text:
                 continue
 
@@ -2837,9 +2899,7 @@ class SubtitleProcessor:
         if not isinstance(resegged, list) or not resegged:
             return False
 
-        with open(srt_path, "w", encoding="utf-8-sig") as f:
-            for idx, entry in enumerate(resegged, 1):
-                f.write(f"{idx}\n{entry['start']} --> {entry['end']}\n{entry['text']}\n\n")
+        write_srt_file(srt_path, resegged)
 
         self.logger.info(f"♻️ Re-segmented existing subtitles in-place: {Path(srt_path).name}")
         return True
@@ -2900,10 +2960,7 @@ class SubtitleProcessor:
                 return recovered
 
             # HALLUCINATION FILTER: Pre-calculate text counts to detect repetitions
-            counts = {}
-            for e in partial_entries:
-                t = e['text'].strip()
-                if t: counts[t] = counts.get(t, 0) + 1
+            counts = Counter(t for t in (e['text'].strip() for e in partial_entries) if t)
             
             # Identify texts that repeat too much (more than 5% of file or > 5 times for long strings)
             hallucinated_texts = set()
@@ -3018,7 +3075,31 @@ class SubtitleProcessor:
         lock_key = ctx["lock_key"]
 
         self.logger.info(f"Processing sequence initiated: {Path(video_path).name}")
-        
+
+        # Style and render options besides the SRTs; their hash is stored next to the render.
+        render_opts = dict(
+            render_resolution=render_resolution, render_quality=render_quality, render_fps=render_fps,
+            render_split_mb=render_split_mb, pad_bottom=pad_bottom, subtitle_banner_image=subtitle_banner_image,
+            subtitle_banner_color=subtitle_banner_color, subtitle_banner_height=subtitle_banner_height,
+            subtitle_logo=subtitle_logo, subtitle_logo_animated=subtitle_logo_animated,
+            subtitle_logo_width=subtitle_logo_width, subtitle_logo_margin_right=subtitle_logo_margin_right,
+            subtitle_logo_margin_bottom=subtitle_logo_margin_bottom, guest_tags=guest_tags, guest_tag_pos=guest_tag_pos,
+            subtitle_raise_top_px=subtitle_raise_top_px, subtitle_raise_bottom_px=subtitle_raise_bottom_px,
+            subtitle_shift=subtitle_shift,
+        )
+        render_sig = render_options_signature(self, render_opts)
+
+        # Idempotent re-run: a current _subbed.mp4 rendered with the same options means every stage already ran.
+        if render and not (force or post_only or ass_input_path or _is_srt_input or _source_auto_requested
+                           or platforms or save_formats) and limit_start is None and limit_end is None:
+            up_to_date = find_up_to_date_render(self, original_base, video_path, source_lang, target_langs,
+                                                render_resolution, render_quality, get_default_quality, render_sig)
+            if up_to_date:
+                self.logger.info(f"✓ Up-to-date: {Path(up_to_date['rendered_video']).name}")
+                run_finalize_stage(self, result=up_to_date, original_base=original_base, original_stem=original_stem,
+                                   original_dir=original_dir, source_lang=source_lang, target_langs=target_langs)
+                return up_to_date
+
         result = {}
         temp_vid = None
         workflow_lock_path = None
@@ -3110,24 +3191,8 @@ class SubtitleProcessor:
                         limit_start=_limit_start,
                         video_width=_vw or 0,
                         video_height=_vh or 0,
-                        render_resolution=render_resolution,
-                        render_quality=render_quality,
-                        render_fps=render_fps,
-                        render_split_mb=render_split_mb,
-                        pad_bottom=pad_bottom,
-                        subtitle_banner_image=subtitle_banner_image,
-                        subtitle_banner_color=subtitle_banner_color,
-                        subtitle_banner_height=subtitle_banner_height,
-                        subtitle_logo=subtitle_logo,
-                        subtitle_logo_animated=subtitle_logo_animated,
-                        subtitle_logo_width=subtitle_logo_width,
-                        subtitle_logo_margin_right=subtitle_logo_margin_right,
-                        subtitle_logo_margin_bottom=subtitle_logo_margin_bottom,
-                        guest_tags=guest_tags,
-                        guest_tag_pos=guest_tag_pos,
-                        subtitle_raise_top_px=subtitle_raise_top_px,
-                        subtitle_raise_bottom_px=subtitle_raise_bottom_px,
-                        subtitle_shift=subtitle_shift,
+                        **render_opts,
+                        render_signature=render_sig,
                         emit_progress=_emit_progress,
                         detect_best_hw_encoder_fn=detect_best_hw_encoder,
                         get_default_quality_fn=get_default_quality,
@@ -3168,24 +3233,8 @@ class SubtitleProcessor:
                         limit_start=_limit_start,
                         video_width=_vw or 0,
                         video_height=_vh or 0,
-                        render_resolution=render_resolution,
-                        render_quality=render_quality,
-                        render_fps=render_fps,
-                        render_split_mb=render_split_mb,
-                        pad_bottom=pad_bottom,
-                        subtitle_banner_image=subtitle_banner_image,
-                        subtitle_banner_color=subtitle_banner_color,
-                        subtitle_banner_height=subtitle_banner_height,
-                        subtitle_logo=subtitle_logo,
-                        subtitle_logo_animated=subtitle_logo_animated,
-                        subtitle_logo_width=subtitle_logo_width,
-                        subtitle_logo_margin_right=subtitle_logo_margin_right,
-                        subtitle_logo_margin_bottom=subtitle_logo_margin_bottom,
-                        guest_tags=guest_tags,
-                        guest_tag_pos=guest_tag_pos,
-                        subtitle_raise_top_px=subtitle_raise_top_px,
-                        subtitle_raise_bottom_px=subtitle_raise_bottom_px,
-                        subtitle_shift=subtitle_shift,
+                        **render_opts,
+                        render_signature=render_sig,
                         emit_progress=_emit_progress,
                         detect_best_hw_encoder_fn=detect_best_hw_encoder,
                         get_default_quality_fn=get_default_quality,
@@ -3238,6 +3287,15 @@ class SubtitleProcessor:
                 self._release_global_workflow_slot(global_slot_path)
                 global_slot_path = None
             
+            # Warm the render-only lookups (font scan, encoder probe) while
+            # translation is bound on the network; the ASS itself needs the
+            # translated SRTs and is still built in the rendering stage.
+            if render and not _is_srt_input:
+                _prefetch = ThreadPoolExecutor(max_workers=2, thread_name_prefix="render-prefetch")
+                _prefetch.submit(find_subtitle_fonts_dir)
+                _prefetch.submit(detect_best_hw_encoder)
+                _prefetch.shutdown(wait=False)
+
             # 2. Translation
             run_translation_stage(
                 self,
@@ -3287,24 +3345,8 @@ class SubtitleProcessor:
                     limit_start=_limit_start,
                     video_width=_vw or 0,
                     video_height=_vh or 0,
-                    render_resolution=render_resolution,
-                    render_quality=render_quality,
-                    render_fps=render_fps,
-                    render_split_mb=render_split_mb,
-                    pad_bottom=pad_bottom,
-                    subtitle_banner_image=subtitle_banner_image,
-                    subtitle_banner_color=subtitle_banner_color,
-                    subtitle_banner_height=subtitle_banner_height,
-                    subtitle_logo=subtitle_logo,
-                    subtitle_logo_animated=subtitle_logo_animated,
-                    subtitle_logo_width=subtitle_logo_width,
-                    subtitle_logo_margin_right=subtitle_logo_margin_right,
-                    subtitle_logo_margin_bottom=subtitle_logo_margin_bottom,
-                    guest_tags=guest_tags,
-                    guest_tag_pos=guest_tag_pos,
-                    subtitle_raise_top_px=subtitle_raise_top_px,
-                    subtitle_raise_bottom_px=subtitle_raise_bottom_px,
-                    subtitle_shift=subtitle_shift,
+                    **render_opts,
+                    render_signature=render_sig,
                     emit_progress=_emit_progress,
                     detect_best_hw_encoder_fn=detect_best_hw_encoder,
                     get_default_quality_fn=get_default_quality,
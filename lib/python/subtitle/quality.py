@@ -66,6 +66,11 @@ def yt_codes_for_lang(lang: str) -> List[str]:
 # SRT helpers (self-contained; no dependency on rest of subtitle package)
 # ---------------------------------------------------------------------------
 
+_BLANK_LINE_RE = re.compile(r"\n\s*\n")
+_TIMING_RE = re.compile(r"(\d+:\d+:\d+[,\.]\d+)\s*-->\s*(\d+:\d+:\d+[,\.]\d+)")
+_WS_RE = re.compile(r"\s+")
+
+
 def _ts_to_sec(ts: str) -> float:
     ts = ts.replace(",", ".")
     parts = ts.split(":")
@@ -80,12 +85,12 @@ def _parse_srt(srt_path: str) -> List[Dict]:
     except Exception:
         return entries
 
-    for block in re.split(r"\n\s*\n", text.strip()):
+    for block in _BLANK_LINE_RE.split(text.strip()):
         lines = block.strip().splitlines()
         for i, line in enumerate(lines):
-            m = re.match(
-                r"(\d+:\d+:\d+[,\.]\d+)\s*-->\s*(\d+:\d+:\d+[,\.]\d+)", line
-            )
+            if "-->" not in line:
+                continue
+            m = _TIMING_RE.match(line)
             if m:
                 try:
                     start = _ts_to_sec(m.group(1))
@@ -124,7 +129,7 @@ def assess_subtitle_quality(srt_path: str, video_duration: float) -> QualityResu
     wpm = (total_words / total_sub_sec * 60.0) if total_sub_sec > 0 else 0.0
 
     # 3a. Consecutive-line exact repetition
-    texts = [re.sub(r"\s+", " ", e["text"].strip().lower()) for e in entries]
+    texts = [_WS_RE.sub(" ", e["text"].strip().lower()) for e in entries]
     max_run = max(sum(1 for _ in g) for _, g in groupby(texts)) if texts else 0
 
     # 3b. Near-duplicate consecutive entries (Jaccard similarity > 0.6)
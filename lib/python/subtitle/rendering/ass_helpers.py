@@ -121,10 +121,13 @@ def build_secondary_map(sec_entries: List[Dict]) -> Dict[str, str]:
     return secondary_map
 
 
+_PAREN_WRAP_RE = re.compile(r"[\u200F]?\(([a-zA-Z0-9\s/_\-\.]+)\)[\u200F]?")
+
+
 def _wrap_parentheses_with_smaller_font(text: str) -> str:
-    pattern = r"[\u200F]?\(([a-zA-Z0-9\s/_\-\.]+)\)[\u200F]?"
-    replacement = r"{\fscx75\fscy75}(\1){\fscx100\fscy100}"
-    return re.sub(pattern, replacement, text)
+    if "(" not in text:
+        return text
+    return _PAREN_WRAP_RE.sub(r"{\fscx75\fscy75}(\1){\fscx100\fscy100}", text)
 
 
 def _normalize_primary_text(text: str, secondary_srt: Optional[str], is_portrait: bool) -> str:
@@ -199,53 +202,54 @@ def build_ass_events(
 ) -> List[str]:
     """Build ASS dialogue events for mono/bilingual subtitle rendering."""
     events: List[str] = []
+    append = events.append
+
+    # Everything that depends only on the render configuration is resolved once here,
+    # so the per-entry loop only does text work and string formatting.
+    is_fa = lang == "fa"
+    single_line = max_lines <= 1
+    event_style = "FaDefault" if (is_fa and not secondary_map) else "Default"
+    top_prefix = bi_prefix = ""
+    if secondary_map:
+        top_scale = 0.65 if is_portrait else 0.82
+        top_fs = max(11, int(style.font_size * top_scale))
+        bot_fs = style.font_size
+        wrap = "{\\q0}" if is_portrait else ("{\\q2}" if single_line else "")
+        top_prefix = f"{wrap}{{\\fs{top_fs}}}{{\\c&H808080}}"
+        bi_prefix = f"{wrap}{{\\b1}}{{\\fs{bot_fs}}}"
 
     for entry in entries:
         text = _normalize_primary_text(entry["text"], secondary_srt, is_portrait)
-        
-        if lang == "fa":
-            text = clean_bidi_fn(text)
-            text = fix_persian_text_fn(text)
 
-        if max_lines <= 1:
-            text = text.replace("\\N", " ").replace("\\n", " ").replace("\n", " ")
-            text = " ".join(text.split())
+        if is_fa:
+            text = fix_persian_text_fn(clean_bidi_fn(text))
+
+        if single_line:
+            text = " ".join(text.replace("\\N", " ").replace("\\n", " ").split())
         final_text = text
         bi_fa_text = None
 
         if secondary_map:
             sec_text = secondary_map.get(entry["index"])
             if sec_text:
-                sec_text = clean_bidi_fn(sec_text)
-                sec_text_fixed = fix_persian_text_fn(sec_text)
-                if max_lines <= 1:
-                    sec_text_fixed = sec_text_fixed.replace("\\N", " ").replace("\\n", " ").replace("\n", " ")
-                    sec_text_fixed = " ".join(sec_text_fixed.split())
-                sec_text_formatted = _wrap_parentheses_with_smaller_font(sec_text_fixed)
-                top_scale = 0.65 if is_portrait else 0.82
-                top_fs = max(11, int(style.font_size * top_scale))
-                bot_fs = style.font_size
-                top_wrap = "{\\q0}" if is_portrait else ("{\\q2}" if max_lines <= 1 else "")
-                fa_wrap = "{\\q0}" if is_portrait else ("{\\q2}" if max_lines <= 1 else "")
-                final_text = f"{top_wrap}{{\\fs{top_fs}}}{{\\c&H808080}}{text}"
-                bi_fa_text = f"{fa_wrap}{{\\b1}}{{\\fs{bot_fs}}}{sec_text_formatted}"
+                sec_text_fixed = fix_persian_text_fn(clean_bidi_fn(sec_text))
+                if single_line:
+                    sec_text_fixed = " ".join(sec_text_fixed.replace("\\N", " ").replace("\\n", " ").split())
+                final_text = top_prefix + text
+                bi_fa_text = _strip_bidi_controls(bi_prefix + _wrap_parentheses_with_smaller_font(sec_text_fixed))
 
         ass_start = _srt_to_ass_time(entry["start"], time_offset)
         ass_end = _srt_to_ass_time(entry["end"], time_offset)
 
         final_text = _strip_bidi_controls(final_text)
-        if bi_fa_text:
-            bi_fa_text = _strip_bidi_controls(bi_fa_text)
-
-        # Monolingual path also needs no-wrap in single-line mode.
-        if not bi_fa_text and max_lines <= 1 and not final_text.startswith("{\\q2}"):
-            final_text = "{\\q2}" + final_text
 
-        event_style = "FaDefault" if (lang == "fa" and not secondary_map) else "Default"
         if bi_fa_text:
-            events.append(f"Dialogue: 0,{ass_start},{ass_end},FaDefault,,0,0,0,,{bi_fa_text}")
-            events.append(f"Dialogue: 0,{ass_start},{ass_end},TopDefault,,0,0,0,,{final_text}")
+            append(f"Dialogue: 0,{ass_start},{ass_end},FaDefault,,0,0,0,,{bi_fa_text}")
+            append(f"Dialogue: 0,{ass_start},{ass_end},TopDefault,,0,0,0,,{final_text}")
         else:
-            events.append(f"Dialogue: 0,{ass_start},{ass_end},{event_style},,0,0,0,,{final_text}")
+            # Monolingual path also needs no-wrap in single-line mode.
+            if single_line and not final_text.startswith("{\\q2}"):
+                final_text = "{\\q2}" + final_text
+            append(f"Dialogue: 0,{ass_start},{ass_end},{event_style},,0,0,0,,{final_text}")
 
     return events
@@ -1,5 +1,30 @@
 import re
-from typing import Callable, Dict, List, Set
+from typing import Callable, Dict, FrozenSet, List, Tuple
+
+from subtitle.io.srt_time import format_time, parse_to_sec, to_srt_precision
+
+_WORD_RE = re.compile(r"[\w\u0600-\u06FF'-]+")
+_ARABIC_SCRIPT_RE = re.compile(r"[\u0600-\u06FF]")
+
+
+def _bind_collocations(text: str, collocations: FrozenSet[Tuple[str, str]]) -> str:
+    """Replace the whitespace inside known word pairs with a no-break space.
+
+    One left-to-right pass over the word spans; the text is rebuilt only when
+    at least one pair matches.
+    """
+    spans = [(m.start(), m.end(), m.group().lower()) for m in _WORD_RE.finditer(text)]
+    parts: List[str] = []
+    prev = 0
+    for (_, left_end, left), (right_start, _, right) in zip(spans, spans[1:]):
+        if (left, right) in collocations and text[left_end:right_start].isspace():
+            parts.append(text[prev:left_end])
+            parts.append("\u00A0")
+            prev = right_start
+    if not parts:
+        return text
+    parts.append(text[prev:])
+    return "".join(parts)
 
 
 def apply_semantic_splitting(
@@ -19,9 +44,14 @@ def normalize_and_fix_timing(
     min_duration: float,
     parse_to_sec_fn: Callable[[str], float],
     format_time_fn: Callable[[float], str],
+    merge_duplicates: bool = False,
 ) -> List[Dict]:
     """Enforce minimum duration, pad silent gaps, and resolve overlaps.
 
+    With merge_duplicates, consecutive identical texts are also collapsed
+    (as deduplicate_consecutive_entries would) while the adjusted times are
+    written back, saving a separate pass.
+
     Overlap policy (critical for sync accuracy):
     - Minor overlap (<= 0.15s): trim the PREVIOUS entry's end backward to the
       current entry's start. Never shift current start forward unless timing
@@ -34,16 +64,32 @@ def normalize_and_fix_timing(
     min_prev_visible_duration = 0.06
     sync_epsilon = 0.01
 
+    # Stored times must match what the SRT string will hold, or overlap checks
+    # against the previous entry can flip. The stock formatter has an
+    # arithmetic equivalent; any other pair is round-tripped through its string.
+    if format_time_fn is format_time and parse_to_sec_fn is parse_to_sec:
+        to_precision = to_srt_precision
+    else:
+        def to_precision(sec: float) -> float:
+            return parse_to_sec_fn(format_time_fn(sec))
+
+    # Parse every timestamp once and work on floats; entries are formatted
+    # back to SRT strings only after all adjustments are done.
+    starts = [parse_to_sec_fn(e["start"]) for e in entries]
+    ends = [parse_to_sec_fn(e["end"]) for e in entries]
+
     cleaned: List[Dict] = []
+    out_starts: List[float] = []
+    out_ends: List[float] = []
 
     for i, entry in enumerate(entries):
-        start = parse_to_sec_fn(entry["start"])
-        end = parse_to_sec_fn(entry["end"])
+        start = starts[i]
+        end = ends[i]
 
         if end - start < min_duration:
             end = start + min_duration
 
-        next_start_time = parse_to_sec_fn(entries[i + 1]["start"]) if i + 1 < len(entries) else 1e9
+        next_start_time = starts[i + 1] if i + 1 < len(entries) else 1e9
         gap = next_start_time - end
 
         # Tiny gap padding: only a 50ms nudge to prevent subtitle flicker,
@@ -54,9 +100,8 @@ def normalize_and_fix_timing(
         # Overlap resolution: prefer trimming previous end rather than
         # advancing this start (advancing start causes audio/subtitle drift).
         if cleaned:
-            prev = cleaned[-1]
-            prev_start = parse_to_sec_fn(prev["start"])
-            prev_end = parse_to_sec_fn(prev["end"])
+            prev_start = out_starts[-1]
+            prev_end = out_ends[-1]
             if start < prev_end:
                 overlap = prev_end - start
                 if overlap <= small_overlap_sec:
@@ -65,7 +110,7 @@ def normalize_and_fix_timing(
                     desired_prev_end = start - sync_epsilon
                     min_prev_end = prev_start + min_prev_visible_duration
                     new_prev_end = max(min_prev_end, desired_prev_end)
-                    prev["end"] = format_time_fn(new_prev_end)
+                    out_ends[-1] = to_precision(new_prev_end)
 
                     # Pathological ordering fallback: previous starts at/after
                     # current start, so trimming cannot fully remove overlap.
@@ -79,7 +124,7 @@ def normalize_and_fix_timing(
                     desired_prev_end = start - sync_epsilon
                     min_prev_end = prev_start + min_prev_visible_duration
                     new_prev_end = max(min_prev_end, desired_prev_end)
-                    prev["end"] = format_time_fn(new_prev_end)
+                    out_ends[-1] = to_precision(new_prev_end)
 
                     # Last resort when overlap cannot be resolved by trimming
                     # previous end (pathological timestamp order).
@@ -88,21 +133,41 @@ def normalize_and_fix_timing(
                         if end - start < min_duration:
                             end = start + min_duration
 
-        entry["start"] = format_time_fn(start)
-        entry["end"] = format_time_fn(end)
         cleaned.append(entry)
+        out_starts.append(to_precision(start))
+        out_ends.append(to_precision(end))
 
-    return cleaned
+    if not merge_duplicates:
+        for entry, start, end in zip(cleaned, out_starts, out_ends):
+            entry["start"] = format_time_fn(start)
+            entry["end"] = format_time_fn(end)
+        return cleaned
+
+    deduped: List[Dict] = []
+    last_text = None
+    for entry, start, end in zip(cleaned, out_starts, out_ends):
+        text = entry["text"].strip()
+        if deduped and text == last_text:
+            deduped[-1]["end"] = format_time_fn(end)
+            continue
+        entry["start"] = format_time_fn(start)
+        entry["end"] = format_time_fn(end)
+        deduped.append(entry)
+        last_text = text
+    return deduped
 
 
 def deduplicate_consecutive_entries(cleaned: List[Dict]) -> List[Dict]:
     """Merge consecutive identical subtitle texts into a single entry."""
     deduped: List[Dict] = []
+    last_text = None
     for entry in cleaned:
-        if deduped and entry["text"].strip() == deduped[-1]["text"].strip():
+        text = entry["text"].strip()
+        if deduped and text == last_text:
             deduped[-1]["end"] = entry["end"]
             continue
         deduped.append(entry)
+        last_text = text
     return deduped
 
 
@@ -110,7 +175,7 @@ def postprocess_orphans_and_collocations(
     cleaned: List[Dict],
     max_chars: int,
     min_words: int = 5,
-    load_collocations_fn: Callable[[], Set[str]] = None,
+    load_collocations_fn: Callable[[], FrozenSet[Tuple[str, str]]] = None,
     remove_whisper_artifacts_fn: Callable[[str], str] = None,
     clean_bidi_fn: Callable[[str], str] = None,
     fix_persian_text_fn: Callable[[str], str] = None,
@@ -121,7 +186,7 @@ def postprocess_orphans_and_collocations(
     Enforces minimum word count regardless of preserve_timing to ensure display readability.
     Preserve_timing only affects timing normalization, not word count enforcement.
     """
-    collocations = load_collocations_fn() if load_collocations_fn else set()
+    collocations = load_collocations_fn() if load_collocations_fn else frozenset()
 
     final: List[Dict] = []
     i = 0
@@ -136,6 +201,16 @@ def postprocess_orphans_and_collocations(
     def safe_fix_persian(text: str) -> str:
         return fix_persian_text_fn(text) if fix_persian_text_fn else text
     
+    # Adaptive orphan limit:
+    # - For landscape (max_chars >= 30): use standard 60 chars to preserve segmentation parity.
+    # - For portrait (max_chars < 30): use strict geometric bounds to prevent overflow.
+    if max_chars >= 30:
+        orphan_max = 60
+    else:
+        orphan_max = int(max(max_chars * 1.2, max_chars + 4))
+    # Extra room allowed when merging to enforce min_words.
+    merge_limit = max_chars * 2 if max_chars >= 30 else max_chars + 20
+
     while i < len(cleaned):
         cur = cleaned[i]
         text = cur.get("text", "").strip()
@@ -149,13 +224,12 @@ def postprocess_orphans_and_collocations(
         # if current ends with standalone "می"/"نمی" and next starts with a word,
         # move next first token to current as a joined verb (e.g., "می" + "بره" -> "می\u200cبره").
         nxt = cleaned[i + 1] if i + 1 < len(cleaned) else None
-        if nxt:
-            ccur = safe_clean_bidi(cur.get("text", "")).strip()
-            cnxt = safe_clean_bidi(nxt.get("text", "")).strip()
-
-            parts = ccur.split()
-            nxt_parts = cnxt.split()
-            if parts and nxt_parts and parts[-1] in ("می", "نمی"):
+        # words is already the split of the cleaned current text; the next
+        # entry is only cleaned and split when the prefix is actually there.
+        if nxt and words and words[-1] in ("می", "نمی"):
+            parts = words
+            nxt_parts = safe_clean_bidi(nxt.get("text", "")).split()
+            if nxt_parts:
                 # In whisper-timing passthrough mode, avoid consuming an entire
                 # next cue because it would require timing merge.
                 if not (preserve_timing and len(nxt_parts) == 1):
@@ -181,20 +255,12 @@ def postprocess_orphans_and_collocations(
         if not preserve_timing and (len(words) <= 2 or len(ctext) < 12):
             prev = final[-1] if final else None
             merged_with_next = False
-            # Adaptive orphan limit:
-            # - For landscape (max_chars >= 30): use standard 60 chars to preserve segmentation parity.
-            # - For portrait (max_chars < 30): use strict geometric bounds to prevent overflow.
-            if max_chars >= 30:
-                orphan_max = 60
-            else:
-                orphan_max = int(max(max_chars * 1.2, max_chars + 4))
 
             if nxt:
                 cnxt_text = safe_clean_bidi(nxt["text"])
-                right_first = re.findall(r"[\w\u0600-\u06FF'-]+", cnxt_text)
+                right_first = _WORD_RE.search(cnxt_text)
                 if right_first:
-                    pair = f"{words[0].lower()} {right_first[0].lower()}"
-                    if pair in collocations:
+                    if (words[0].lower(), right_first.group().lower()) in collocations:
                         combined_clean = ctext + " " + cnxt_text
                         if len(combined_clean) <= orphan_max:
                             nxt["start"] = cur["start"]
@@ -224,7 +290,6 @@ def postprocess_orphans_and_collocations(
                 cnxt_text = safe_clean_bidi(nxt["text"])
                 combined_clean = ctext + " " + cnxt_text
                 # Allow extra chars for readability when merging to enforce min_words
-                merge_limit = max_chars * 2 if max_chars >= 30 else max_chars + 20
                 if len(combined_clean) <= merge_limit:
                     nxt["start"] = cur["start"]
                     nxt["text"] = combined_clean
@@ -236,7 +301,6 @@ def postprocess_orphans_and_collocations(
             if prev and not merged_with_next:
                 cprev = safe_clean_bidi(prev["text"])
                 combined_clean = cprev + " " + ctext
-                merge_limit = max_chars * 2 if max_chars >= 30 else max_chars + 20
                 if len(combined_clean) <= merge_limit:
                     prev["end"] = cur["end"]
                     prev["text"] = combined_clean
@@ -245,29 +309,16 @@ def postprocess_orphans_and_collocations(
 
         cur_text = cur.get("text", "").strip()
         if cur_text:
-            words_only = [w for w in re.findall(r"[\w\u0600-\u06FF'-]+", cur_text)]
-            if words_only:
-                rebuilt = cur_text
-                for left, right in zip(words_only, words_only[1:]):
-                    pair = f"{left.lower()} {right.lower()}"
-                    if pair in collocations:
-                        rebuilt = re.sub(
-                            re.escape(left) + r"\s+" + re.escape(right),
-                            left + "\u00A0" + right,
-                            rebuilt,
-                            flags=re.IGNORECASE,
-                        )
-                cur["text"] = rebuilt
+            cur["text"] = _bind_collocations(cur_text, collocations) if collocations else cur_text
 
         # Final Persian normalization pass for ZWNJ compounds.
         # Applies only when Persian/Arabic script is present.
-        if re.search(r"[\u0600-\u06FF]", cur.get("text", "")):
+        if _ARABIC_SCRIPT_RE.search(cur.get("text", "")):
             cur["text"] = safe_fix_persian(cur["text"])
 
         final.append(cur)
+        # Entries are only ever appended to final, so its length is the index.
+        cur["index"] = str(len(final))
         i += 1
 
-    for idx, entry in enumerate(final, 1):
-        entry["index"] = str(idx)
-
     return final
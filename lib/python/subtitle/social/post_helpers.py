@@ -1,11 +1,8 @@
+import importlib.util
 import re
 from typing import Optional, Tuple
 
-try:
-    from openai import OpenAI
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
+HAS_OPENAI = importlib.util.find_spec("openai") is not None
 
 
 def call_llm_for_post(
@@ -21,7 +18,7 @@ def call_llm_for_post(
     try:
         if not HAS_OPENAI:
             raise ImportError("OpenAI package required for DeepSeek post generation")
-        ds_client = OpenAI(api_key=processor.api_key, base_url="https://api.deepseek.com/v1")
+        ds_client = processor.deepseek_client
         resp = ds_client.chat.completions.create(
             model="deepseek-v4-flash",
             messages=[
@@ -0,0 +1,211 @@
+"""Unit tests for subtitle.cache.helpers module"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class TestTranslationCacheDb(unittest.TestCase):
+    """Test the SQLite-backed local translation cache"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_store_and_lookup_roundtrip(self):
+        """Stored translations are returned by key; unknown keys give None"""
+        from subtitle.cache import (
+            local_cache_key,
+            lookup_translation_cache_db,
+            open_translation_cache_db,
+            store_translation_cache_db,
+        )
+
+        conn = open_translation_cache_db(self.temp_dir / "translations.db")
+        self.assertIsNotNone(conn)
+        key = local_cache_key("Hello", "fa")
+        self.assertTrue(store_translation_cache_db(conn, [(key, "سلام")]))
+        self.assertEqual(lookup_translation_cache_db(conn, key), "سلام")
+        self.assertIsNone(lookup_translation_cache_db(conn, local_cache_key("Bye", "fa")))
+        conn.close()
+
+    def test_legacy_json_cache_is_migrated(self):
+        """Entries from the old JSON cache file are imported once, into the legacy table"""
+        from subtitle.cache import (
+            count_legacy_translations,
+            lookup_translation_cache_db_many,
+            open_translation_cache_db,
+        )
+
+        legacy = self.temp_dir / "translation_cache.json"
+        legacy.write_text(json.dumps({"abc": "ترجمه"}), encoding="utf-8")
+
+        conn = open_translation_cache_db(self.temp_dir / "translations.db", legacy_json_path=legacy)
+        self.assertEqual(lookup_translation_cache_db_many(conn, ["abc"], table="tx_legacy"), {"abc": "ترجمه"})
+        self.assertEqual(count_legacy_translations(conn), 1)
+        self.assertFalse(legacy.exists())
+        conn.close()
+
+    def test_legacy_rows_are_moved_once_and_rekeyed_on_hit(self):
+        """An unmarked database is moved to tx_legacy on open; hits move back under new keys"""
+        import sqlite3
+        from subtitle.cache import (
+            count_legacy_translations,
+            legacy_local_cache_key,
+            local_cache_key,
+            lookup_translation_cache_db,
+            open_translation_cache_db,
+            take_legacy_translations,
+        )
+
+        db_path = self.temp_dir / "translations.db"
+        old = sqlite3.connect(str(db_path))
+        old.execute("CREATE TABLE tx(key TEXT PRIMARY KEY, text TEXT)")
+        old.execute("INSERT INTO tx VALUES (?, ?)", (legacy_local_cache_key("Hello", "fa"), "سلام"))
+        old.commit()
+        old.close()
+
+        conn = open_translation_cache_db(db_path)
+        self.assertEqual(count_legacy_translations(conn), 1)
+        conn.close()
+        conn = open_translation_cache_db(db_path)
+        self.assertEqual(count_legacy_translations(conn), 1)
+
+        new_key = local_cache_key("Hello", "fa")
+        moved, remaining = take_legacy_translations(conn, {legacy_local_cache_key("Hello", "fa"): new_key})
+        self.assertEqual(moved, {new_key: "سلام"})
+        self.assertEqual(remaining, 0)
+        self.assertEqual(lookup_translation_cache_db(conn, new_key), "سلام")
+        conn.close()
+
+    def test_lookup_many_chunks_keys(self):
+        """Batch lookup resolves hits across multiple IN() chunks"""
+        from subtitle.cache import (
+            lookup_translation_cache_db_many,
+            open_translation_cache_db,
+            store_translation_cache_db,
+        )
+
+        conn = open_translation_cache_db(self.temp_dir / "translations.db")
+        store_translation_cache_db(conn, [(f"k{i}", f"v{i}") for i in range(0, 10, 2)])
+        found = lookup_translation_cache_db_many(conn, [f"k{i}" for i in range(10)], chunk_size=3)
+        self.assertEqual(found, {f"k{i}": f"v{i}" for i in range(0, 10, 2)})
+        conn.close()
+
+    def test_transcript_cache_follows_file_identity(self):
+        """A cached transcript is found again until the media file changes"""
+        from subtitle.cache import (
+            lookup_transcript_cache,
+            open_translation_cache_db,
+            store_transcript_cache,
+            transcript_cache_key,
+        )
+
+        video = self.temp_dir / "clip.mp4"
+        video.write_bytes(b"frames")
+        conn = open_translation_cache_db(self.temp_dir / "translations.db")
+
+        key = transcript_cache_key(str(video), "large-v3", "en")
+        self.assertNotEqual(key, transcript_cache_key(str(video), "large-v3", "fr"))
+        self.assertIsNone(lookup_transcript_cache(conn, key))
+        self.assertTrue(store_transcript_cache(conn, key, "en", "1\n00:00:00,000 --> 00:00:01,000\nHi\n"))
+        self.assertEqual(lookup_transcript_cache(conn, key)[0], "en")
+
+        video.write_bytes(b"other frames")
+        self.assertNotEqual(transcript_cache_key(str(video), "large-v3", "en"), key)
+        self.assertIsNone(transcript_cache_key(str(self.temp_dir / "missing.mp4")))
+        conn.close()
+
+
+class TestCreateBalancedBatches(unittest.TestCase):
+    """Test prefix-sum batch splitting"""
+
+    @staticmethod
+    def _reference(indices, texts, max_batch_size, max_chars):
+        batches, current, chars = [], [], 0
+        for idx in indices:
+            n = len(texts[idx])
+            if len(current) >= max_batch_size or (current and chars + n > max_chars):
+                batches.append(current)
+                current, chars = [], 0
+            current.append(idx)
+            chars += n
+        if current:
+            batches.append(current)
+        return batches
+
+    def test_matches_greedy_per_entry_split(self):
+        """Same batches as the greedy loop, including oversized single entries"""
+        import random
+        from subtitle.cache import create_balanced_batches
+
+        rng = random.Random(7)
+        texts = ["x" * rng.randint(0, 120) for _ in range(500)] + ["y" * 900]
+        indices = sorted(rng.sample(range(len(texts)), 300)) + [500]
+        for size, chars in ((25, 5000), (7, 300), (3, 100), (50, 1)):
+            self.assertEqual(
+                create_balanced_batches(indices, texts, size, chars),
+                self._reference(indices, texts, size, chars),
+            )
+        self.assertEqual(create_balanced_batches([], texts, 10), [])
+
+
+class TestCheckpointRoundtrip(unittest.TestCase):
+    """Test checkpoint save/load serialization"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_save_and_load_checkpoint(self):
+        """Checkpoint data survives a save/load cycle"""
+        from subtitle.cache import load_checkpoint, save_checkpoint
+        from subtitle.models import ProcessingCheckpoint, ProcessingStage
+
+        checkpoint = ProcessingCheckpoint(
+            video_path="/videos/talk.mp4",
+            stage=ProcessingStage.TRANSCRIPTION,
+            source_lang="en",
+            target_langs=["fa"],
+            timestamp=123.5,
+            data={"words": [{"start": 0.0, "end": 0.4, "word": "سلام"}]},
+        )
+        save_checkpoint(self.temp_dir, checkpoint)
+        loaded = load_checkpoint(self.temp_dir, "/videos/talk.mp4")
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded.stage, ProcessingStage.TRANSCRIPTION)
+        self.assertEqual(loaded.data, checkpoint.data)
+
+    def test_legacy_md5_checkpoint_is_still_found(self):
+        """Checkpoints written under the old MD5 name load and clear"""
+        from subtitle.cache import (
+            clear_checkpoint,
+            get_checkpoint_path,
+            legacy_checkpoint_path,
+            load_checkpoint,
+            save_checkpoint,
+        )
+        from subtitle.models import ProcessingCheckpoint, ProcessingStage
+
+        video = "/videos/old.mp4"
+        save_checkpoint(
+            self.temp_dir,
+            ProcessingCheckpoint(video, ProcessingStage.TRANSCRIPTION, "en", ["fa"], 1.0, {}),
+        )
+        get_checkpoint_path(self.temp_dir, video).rename(legacy_checkpoint_path(self.temp_dir, video))
+
+        self.assertEqual(load_checkpoint(self.temp_dir, video).video_path, video)
+        clear_checkpoint(self.temp_dir, video)
+        self.assertIsNone(load_checkpoint(self.temp_dir, video))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Unit tests for subtitle.concurrency rate limiting, batch and backpressure helpers"""
+import unittest
+from unittest.mock import patch
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test request pacing shared across threads"""
+
+    def test_calls_are_spaced_by_interval(self):
+        """Back-to-back waits are pushed onto consecutive slots"""
+        from subtitle.concurrency import RateLimiter
+
+        sleeps = []
+        with patch("subtitle.concurrency.rate_limit.time.monotonic", return_value=100.0), \
+                patch("subtitle.concurrency.rate_limit.time.sleep", side_effect=sleeps.append):
+            limiter = RateLimiter(4)
+            for _ in range(3):
+                limiter.wait()
+
+        self.assertEqual(sleeps, [0.25, 0.5])
+
+    def test_zero_rate_never_waits(self):
+        """AMIR_TRANSLATE_RPS=0 disables pacing"""
+        from subtitle.concurrency import RateLimiter, translate_request_rate
+
+        with patch.dict("os.environ", {"AMIR_TRANSLATE_RPS": "0"}):
+            limiter = RateLimiter(translate_request_rate())
+        with patch("subtitle.concurrency.rate_limit.time.sleep") as sleep:
+            limiter.wait()
+            limiter.wait()
+        sleep.assert_not_called()
+
+
+class TestRunBatches(unittest.TestCase):
+    """Test the shared concurrent batch runner"""
+
+    def test_every_batch_runs_and_errors_propagate(self):
+        """All batches are handed to fn with their index; a failure is re-raised"""
+        from subtitle.concurrency import run_batches
+
+        seen = {}
+        run_batches(lambda i, b: seen.__setitem__(i, b), [[1], [2, 3], [4]], workers=3)
+        self.assertEqual(seen, {0: [1], 1: [2, 3], 2: [4]})
+
+        def boom(i, b):
+            if i == 1:
+                raise RuntimeError("batch failed")
+
+        with self.assertRaises(RuntimeError):
+            run_batches(boom, [[1], [2], [3]], workers=2)
+
+
+class TestAIMDController(unittest.TestCase):
+    """Test the additive-increase / multiplicative-decrease backpressure"""
+
+    def test_throttle_halves_and_success_grows_back(self):
+        """A 429 halves the limit; fast successes add it back a little at a time"""
+        from subtitle.concurrency import AIMDController
+
+        bp = AIMDController(c_min=1, c_max=8, alpha=1.0, beta=0.5)
+        bp.on_error(RuntimeError("429 Too Many Requests"))
+        self.assertEqual(bp.limit, 4.0)
+        bp.on_error(ValueError("bad json"))
+        self.assertEqual(bp.limit, 4.0)
+
+        for _ in range(4):
+            bp.on_success(0.5)
+        self.assertGreater(bp.limit, 4.0)
+        self.assertLessEqual(bp.limit, 8.0)
+
+    def test_batch_budget_follows_latency_and_throttling(self):
+        """A window of fast successes widens batches by 10%; a throttle halves them"""
+        from subtitle.concurrency import AIMDController
+
+        bp = AIMDController(c_max=4, window=2)
+        bp.on_success(1.0)
+        bp.on_success(1.0)
+        self.assertEqual(bp.batch_char_budget(1000), 1100)
+        bp.on_error(RuntimeError("503 overloaded"))
+        self.assertEqual(bp.batch_char_budget(1000), 550)
+
+    def test_retry_after_floors_backoff(self):
+        """A Retry-After header on the error is honoured by next_backoff"""
+        from subtitle.concurrency import AIMDController
+
+        class _Resp:
+            status_code = 429
+            headers = {"retry-after": "30"}
+
+        class _Err(Exception):
+            response = _Resp()
+
+        bp = AIMDController(c_max=4)
+        bp.on_error(_Err("slow down"))
+        self.assertGreater(bp.next_backoff(1, base=1.0, cap=5.0), 25.0)
+        self.assertEqual(bp.limit, 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""Unit tests for subtitle.transcription.mlx_helpers module"""
+import subprocess
+import sys
+import unittest
+
+
+class TestIterWorkerOutputLines(unittest.TestCase):
+    """Test selector-based worker output streaming"""
+
+    def test_yields_stdout_lines_and_drains_stderr(self):
+        """Large stderr output cannot stall the worker; CR progress lines are split"""
+        from subtitle.transcription import iter_worker_output_lines
+
+        code = (
+            "import sys\n"
+            "sys.stderr.write('E' * 300000 + '\\n')\n"
+            "print('[00:00.000 --> 00:01.500] hello')\n"
+            "sys.stdout.write('step 1\\rstep 2\\r\\nlast')\n"
+            "sys.stderr.write('boom')\n"
+        )
+        proc = subprocess.Popen(
+            [sys.executable, "-u", "-c", code], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        stderr_tail = []
+        lines = list(iter_worker_output_lines(proc, stderr_tail))
+        proc.wait()
+
+        self.assertEqual(lines, ["[00:00.000 --> 00:01.500] hello", "step 1", "step 2", "last"])
+        self.assertEqual(stderr_tail[-1], "boom")
+
+
+class TestWordsFromWorkerPayload(unittest.TestCase):
+    """Test decoding of mlx_worker result files"""
+
+    def test_parallel_arrays_and_legacy_dicts_decode_alike(self):
+        """Packed arrays and the older per-word dicts give the same words"""
+        from subtitle.transcription import words_from_worker_payload
+
+        packed = {"language": "EN ", "starts": [0.0, 0.5], "ends": [0.4, 0.9], "texts": [" Hi", " there"]}
+        legacy = {"language": "en", "words": [
+            {"start": 0.0, "end": 0.4, "word": " Hi"}, {"start": 0.5, "end": 0.9, "word": " there"},
+        ]}
+        self.assertEqual(words_from_worker_payload(packed), words_from_worker_payload(legacy))
+        words, lang = words_from_worker_payload(packed)
+        self.assertEqual((lang, words[1].word, words[1].end), ("en", " there", 0.9))
+        self.assertEqual(words_from_worker_payload(legacy["words"])[1], "")
+
+
+class TestMLXWorker(unittest.TestCase):
+    """Test the persistent MLX worker client"""
+
+    def test_worker_process_is_reused_across_jobs(self):
+        """Two jobs go to the same process; release() without persistence stops it"""
+        import os
+        import tempfile
+        from unittest.mock import patch
+        from subtitle.transcription import MLX_WORKER_DONE, MLXWorker, iter_worker_output_lines
+
+        fake = (
+            "import json, os, sys\n"
+            "for raw in iter(sys.stdin.readline, ''):\n"
+            "    job = json.loads(raw)\n"
+            "    print(job['video_path'], os.getpid())\n"
+            "    print('WORKER_DONE ok', flush=True)\n"
+        )
+        with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as f:
+            f.write(fake)
+        self.addCleanup(os.remove, f.name)
+
+        def run_job(worker, path):
+            proc = worker.submit({"video_path": path})
+            seen = None
+            for line in iter_worker_output_lines(proc, []):
+                if line.startswith(MLX_WORKER_DONE):
+                    return seen, line.split()[1]
+                seen = line
+
+        with patch("subtitle.transcription.mlx_helpers.MLX_WORKER_SCRIPT", f.name):
+            worker = MLXWorker()
+            first, status = run_job(worker, 'a "quoted" path.mp4')
+            worker.release(status)
+            second, _ = run_job(worker, "b.mp4")
+            self.assertTrue(first.startswith('a "quoted" path.mp4 '))
+            self.assertEqual(first.rsplit(" ", 1)[1], second.rsplit(" ", 1)[1])
+
+            with patch.dict(os.environ, {"AMIR_MLX_PERSISTENT_WORKER": "0"}):
+                worker.release("ok")
+            self.assertFalse(worker.alive())
+
+    def test_jobs_are_serialized_until_release(self):
+        """A second submit() waits for the first job's release()"""
+        import threading
+        from unittest.mock import Mock, patch
+        from subtitle.transcription import MLXWorker
+
+        worker = MLXWorker()
+        submitted = threading.Event()
+        with patch.object(MLXWorker, "alive", return_value=True):
+            worker.proc = Mock()
+            worker.submit({"video_path": "a.mp4"})
+            t = threading.Thread(target=lambda: (worker.submit({"video_path": "b.mp4"}), submitted.set()))
+            t.start()
+            self.assertFalse(submitted.wait(0.2))
+            worker.release("ok")
+            self.assertTrue(submitted.wait(2))
+            worker.release("ok")
+        t.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""Unit tests for subtitle.sanitization.helpers module"""
+import unittest
+
+
+class TestNormalizeAndFixTiming(unittest.TestCase):
+    """Test min-duration, gap padding and overlap resolution"""
+
+    def test_overlap_checks_use_srt_precision(self):
+        """A trimmed end that rounds onto the next start does not push that start forward"""
+        from subtitle.io.srt_time import format_time, parse_to_sec
+        from subtitle.sanitization.helpers import normalize_and_fix_timing
+
+        times = [
+            ("00:00:11,986", "00:00:15,587"),
+            ("00:00:11,318", "00:00:14,737"),
+            ("00:00:10,366", "00:00:14,136"),
+            ("00:00:11,287", "00:00:14,772"),
+            ("00:00:12,256", "00:00:14,351"),
+        ]
+        entries = [{"start": s, "end": e, "text": "a"} for s, e in times]
+
+        result = normalize_and_fix_timing(entries, 0.5, parse_to_sec, format_time)
+
+        self.assertEqual(
+            [(e["start"], e["end"]) for e in result],
+            [
+                ("00:00:11,986", "00:00:12,046"),
+                ("00:00:12,056", "00:00:12,116"),
+                ("00:00:12,126", "00:00:12,186"),
+                ("00:00:12,196", "00:00:12,256"),
+                ("00:00:12,256", "00:00:14,351"),
+            ],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
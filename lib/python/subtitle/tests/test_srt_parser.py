@@ -0,0 +1,71 @@
+"""Unit tests for subtitle.io.srt_parser module"""
+import os
+import unittest
+
+
+class TestParseSrtContent(unittest.TestCase):
+    """Test the blank-line SRT parser"""
+
+    def test_parses_multiline_entries(self):
+        """Multi-line text is joined with spaces and timestamps are kept verbatim"""
+        from subtitle.io import parse_srt_content
+
+        content = (
+            "1\n00:00:01,000 --> 00:00:02,500\nHello\nworld\n\n"
+            "2\n00:00:03,000 --> 00:00:04,000\nسلام\n"
+        )
+        self.assertEqual(
+            parse_srt_content(content),
+            [
+                {"index": "1", "start": "00:00:01,000", "end": "00:00:02,500", "text": "Hello world"},
+                {"index": "2", "start": "00:00:03,000", "end": "00:00:04,000", "text": "سلام"},
+            ],
+        )
+
+    def test_handles_crlf_and_skips_malformed_blocks(self):
+        """CRLF line endings parse; blocks without a valid timing line are ignored"""
+        from subtitle.io import parse_srt_content
+
+        content = (
+            "1\r\n00:00:01,000 --> 00:00:02,000\r\nOne\r\n\r\n"
+            "garbage block\r\n\r\n"
+            "x\r\n00:00:03,000 --> 00:00:04,000\r\nBad index\r\n\r\n"
+            "3\r\n00:00:05,000 --> 00:00:06,000\r\nThree\r\n"
+        )
+        entries = parse_srt_content(content)
+        self.assertEqual([e["text"] for e in entries], ["One", "Three"])
+
+
+class TestValidateSrtFile(unittest.TestCase):
+    """Test the parity, language and repetition audit"""
+
+    def _write(self, texts):
+        import tempfile
+        from subtitle.io import write_srt_file
+
+        fd, path = tempfile.mkstemp(suffix=".srt")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        write_srt_file(path, [
+            {"start": f"00:00:{i % 60:02d},000", "end": f"00:00:{i % 60:02d},500", "text": t}
+            for i, t in enumerate(texts)
+        ])
+        return path
+
+    def test_rejects_repeated_line_and_accepts_varied_persian(self):
+        """A line repeated in over 5% of a long file fails; distinct Persian lines pass"""
+        from subtitle.config import has_target_language_chars
+        from subtitle.io import validate_srt_file
+
+        varied = [f"جمله شماره {i}" for i in range(60)]
+        path = self._write(varied)
+        self.assertTrue(validate_srt_file(path, 60, "fa", has_target_language_chars))
+
+        looping = varied[:50] + ["همان جمله"] * 10
+        path = self._write(looping)
+        self.assertFalse(validate_srt_file(path, 60, "fa", has_target_language_chars))
+        self.assertFalse(validate_srt_file(path, 61, "fa", has_target_language_chars))
+
+
+if __name__ == "__main__":
+    unittest.main()
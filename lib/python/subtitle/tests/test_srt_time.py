@@ -0,0 +1,21 @@
+"""Unit tests for subtitle.io.srt_time module"""
+import random
+import unittest
+
+
+class TestSrtPrecision(unittest.TestCase):
+    """Test that the arithmetic precision helper matches the SRT string round-trip"""
+
+    def test_to_srt_precision_matches_format_parse_roundtrip(self):
+        """to_srt_precision(x) == parse_to_sec(format_time(x)) for edge and random values"""
+        from subtitle.io.srt_time import format_time, parse_to_sec, to_srt_precision
+
+        rng = random.Random(0)
+        values = [0.0, -1.0, 0.0005, 0.9999999, 1.001, 59.9995, 3599.9999, 3600.0, 12.256]
+        values += [rng.uniform(0, 7200) for _ in range(2000)]
+        for sec in values:
+            self.assertEqual(to_srt_precision(sec), parse_to_sec(format_time(sec)), sec)
+
+
+if __name__ == '__main__':
+    unittest.main()
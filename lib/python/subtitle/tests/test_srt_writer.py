@@ -0,0 +1,121 @@
+"""Unit tests for subtitle.io.srt_writer module"""
+import os
+import tempfile
+import unittest
+
+
+class TestWriteSrt(unittest.TestCase):
+    """Test single-buffer SRT writing"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.entries = [
+            {"start": "00:00:01,000", "end": "00:00:02,000", "text": "Hello"},
+            {"start": "00:00:03,000", "end": "00:00:04,000", "text": "World"},
+        ]
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_write_srt_file_roundtrips_with_bom(self):
+        """Output starts with a UTF-8 BOM and parses back to the same entries"""
+        from subtitle.io import parse_srt_file, write_srt_file
+
+        path = os.path.join(self.temp_dir, "out.srt")
+        write_srt_file(path, self.entries)
+
+        with open(path, "rb") as f:
+            self.assertTrue(f.read().startswith(b"\xef\xbb\xbf1\n"))
+        parsed = parse_srt_file(path)
+        self.assertEqual([e["text"] for e in parsed], ["Hello", "World"])
+
+    def test_write_srt_text_matches_utf8_sig_codec(self):
+        """Explicit BOM + utf-8 body produces the same bytes as the utf-8-sig codec"""
+        from subtitle.io import write_srt_text
+
+        content = "1\n00:00:01,000 --> 00:00:02,000\nسلام\n\n"
+        ours = os.path.join(self.temp_dir, "ours.srt")
+        ref = os.path.join(self.temp_dir, "ref.srt")
+        write_srt_text(ours, content)
+        with open(ref, "w", encoding="utf-8-sig") as f:
+            f.write(content)
+
+        with open(ours, "rb") as a, open(ref, "rb") as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_translated_srt_falls_back_to_source_text(self):
+        """Missing or None translations keep the source line"""
+        from subtitle.io import format_translated_srt
+
+        self.assertEqual(
+            format_translated_srt(self.entries, [None]),
+            "1\n00:00:01,000 --> 00:00:02,000\nHello\n\n"
+            "2\n00:00:03,000 --> 00:00:04,000\nWorld\n\n",
+        )
+        self.assertIn("\nسلام\n", format_translated_srt(self.entries, ["سلام", "دنیا"]))
+
+    def test_precomputed_headers_match_inline_formatting(self):
+        """Reusing srt_headers gives the same document as formatting inline"""
+        from subtitle.io import format_srt, format_translated_srt, srt_headers
+
+        headers = srt_headers(self.entries)
+        self.assertEqual(headers[1], "2\n00:00:03,000 --> 00:00:04,000\n")
+        translated = ["Hallo", None]
+        self.assertEqual(
+            format_translated_srt(self.entries, translated, headers),
+            format_translated_srt(self.entries, translated),
+        )
+        self.assertEqual(format_translated_srt(self.entries, []), format_srt(self.entries))
+
+    def test_live_checkpoint_writes_every_n_updates(self):
+        """Batched checkpoint writes match a full rewrite and land every flush_every updates"""
+        from subtitle.io import LiveSrtCheckpoint, format_translated_srt
+
+        path = os.path.join(self.temp_dir, "live.srt")
+        translated = ["Hallo", None]
+        live = LiveSrtCheckpoint(path, self.entries, translated, flush_every=2)
+
+        translated[1] = "Welt"
+        live.update([1], translated)
+        self.assertFalse(os.path.exists(path))
+        live.update([], translated)
+        with open(path, "r", encoding="utf-8-sig") as f:
+            self.assertEqual(f.read(), format_translated_srt(self.entries, translated))
+
+        translated[0] = "Servus"
+        live.update([0], translated)
+        live.flush()
+        with open(path, "r", encoding="utf-8-sig") as f:
+            self.assertIn("\nServus\n", f.read())
+        self.assertFalse(os.path.exists(path + ".tmp"))
+
+    def test_live_checkpoint_writes_when_interval_elapsed(self):
+        """A slow batch is written at once when min_interval has passed since the last write"""
+        from subtitle.io import LiveSrtCheckpoint
+
+        path = os.path.join(self.temp_dir, "slow.srt")
+        translated = ["Hallo", None]
+        live = LiveSrtCheckpoint(path, self.entries, translated, flush_every=10, min_interval=0.0)
+        live.update([0], translated)
+        self.assertTrue(os.path.exists(path))
+
+    def test_live_checkpoint_factory_and_flush(self):
+        """No checkpoint without a path or entries; flush_live_checkpoint accepts None"""
+        from subtitle.io import flush_live_checkpoint, live_checkpoint
+
+        path = os.path.join(self.temp_dir, "factory.srt")
+        self.assertIsNone(live_checkpoint(None, self.entries))
+        self.assertIsNone(live_checkpoint(path, []))
+        flush_live_checkpoint(None)
+
+        translated = ["Hallo", None]
+        live = live_checkpoint(path, self.entries, translated)
+        live.update([0], translated)
+        flush_live_checkpoint(live)
+        with open(path, encoding="utf-8-sig") as f:
+            self.assertIn("\nHallo\n", f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
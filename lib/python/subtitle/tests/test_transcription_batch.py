@@ -0,0 +1,38 @@
+"""Unit tests for subtitle.transcription.batch module"""
+import unittest
+from unittest.mock import Mock, patch
+
+
+class TestTranscribeBatch(unittest.TestCase):
+    """Test multi-file transcription fan-out"""
+
+    def test_failures_map_to_none_and_duplicates_collapse(self):
+        """Every unique path gets an entry; a failing file does not abort the others"""
+        from subtitle.transcription import transcribe_batch
+
+        def fake_transcribe(path, lang, keep_model=False):
+            self.assertTrue(keep_model)
+            if path == "b.mp4":
+                raise RuntimeError("bad")
+            return path.replace(".mp4", "_en.srt")
+
+        processor = Mock()
+        processor.transcribe_video.side_effect = fake_transcribe
+
+        with patch.dict("os.environ", {"AMIR_WHISPER_SERVER": "1"}):
+            result = transcribe_batch(processor, ["a.mp4", "b.mp4", "c.mp4", "a.mp4"], max_workers=2)
+
+        self.assertEqual(result, {"a.mp4": "a_en.srt", "b.mp4": None, "c.mp4": "c_en.srt"})
+        self.assertEqual(processor.transcribe_video.call_count, 3)
+        processor.cleanup.assert_called_once_with()
+
+    def test_env_override_for_worker_count(self):
+        """AMIR_TRANSCRIBE_BATCH_WORKERS wins over device detection"""
+        from subtitle.transcription import default_batch_workers
+
+        with patch.dict("os.environ", {"AMIR_TRANSCRIBE_BATCH_WORKERS": "3"}):
+            self.assertEqual(default_batch_workers(), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
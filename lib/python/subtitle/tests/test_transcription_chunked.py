@@ -0,0 +1,48 @@
+"""Unit tests for subtitle.transcription.chunked module"""
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+
+class TestRunChunkedTranscription(unittest.TestCase):
+    """Test concurrent chunk transcription and in-order merging"""
+
+    def _model(self):
+        # Every chunk hears a word at its start and one in the 5s overlap, which the
+        # next chunk hears again as its first word.
+        def transcribe(path, **kw):
+            words = [SimpleNamespace(start=0.5, end=1.0, word=" a"), SimpleNamespace(start=100.5, end=101.0, word=" b")]
+            return iter([SimpleNamespace(words=words)]), SimpleNamespace(language="en")
+
+        model = Mock()
+        model.transcribe.side_effect = transcribe
+        return model
+
+    def test_parallel_chunks_merge_in_order_with_absolute_times(self):
+        """Chunk words are offset by their start and merged in chunk order"""
+        from subtitle.transcription import plan_chunks, run_chunked_transcription
+
+        self.assertEqual(plan_chunks(250, 100), [0.0, 100.0, 200.0])
+
+        processor = SimpleNamespace(logger=Mock(), initial_prompt="", temperature=0.0, use_vad=True)
+        with patch("subtitle.transcription.chunked.subprocess.run"):
+            words, lang = run_chunked_transcription(
+                processor, self._model(), "in.mp4", total_dur=250, chunk=100, overlap=5, language=None, workers=3
+            )
+
+        self.assertEqual(lang, "en")
+        self.assertEqual([w.start for w in words], [0.5, 100.5, 200.5, 300.5])
+
+    def test_word_loops_are_truncated(self):
+        """More than three identical consecutive words in a chunk are dropped"""
+        from subtitle.models import WordObj
+        from subtitle.transcription.chunked import _merge_chunk_words
+
+        all_words = []
+        looped = [WordObj(i, i + 0.5, " yes") for i in range(6)]
+        kept, removed = _merge_chunk_words(all_words, looped, set())
+        self.assertEqual((kept, removed), (3, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
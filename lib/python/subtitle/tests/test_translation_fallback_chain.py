@@ -0,0 +1,33 @@
+"""Unit tests for subtitle.translation.fallback_chain module"""
+import unittest
+from unittest.mock import Mock
+
+
+class TestBatchFallbackChain(unittest.TestCase):
+    """Test concurrent per-batch fallback translation"""
+
+    def test_concurrent_batches_fill_every_line(self):
+        """Duplicates are sent once and a failing model falls through to the next"""
+        from subtitle.translation.fallback_chain import translate_with_batch_fallback_chain
+
+        def fake_attempt(batch, target_lang, source_lang, model_name, batch_size, max_retries=2):
+            if model_name == "deepseek" and "b" in batch:
+                raise RuntimeError("boom")
+            return [f"{t}!" for t in batch]
+
+        processor = Mock()
+        processor.translate_concurrency = 3
+        processor._lookup_local_cache_many.return_value = {}
+        processor._create_balanced_batches.side_effect = lambda idx, texts, size: [[i] for i in idx]
+        processor.translate_batch_single_attempt.side_effect = fake_attempt
+
+        result = translate_with_batch_fallback_chain(processor, ["a", "b", "a", "c"], "fa")
+
+        self.assertEqual(result, ["a!", "b!", "a!", "c!"])
+        self.assertEqual(processor.translate_batch_single_attempt.call_count, 4)
+        # Every attempt is paced by the processor-wide limiter, not a per-call one.
+        self.assertEqual(processor.translate_limiter.wait.call_count, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+"""Unit tests for subtitle.translation.local_cache module"""
+import unittest
+from unittest.mock import Mock
+
+
+class TestLocalCacheHelpers(unittest.TestCase):
+    """Test cache prefill and per-batch storing shared by the pipelines"""
+
+    def test_fill_only_touches_empty_slots(self):
+        """Pre-filled slots are kept; hits are counted once per line"""
+        from subtitle.translation.local_cache import fill_from_local_cache
+
+        processor = Mock()
+        processor._lookup_local_cache_many.return_value = {"a": "A", "b": "B"}
+
+        final_result = ["x", None, None]
+        hits = fill_from_local_cache(processor, ["a", "b", "c"], "fa", final_result)
+
+        self.assertEqual(hits, 1)
+        self.assertEqual(final_result, ["x", "B", None])
+        processor._lookup_local_cache_many.assert_called_once_with(["b", "c"], "fa")
+        processor._add_cost_savings.assert_called_once_with("local_cache_hits", 1)
+
+    def test_store_skips_source_echoes(self):
+        """Lines kept as source text are not cached, so they are retried later"""
+        from subtitle.translation.local_cache import store_batch_in_local_cache
+
+        processor = Mock()
+        store_batch_in_local_cache(processor, ["hi", "bye", "ok"], ["سلام", "bye", ""], "fa")
+
+        processor._store_local_cache.assert_called_once_with("hi", "fa", "سلام")
+        processor._save_local_translation_cache.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+"""Unit tests for subtitle.translation.parser module"""
+import unittest
+
+
+class TestParseTranslatedBatchOutput(unittest.TestCase):
+    """Test JSON and numbered-line parsing of model output"""
+
+    def test_fenced_json_with_persian_digit_keys(self):
+        """Code fences are stripped and Persian-digit keys map to positions"""
+        from subtitle.io.srt_time import normalize_digits
+        from subtitle.translation.parser import parse_translated_batch_output
+
+        output = '```json\n{"۱": " سلام ", "۲": "دنیا"}\n```'
+        self.assertEqual(
+            parse_translated_batch_output(output, 2, normalize_digits),
+            ["سلام", "دنیا"],
+        )
+
+    def test_non_standard_json_and_numbered_lines(self):
+        """NaN values parse as with the stdlib; plain numbered lists still work"""
+        from subtitle.io.srt_time import normalize_digits
+        from subtitle.translation.parser import parse_translated_batch_output
+
+        self.assertEqual(
+            parse_translated_batch_output('{"1": "a", "2": NaN}', 2, normalize_digits),
+            ["a", "nan"],
+        )
+        self.assertEqual(
+            parse_translated_batch_output("۱. one\n2) two\ncontinued", 2, normalize_digits),
+            ["one", "two continued"],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
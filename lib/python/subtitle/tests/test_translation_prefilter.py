@@ -0,0 +1,66 @@
+"""Unit tests for subtitle.translation.prefilter module"""
+import unittest
+from unittest.mock import Mock
+
+
+class TestPrefillUntranslatable(unittest.TestCase):
+    """Test the pre-API filter for markup-only and already-translated lines"""
+
+    def test_markup_and_persian_lines_are_filled(self):
+        """Numbers, tags and pure Persian lines are filled; English and mixed lines are kept for the API"""
+        from subtitle.translation.prefilter import prefill_untranslatable
+
+        processor = Mock()
+        processor.fix_persian_text.side_effect = lambda t: f"<{t}>"
+        texts = ["1,500!", r"{\an8}...", "سلام دنیا", "Hello", "سلام John", "", "kept"]
+        final_result = [None, None, None, None, None, None, "done"]
+
+        filled = prefill_untranslatable(processor, texts, "en", "fa", final_result)
+
+        self.assertEqual(filled, 4)
+        self.assertEqual(
+            final_result,
+            ["1,500!", r"{\an8}...", "<سلام دنیا>", None, None, "", "done"],
+        )
+
+    def test_same_script_pair_still_translates(self):
+        """Arabic to Persian shares a script, so Arabic lines are not skipped"""
+        from subtitle.translation.prefilter import prefill_untranslatable
+
+        final_result = [None, None]
+        filled = prefill_untranslatable(Mock(), ["مرحبا", "42"], "ar", "fa", final_result)
+
+        self.assertEqual(filled, 1)
+        self.assertEqual(final_result, [None, "42"])
+
+    def test_overlapping_scripts_still_translate(self):
+        """Japanese kanji fall in the Chinese range, but kana mark the line as source text"""
+        from subtitle.translation.prefilter import prefill_untranslatable
+
+        final_result = [None, None]
+        filled = prefill_untranslatable(Mock(), ["今日は良い天気ですね", "你好世界"], "ja", "zh", final_result)
+
+        self.assertEqual(filled, 1)
+        self.assertEqual(final_result, [None, "你好世界"])
+
+
+class TestDedupeSourceLines(unittest.TestCase):
+    """Test whole-file deduplication of pending source lines"""
+
+    def test_repeats_are_sent_once_and_fanned_out(self):
+        """Only first occurrences are kept, in order; their translation is copied to repeats"""
+        from subtitle.translation.prefilter import dedupe_source_lines, fan_out_duplicates
+
+        texts = ["Yeah", "Hello", " Yeah ", "Thanks", "Hello", "Yeah"]
+        kept, repeats = dedupe_source_lines(texts, [0, 1, 2, 3, 4, 5])
+        self.assertEqual(kept, [0, 1, 3])
+        self.assertEqual(repeats, {0: [2, 5], 1: [4]})
+
+        final_result = ["آره", None, None, "ممنون", None, None]
+        copied = fan_out_duplicates(final_result, repeats, [0, 1, 3])
+        self.assertEqual(copied, [2, 5])
+        self.assertEqual(final_result, ["آره", None, "آره", "ممنون", None, "آره"])
+
+
+if __name__ == '__main__':
+    unittest.main()
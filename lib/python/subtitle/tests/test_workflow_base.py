@@ -54,6 +54,38 @@ class TestResolveWorkflowBase(unittest.TestCase):
         self.assertIn('fa', ctx['target_langs'])
         self.assertIn('es', ctx['target_langs'])
     
+    def test_reuses_existing_srt_assets(self):
+        """Test existing *_<lang>.srt files resolve the canonical base, including fuzzy stems"""
+        from subtitle.workflow.base import resolve_workflow_base
+
+        video_path = os.path.join(self.temp_dir, "test.mp4")
+        Path(video_path).touch()
+        Path(os.path.join(self.temp_dir, "test_en.srt")).write_text("1\n")
+
+        ctx = resolve_workflow_base(
+            self.mock_processor,
+            video_path=video_path,
+            source_lang='en',
+            target_langs=['fa'],
+            post_only=False,
+            render_resolution=None,
+        )
+        self.assertEqual(ctx['original_base'], os.path.join(self.temp_dir, "test"))
+
+        fuzzy_video = os.path.join(self.temp_dir, "Other Clip.mp4")
+        Path(fuzzy_video).touch()
+        Path(os.path.join(self.temp_dir, "Other-Clip_fa.srt")).write_text("1\n")
+
+        ctx = resolve_workflow_base(
+            self.mock_processor,
+            video_path=fuzzy_video,
+            source_lang='en',
+            target_langs=['fa'],
+            post_only=False,
+            render_resolution=None,
+        )
+        self.assertEqual(ctx['original_base'], os.path.join(self.temp_dir, "Other-Clip"))
+
     def test_srt_input_detection(self):
         """Test SRT file input detection"""
         from subtitle.workflow.base import resolve_workflow_base
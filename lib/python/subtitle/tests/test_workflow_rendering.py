@@ -172,5 +172,131 @@ class TestRenderingStageIntegration(unittest.TestCase):
         self.assertTrue(self.mock_processor.logger.info.called or True)
 
 
+class TestFindUpToDateRender(unittest.TestCase):
+    """Test the idempotent re-run check"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.base = os.path.join(self.temp_dir, "clip")
+        self.video = self.base + ".mp4"
+        self.output = f"{self.base}_720p_q65_subbed.mp4"
+        for path, size in (
+            (self.video, 10),
+            (f"{self.base}_en.srt", 10),
+            (f"{self.base}_fa.srt", 10),
+            (f"{self.base}_fa_en.ass", 10),
+            (self.output, 4096),
+        ):
+            with open(path, "wb") as f:
+                f.write(b"x" * size)
+        os.utime(self.video, (1000, 1000))
+        os.utime(self.output, (3000, 3000))
+        for name in ("_en.srt", "_fa.srt", "_fa_en.ass"):
+            os.utime(self.base + name, (2000, 2000))
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _check(self, render_signature=None):
+        from subtitle.workflow import find_up_to_date_render
+
+        return find_up_to_date_render(
+            Mock(),
+            original_base=self.base,
+            video_path=self.video,
+            source_lang="en",
+            target_langs=["fa", "en"],
+            render_resolution=720,
+            render_quality=65,
+            get_default_quality_fn=Mock(return_value=65),
+            render_signature=render_signature,
+        )
+
+    def test_current_render_returns_sidecars(self):
+        """A fresh output yields the SRT/ASS/video result map"""
+        result = self._check()
+        self.assertEqual(result["rendered_video"], self.output)
+        self.assertEqual(result["fa"], f"{self.base}_fa.srt")
+        self.assertEqual(result["ass_file"], f"{self.base}_fa_en.ass")
+
+    def test_stale_or_missing_pieces_force_full_run(self):
+        """A newer target SRT or a missing ASS disables the shortcut"""
+        os.utime(f"{self.base}_fa.srt", (4000, 4000))
+        self.assertIsNone(self._check())
+        os.utime(f"{self.base}_fa.srt", (2000, 2000))
+        os.remove(f"{self.base}_fa_en.ass")
+        self.assertIsNone(self._check())
+
+    def test_changed_render_options_force_full_run(self):
+        """The shortcut needs the sidecar written with the same style/render options"""
+        from types import SimpleNamespace
+        from subtitle.workflow import render_options_signature
+
+        proc = SimpleNamespace(style_config="style-a")
+        sig = render_options_signature(proc, {"subtitle_logo": None, "subtitle_shift": 0.0})
+        self.assertIsNone(self._check(sig))
+
+        with open(os.path.join(self.temp_dir, f".{os.path.basename(self.output)}.render"), "w") as f:
+            f.write(sig)
+        self.assertIsNotNone(self._check(sig))
+
+        changed = render_options_signature(proc, {"subtitle_logo": None, "subtitle_shift": 0.5})
+        self.assertNotEqual(changed, sig)
+        self.assertIsNone(self._check(changed))
+        self.assertNotEqual(render_options_signature(SimpleNamespace(style_config="style-b"),
+                                                     {"subtitle_logo": None, "subtitle_shift": 0.0}), sig)
+
+    def test_render_signature_tracks_fonts_not_geometry(self):
+        """Persian font settings change the hash; in-place geometry tweaks to style_config do not"""
+        import dataclasses
+        from types import SimpleNamespace
+        from subtitle.models import STYLE_PRESETS
+        from subtitle.workflow import render_options_signature
+
+        style = dataclasses.replace(next(iter(STYLE_PRESETS.values())))
+        proc = SimpleNamespace(style_config=style, _configured_style=dataclasses.replace(style),
+                               fa_font_name="Vazirmatn", fa_font_scale=1.0, en_font_scale=1.0, sec_font_size=18)
+        opts = {"subtitle_shift": 0.0}
+        sig = render_options_signature(proc, opts)
+
+        proc.style_config.font_size = 40
+        proc.style_config.max_chars = 30
+        self.assertEqual(render_options_signature(proc, opts), sig)
+
+        for attr, value in (("fa_font_name", "B Nazanin"), ("fa_font_scale", 1.2), ("sec_font_size", 22)):
+            changed = SimpleNamespace(**{**vars(proc), attr: value})
+            self.assertNotEqual(render_options_signature(changed, opts), sig, attr)
+
+
+class TestFinalizeSplitParts(unittest.TestCase):
+    """Test renaming of --split chunks produced from the partial render"""
+
+    def test_parts_take_the_final_name(self):
+        """Hidden partial chunks are renamed next to the output; unrelated files are left alone"""
+        from subtitle.workflow.rendering import _finalize_split_parts
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            partial = os.path.join(temp_dir, ".clip_subbed.partial.mp4")
+            output = os.path.join(temp_dir, "clip_subbed.mp4")
+            for name in (".clip_subbed.partial_part001.mp4", ".clip_subbed.partial_part002.mp4", "other_part001.mp4"):
+                open(os.path.join(temp_dir, name), "wb").close()
+
+            renamed = _finalize_split_parts(partial, output)
+
+            self.assertEqual(renamed, [
+                os.path.join(temp_dir, "clip_subbed_part001.mp4"),
+                os.path.join(temp_dir, "clip_subbed_part002.mp4"),
+            ])
+            self.assertEqual(
+                sorted(os.listdir(temp_dir)),
+                ["clip_subbed_part001.mp4", "clip_subbed_part002.mp4", "other_part001.mp4"],
+            )
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 if __name__ == '__main__':
     unittest.main()
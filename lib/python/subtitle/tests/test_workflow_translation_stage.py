@@ -77,6 +77,95 @@ class TestRunTranslationStage(unittest.TestCase):
         self.assertIsNotNone(result)
 
 
+    def _fanout_processor(self, fail_lang=None):
+        entries = [
+            {'index': 1, 'start': '00:00:00,000', 'end': '00:00:05,000', 'text': 'Hello'},
+            {'index': 2, 'start': '00:00:05,000', 'end': '00:00:10,000', 'text': 'World'},
+        ]
+        processor = Mock()
+        processor.logger = Mock()
+        processor.llm_choice = 'deepseek'
+        processor.fail_on_translation_error = True
+        processor.parse_srt = Mock(return_value=entries)
+        processor._ingest_partial_srt = Mock(return_value={})
+
+        def fake_translate(texts, tgt, source_lang, **kwargs):
+            if tgt == fail_lang:
+                raise RuntimeError("provider down")
+            return [f"{tgt}:{t}" for t in texts]
+
+        processor.translate_with_batch_fallback_chain = Mock(side_effect=fake_translate)
+        return processor
+
+    @patch.dict(os.environ, {'AMIR_SUBTITLE_SEMANTIC_QC': '0'})
+    def test_translation_stage_fans_out_target_languages(self):
+        """Test every pending target is translated and written concurrently"""
+        from subtitle.workflow.translation_stage import run_translation_stage
+
+        processor = self._fanout_processor()
+        base = os.path.join(self.temp_dir, "video")
+        result = {}
+        run_translation_stage(
+            processor,
+            result=result,
+            source_lang='en',
+            target_langs=['en', 'de', 'es'],
+            src_srt=base + "_en.srt",
+            original_base=base,
+            force=False,
+            emit_progress=Mock(),
+            migrate_legacy_resolution_srt_fn=Mock(),
+        )
+
+        processor.parse_srt.assert_called_once()
+        self.assertEqual(set(result), {'de', 'es'})
+        for lang in ('de', 'es'):
+            content = Path(result[lang]).read_text(encoding='utf-8-sig')
+            self.assertIn(f"{lang}:Hello", content)
+            self.assertIn(f"{lang}:World", content)
+
+    @patch.dict(os.environ, {'AMIR_SUBTITLE_SEMANTIC_QC': '0'})
+    def test_translation_stage_reraises_worker_failure(self):
+        """Test a failed target re-raises when fail_on_translation_error is set"""
+        from subtitle.workflow.translation_stage import run_translation_stage
+
+        processor = self._fanout_processor(fail_lang='es')
+        base = os.path.join(self.temp_dir, "video")
+        with self.assertRaises(RuntimeError):
+            run_translation_stage(
+                processor,
+                result={},
+                source_lang='en',
+                target_langs=['de', 'es'],
+                src_srt=base + "_en.srt",
+                original_base=base,
+                force=False,
+                emit_progress=Mock(),
+                migrate_legacy_resolution_srt_fn=Mock(),
+            )
+
+    def test_translation_stage_source_parse_failure_follows_flag(self):
+        """Test an unreadable source SRT is logged per target and only re-raised when the flag is set"""
+        from subtitle.workflow.translation_stage import run_translation_stage
+
+        base = os.path.join(self.temp_dir, "video")
+        kwargs = dict(
+            result={}, source_lang='en', target_langs=['de', 'es'], src_srt=base + "_en.srt",
+            original_base=base, force=False, emit_progress=Mock(), migrate_legacy_resolution_srt_fn=Mock(),
+        )
+        processor = self._fanout_processor()
+        processor.parse_srt.side_effect = OSError("unreadable")
+        processor.fail_on_translation_error = False
+
+        run_translation_stage(processor, **kwargs)
+        self.assertEqual(processor.logger.error.call_count, 2)
+        processor.translate_with_batch_fallback_chain.assert_not_called()
+
+        processor.fail_on_translation_error = True
+        with self.assertRaises(OSError):
+            run_translation_stage(processor, **kwargs)
+
+
 class TestTranslationStageIntegration(unittest.TestCase):
     """Integration tests for translation stage"""
     
@@ -1,60 +1,73 @@
 import re
+from functools import lru_cache
+
+
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([\.!؟،؛])")
+_ARABIC_SCRIPT_RE = re.compile(r"[\u0600-\u06FF]")
+_LATIN_WORD_RE = re.compile(r"[a-zA-Z]{2,}")
+
+# Formal → informal verb forms, matched in one alternation (longest form first).
+_INFORMAL = {
+    "می‌باشند": "هستن",
+    "می‌باشد": "هست",
+}
+_INFORMAL_RE = re.compile(r"\b(" + "|".join(_INFORMAL) + r")\b")
+
+# Applied in order: later rules rely on spacing produced by earlier ones.
+# Each rule carries a literal its pattern cannot match without, so lines
+# that lack it skip the regex entirely.
+_ZWNJ_RULES = [
+    (needle, re.compile(p), r)
+    for needle, p, r in (
+        # Plural suffix with space: "کتاب ها" -> "کتاب‌ها"
+        ("ها", r"([\u0600-\u06FF]+)(\s+)(ها)(\s|$)", "\\1\u200c\\3\\4"),
 
+        # Verb prefix joins (spaced): "می رود" / "نمی دانم"
+        ("می", r"\b(ن?می)\s+([\u0600-\u06FF])", "\\1\u200c\\2"),
 
+        # Compounds with space: "کوچک کننده" / "تبعیض آمیز"
+        ("کنند", r"([\u0600-\u06FF]+)\s+(کننده|کنندگان|کنندگی)\b", "\\1\u200c\\2"),
+        ("آمیز", r"([\u0600-\u06FF]+)\s+(آمیز)\b", "\\1\u200c\\2"),
+        # Compounds stuck without space: "کوچککننده" / "تبعیضآمیز"
+        ("کنند", r"([\u0600-\u06FF]{2,})(کننده|کنندگان|کنندگی)\b", "\\1\u200c\\2"),
+        ("آمیز", r"([\u0600-\u06FF]{2,})(آمیز)\b", "\\1\u200c\\2"),
+    )
+]
+
+_BIDI_CONTROLS = dict.fromkeys(
+    map(ord, "\u200f\u200e\u200d\u202b\u202a\u202c\u202e\u202d\u2067\u2066\u2069")
+)
+# clean_bidi's subset: the isolates (LRI/RLI/PDI) are left alone there.
+_BIDI_MARKS = dict.fromkeys(map(ord, "\u200f\u200e\u200d\u202b\u202a\u202c\u202e\u202d"))
+_LEADING_PUNCT = ".!:،؛؟"
+_LEADING_PUNCT_RE = re.compile(r"^([.!:،؛؟]+)(.+)$")
+_LATIN_PAREN_RE = re.compile(r"(\([A-Za-z][^)]*\))")
+
+_LRI = "\u2066"
+_PDI = "\u2069"
+_RLI = "\u2067"
+
+
+@lru_cache(maxsize=4096)
 def fix_persian_text(text: str) -> str:
     if not text:
         return text
 
-    text = re.sub(r"\s+([\.!؟،؛])", r"\1", text)
+    text = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", text)
+    if "باش" in text:
+        text = _INFORMAL_RE.sub(lambda m: _INFORMAL[m.group(1)], text)
 
-    informal = {
-        r"\bمی‌باشند\b": "هستن",
-        r"\bمی‌باشد\b": "هست",
-    }
-    for p, r in informal.items():
-        text = re.sub(p, r, text)
+    for needle, pat, repl in _ZWNJ_RULES:
+        if needle in text:
+            text = pat.sub(repl, text)
 
-    zwnj_patterns = [
-        # Plural suffix with space: "کتاب ها" -> "کتاب‌ها"
-        (r"([\u0600-\u06FF]+)(\s+)(ها)(\s|$)", "\\1\u200c\\3\\4"),
+    text = text.translate(_BIDI_CONTROLS).strip()
+    if text and text[0] in _LEADING_PUNCT:
+        text = _LEADING_PUNCT_RE.sub(r"\2\1", text)
 
-        # Verb prefix joins (spaced): "می رود" / "نمی دانم"
-        (r"\b(ن?می)\s+([\u0600-\u06FF])", "\\1\u200c\\2"),
-
-        # Compounds with space: "کوچک کننده" / "تبعیض آمیز"
-        (r"([\u0600-\u06FF]+)\s+(کننده|کنندگان|کنندگی)\b", "\\1\u200c\\2"),
-        (r"([\u0600-\u06FF]+)\s+(آمیز)\b", "\\1\u200c\\2"),
-        # Compounds stuck without space: "کوچککننده" / "تبعیضآمیز"
-        (r"([\u0600-\u06FF]{2,})(کننده|کنندگان|کنندگی)\b", "\\1\u200c\\2"),
-        (r"([\u0600-\u06FF]{2,})(آمیز)\b", "\\1\u200c\\2"),
-    ]
-    for pat, repl in zwnj_patterns:
-        text = re.sub(pat, repl, text)
-
-    for _cp in (
-        "\u200f",
-        "\u200e",
-        "\u200d",
-        "\u202b",
-        "\u202a",
-        "\u202c",
-        "\u202e",
-        "\u202d",
-        "\u2067",
-        "\u2066",
-        "\u2069",
-    ):
-        text = text.replace(_cp, "")
-
-    text = text.strip()
-    text = re.sub(r"^([.!:،؛؟]+)(.+)$", r"\2\1", text)
-
-    _LRI = "\u2066"
-    _PDI = "\u2069"
-    _RLI = "\u2067"
-    text = re.sub(r"(\([A-Za-z][^)]*\))", _LRI + r"\1" + _PDI, text)
-    text = _RLI + text + _PDI
-    return text
+    if "(" in text:
+        text = _LATIN_PAREN_RE.sub(_LRI + r"\1" + _PDI, text)
+    return _RLI + text + _PDI
 
 
 def strip_english_echo(text: str) -> str:
@@ -62,19 +75,15 @@ def strip_english_echo(text: str) -> str:
     if not text:
         return text
 
-    persian_start = -1
-    for i, c in enumerate(text):
-        if "\u0600" <= c <= "\u06FF":
-            persian_start = i
-            break
-
-    if persian_start < 0:
+    match = _ARABIC_SCRIPT_RE.search(text)
+    if match is None:
         return text
+    persian_start = match.start()
     if persian_start == 0:
         return text
 
     prefix = text[:persian_start]
-    if re.search(r"[a-zA-Z]{2,}", prefix):
+    if _LATIN_WORD_RE.search(prefix):
         return text[persian_start:].strip()
     return text
 
@@ -83,15 +92,6 @@ def clean_bidi(t: str) -> str:
     """Strip BiDi directional control chars. Preserves ZWNJ (\u200C)."""
     if not t:
         return ""
-    for cp in (
-        "\u200f",
-        "\u200e",
-        "\u200d",
-        "\u202b",
-        "\u202a",
-        "\u202c",
-        "\u202e",
-        "\u202d",
-    ):
-        t = t.replace(cp, "")
-    return t.strip()
+    if t.isascii():
+        return t.strip()
+    return t.translate(_BIDI_MARKS).strip()
@@ -4,13 +4,21 @@ from .server import (
     is_whisper_server_ready,
     whisper_server_enabled,
 )
+from .batch import cuda_device_count, default_batch_workers, transcribe_batch
+from .chunked import chunk_workers, plan_chunks, run_chunked_transcription
 from .mlx_helpers import (
-    build_mlx_worker_script,
+    MLX_WORKER_DONE,
+    MLX_WORKER_DURATION,
+    MLXWorker,
     cleanup_paths,
     flush_partial_entries,
+    get_mlx_worker,
+    iter_worker_output_lines,
+    mlx_worker_persistent,
     parse_verbose_segment_line,
     parse_whisper_progress_time,
     resolve_mlx_repo_path,
+    words_from_worker_payload,
 )
 
 __all__ = [
@@ -19,9 +27,21 @@ __all__ = [
     "is_whisper_server_ready",
     "ensure_whisper_server",
     "resolve_mlx_repo_path",
-    "build_mlx_worker_script",
     "parse_whisper_progress_time",
     "parse_verbose_segment_line",
     "flush_partial_entries",
+    "iter_worker_output_lines",
+    "MLX_WORKER_DONE",
+    "MLX_WORKER_DURATION",
+    "MLXWorker",
+    "get_mlx_worker",
+    "mlx_worker_persistent",
+    "words_from_worker_payload",
     "cleanup_paths",
+    "cuda_device_count",
+    "default_batch_workers",
+    "transcribe_batch",
+    "chunk_workers",
+    "plan_chunks",
+    "run_chunked_transcription",
 ]
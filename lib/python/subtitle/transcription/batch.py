@@ -0,0 +1,66 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from .server import whisper_server_enabled
+
+
+def cuda_device_count() -> int:
+    """Number of visible CUDA devices (0 without torch or CUDA)."""
+    try:
+        import torch
+
+        return int(torch.cuda.device_count()) if torch.cuda.is_available() else 0
+    except Exception:
+        return 0
+
+
+def default_batch_workers() -> int:
+    """Concurrent transcriptions worth running on this machine.
+
+    One per CUDA device (the faster-whisper model is replicated across them);
+    CPU CTranslate2 and the MLX worker already saturate their hardware with a
+    single job. AMIR_TRANSCRIBE_BATCH_WORKERS overrides.
+    """
+    val = os.environ.get("AMIR_TRANSCRIBE_BATCH_WORKERS", "").strip()
+    if val:
+        try:
+            return max(1, int(val))
+        except ValueError:
+            pass
+    return max(1, cuda_device_count())
+
+
+def transcribe_batch(
+    processor,
+    video_paths: List[str],
+    language: str = "auto",
+    max_workers: Optional[int] = None,
+) -> Dict[str, Optional[str]]:
+    """Transcribe several files, concurrently where the hardware allows.
+
+    Returns {video_path: srt_path}; a file whose transcription fails maps to
+    None and is logged, so one bad input does not sink the batch. The shared
+    model stays loaded across files and is unloaded once at the end.
+    """
+    paths = list(dict.fromkeys(video_paths))
+    workers = min(len(paths), max_workers or default_batch_workers())
+
+    def _one(path: str) -> Optional[str]:
+        try:
+            return processor.transcribe_video(path, language, keep_model=True)
+        except Exception as e:
+            processor.logger.error(f"❌ Transcription failed for {os.path.basename(path)}: {e}")
+            return None
+
+    try:
+        if workers <= 1:
+            return {path: _one(path) for path in paths}
+
+        if not whisper_server_enabled():
+            # Load the (multi-GPU) model once up front so the threads share it.
+            _ = processor.model
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transcribe") as pool:
+            return dict(zip(paths, pool.map(_one, paths)))
+    finally:
+        processor.cleanup()
@@ -0,0 +1,183 @@
+import gc
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from subtitle.models import WordObj
+
+from .batch import cuda_device_count
+
+
+def chunk_workers(low_ram: bool = False) -> int:
+    """Chunks transcribed concurrently for one file.
+
+    Two by default, so ffmpeg extracts the next chunk while the model decodes
+    the current one; one per GPU on multi-GPU hosts (the model is replicated
+    per device). Low-RAM mode stays sequential. AMIR_WHISPER_CHUNK_WORKERS
+    overrides.
+    """
+    val = os.environ.get("AMIR_WHISPER_CHUNK_WORKERS", "").strip()
+    if val:
+        try:
+            return max(1, int(val))
+        except ValueError:
+            pass
+    if low_ram:
+        return 1
+    return max(2, cuda_device_count())
+
+
+def plan_chunks(total_dur: float, chunk: float) -> List[float]:
+    """Start offsets of fixed-size chunks covering total_dur seconds."""
+    starts = [0.0]
+    while starts[-1] + chunk < total_dur:
+        starts.append(starts[-1] + chunk)
+    return starts
+
+
+def _transcribe_chunk(model, video_path: str, start: float, span: float, kw: Dict) -> Tuple[str, List[WordObj]]:
+    """Extract [start, start+span) as WAV and transcribe it; word times are absolute."""
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+        tmp_wav = f.name
+    try:
+        cmd = [
+            'ffmpeg', '-y', '-i', video_path,
+            '-ss', str(start), '-t', str(span),
+            '-q:a', '0', '-vn', '-f', 'wav', tmp_wav
+        ]
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+        segments, info = model.transcribe(tmp_wav, **kw)
+        # segments is lazy: consume it while the WAV still exists.
+        words = [
+            WordObj(w.start + start, w.end + start, w.word)
+            for seg in segments if seg.words
+            for w in seg.words
+        ]
+        return str(getattr(info, 'language', '') or '').strip().lower(), words
+    finally:
+        try:
+            os.remove(tmp_wav)
+        except OSError:
+            pass
+
+
+def _merge_chunk_words(all_words: List[WordObj], chunk_words: Iterable[WordObj], seen_ends: Set[float]) -> Tuple[int, int]:
+    """Append a chunk's words, skipping the overlap and truncating word loops.
+
+    Returns (kept, removed_as_loop).
+    """
+    fresh: List[WordObj] = []
+    for w in chunk_words:
+        # De-duplicate words from overlap window
+        key = round(w.end, 2)
+        if key in seen_ends:
+            continue
+        seen_ends.add(key)
+        fresh.append(w)
+
+    kept = fresh
+    # Per-chunk word-loop detection: if the same word appears
+    # >=4 times consecutively in this chunk's output, truncate.
+    if len(fresh) > 4:
+        kept = []
+        run_count = 1
+        for wobj in fresh:
+            if kept and wobj.word.strip().lower() == kept[-1].word.strip().lower():
+                run_count += 1
+            else:
+                run_count = 1
+            if run_count <= 3:
+                kept.append(wobj)
+
+    all_words.extend(kept)
+    return len(kept), len(fresh) - len(kept)
+
+
+def run_chunked_transcription(
+    processor,
+    model,
+    video_path: str,
+    total_dur: float,
+    chunk: float,
+    overlap: float,
+    language: Optional[str],
+    low_ram: bool = False,
+    workers: Optional[int] = None,
+    use_vad: Optional[bool] = None,
+) -> Tuple[List[WordObj], str]:
+    """Transcribe video_path in overlapping fixed-size chunks with faster-whisper + VAD.
+
+    With a known duration the chunk plan is fixed up front, so chunks are
+    transcribed concurrently (see chunk_workers) and merged back in order.
+    Without one, chunks run sequentially until one yields no words.
+    use_vad defaults to processor.use_vad.
+    Raises on ffmpeg/model errors; the caller decides on the fallback.
+    """
+    kw = dict(
+        word_timestamps=True,
+        initial_prompt=processor.initial_prompt or "Clear punctuation and case sensitivity.",
+        temperature=processor.temperature,
+        vad_filter=processor.use_vad if use_vad is None else use_vad,
+        vad_parameters=dict(min_silence_duration_ms=700, speech_pad_ms=400),
+    )
+    if language:
+        kw['language'] = language
+
+    all_words: List[WordObj] = []
+    detected_lang = ''
+    seen_ends: Set[float] = set()
+
+    def _merge(chunk_idx: int, end: float, lang: str, words: List[WordObj]) -> int:
+        nonlocal detected_lang
+        if chunk_idx == 0 and not detected_lang:
+            detected_lang = lang
+        kept, removed = _merge_chunk_words(all_words, words, seen_ends)
+        if removed:
+            processor.logger.warning(f"⚠️ Removed {removed} looped words in chunk {chunk_idx+1}")
+        pct = int((end / total_dur) * 100) if total_dur > 0 else 0
+        processor.logger.info(f"PROGRESS:{5 + int(pct * 0.44)}:🎙️ VAD Transcription ({pct}%)")
+        processor.logger.info(f"  ✅ Chunk {chunk_idx+1}: +{kept} words (total {len(all_words)})")
+        if low_ram:
+            gc.collect()
+        return kept
+
+    if total_dur <= 0:
+        start = 0.0
+        chunk_idx = 0
+        while True:
+            lang, words = _transcribe_chunk(model, video_path, start, chunk + overlap, kw)
+            if _merge(chunk_idx, start + chunk, lang, words) == 0:
+                # No more audio
+                break
+            chunk_idx += 1
+            start += chunk
+        return all_words, detected_lang
+
+    starts = plan_chunks(total_dur, chunk)
+    ends = [min(s + chunk, total_dur) for s in starts]
+
+    def _job(i: int) -> Tuple[str, List[WordObj]]:
+        return _transcribe_chunk(model, video_path, starts[i], ends[i] - starts[i] + overlap, kw)
+
+    n_workers = min(len(starts), workers or chunk_workers(low_ram))
+    if n_workers <= 1:
+        results: Iterator[Tuple[str, List[WordObj]]] = map(_job, range(len(starts)))
+        for i, (lang, words) in enumerate(results):
+            _merge(i, ends[i], lang, words)
+        return all_words, detected_lang
+
+    with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="whisper-chunk") as pool:
+        futures = [pool.submit(_job, i) for i in range(len(starts))]
+        try:
+            # Merge strictly in chunk order: overlap de-duplication depends on it.
+            for i, future in enumerate(futures):
+                lang, words = future.result()
+                _merge(i, ends[i], lang, words)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return all_words, detected_lang
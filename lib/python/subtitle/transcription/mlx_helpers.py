@@ -1,6 +1,34 @@
+import atexit
+import codecs
+import json
 import os
 import re
-from typing import List, Optional, Tuple
+import selectors
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from subtitle.models import WordObj
+
+MLX_WORKER_SCRIPT = str(Path(__file__).parent.parent / "mlx_worker.py")
+MLX_WORKER_DONE = "WORKER_DONE"
+MLX_WORKER_DURATION = "AMIR_DURATION:"
+
+# Run the worker through the import machinery so its bytecode is cached in
+# __pycache__; `python3 mlx_worker.py` would re-parse the source every start.
+_MLX_WORKER_BOOTSTRAP = (
+    "import importlib.util, sys; "
+    "spec = importlib.util.spec_from_file_location('__main__', sys.argv[1]); "
+    "spec.loader.exec_module(importlib.util.module_from_spec(spec))"
+)
+
+
+# Both parsers run on every line the worker prints; compile them once.
+_MLX_TIME_RE = re.compile(r"-->\s+\[?(\d+:)?(\d+):(\d+)[\.,](\d+)\]?")
+_MLX_SEGMENT_RE = re.compile(
+    r"\[(?:(\d+):)?(\d+):(\d+[\.,]\d+)\s+-->\s+(?:(\d+):)?(\d+):(\d+[\.,]\d+)\]\s*(.*)"
+)
 
 
 def resolve_mlx_repo_path(model_name: str) -> str:
@@ -14,65 +42,11 @@ def resolve_mlx_repo_path(model_name: str) -> str:
     return f"mlx-community/whisper-{model_name}-mlx"
 
 
-def build_mlx_worker_script(repo_path: str, language: str, video_path: str, result_json_path: str) -> str:
-    """Build isolated Python worker script that runs mlx transcription."""
-    return f"""
-import os
-import sys
-import json
-
-def run():
-    try:
-        import mlx_whisper
-        import mlx.core as mx
-
-        try:
-            mx.set_cache_limit(1024 * 1024 * 512)
-        except:
-            pass
-
-        kwargs = {{
-            "path_or_hf_repo": "{repo_path}",
-            "word_timestamps": True,
-            "verbose": True,
-            "condition_on_previous_text": False,
-            "no_speech_threshold": 0.6,
-            "logprob_threshold": -1.0,
-            "compression_ratio_threshold": 2.4,
-            "temperature": (0.0, 0.2, 0.4, 0.6, 0.8),
-        }}
-        if "{language}":
-            kwargs["language"] = "{language}"
-        result = mlx_whisper.transcribe("{video_path}", **kwargs)
-
-        simplified = []
-        for segment in result.get('segments', []):
-            if 'words' in segment:
-                for w in segment['words']:
-                    simplified.append({{'start': w['start'], 'end': w['end'], 'word': w['word']}})
-
-        payload = {{"language": result.get("language", ""), "words": simplified}}
-        with open("{result_json_path}", "w", encoding="utf-8") as f:
-            json.dump(payload, f)
-
-        try:
-            mx.clear_cache()
-        except:
-            pass
-        os._exit(0)
-
-    except Exception as e:
-        print(f"WORKER_ERROR: {{e}}")
-        os._exit(1)
-
-if __name__ == "__main__":
-    run()
-"""
-
-
 def parse_whisper_progress_time(line: str) -> Optional[float]:
     """Parse current timestamp from whisper verbose log line."""
-    match = re.search(r"-->\s+\[?(\d+:)?(\d+):(\d+)[\.,](\d+)\]?", line)
+    if "-->" not in line:
+        return None
+    match = _MLX_TIME_RE.search(line)
     if not match:
         return None
 
@@ -87,10 +61,7 @@ def parse_whisper_progress_time(line: str) -> Optional[float]:
 
 def parse_verbose_segment_line(raw: str) -> Optional[Tuple[float, float, str]]:
     """Extract (start_s, end_s, text) from whisper verbose segment line."""
-    match = re.match(
-        r"\[(?:(\d+):)?(\d+):(\d+[\.,]\d+)\s+-->\s+(?:(\d+):)?(\d+):(\d+[\.,]\d+)\]\s*(.*)",
-        raw.strip(),
-    )
+    match = _MLX_SEGMENT_RE.match(raw.strip())
     if not match:
         return None
 
@@ -104,6 +75,22 @@ def parse_verbose_segment_line(raw: str) -> Optional[Tuple[float, float, str]]:
     )
 
 
+def words_from_worker_payload(payload: Any) -> Tuple[List[WordObj], str]:
+    """Build WordObj list and detected language from an mlx_worker result.
+
+    The worker writes parallel "starts"/"ends"/"texts" arrays, which zip
+    straight into WordObj without a dict per word. Older per-word dict
+    payloads ({"words": [...]} or a bare list) are still accepted.
+    """
+    if not isinstance(payload, dict):
+        return [WordObj(w['start'], w['end'], w['word']) for w in payload or []], ''
+
+    lang = str(payload.get('language', '') or '').strip().lower()
+    if 'starts' in payload:
+        return list(map(WordObj, payload['starts'], payload['ends'], payload['texts'])), lang
+    return [WordObj(w['start'], w['end'], w['word']) for w in payload.get('words', [])], lang
+
+
 def to_srt_tc(sec: float) -> str:
     """Convert seconds to SRT timestamp format."""
     h = int(sec // 3600)
@@ -126,6 +113,147 @@ def flush_partial_entries(partial_entries: List[Tuple[float, float, str]], parti
         pf.write("\n".join(lines))
 
 
+def iter_worker_output_lines(
+    proc,
+    stderr_tail: List[str],
+    tail_limit: int = 200,
+    chunk_size: int = 65536,
+) -> Iterator[str]:
+    """Yield stdout lines of a binary-pipe worker while draining its stderr.
+
+    Both pipes are multiplexed with selectors on the calling thread, so a
+    chatty stderr can never fill up and stall the worker. CR-terminated
+    progress updates count as lines, like text-mode readline. The last
+    tail_limit stderr lines are kept in stderr_tail.
+    """
+    sel = selectors.DefaultSelector()
+    decoders = {}
+    pending = {}
+    for stream in (proc.stdout, proc.stderr):
+        if stream is not None:
+            sel.register(stream, selectors.EVENT_READ)
+            decoders[stream] = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            pending[stream] = ""
+    try:
+        while sel.get_map():
+            for key, _ in sel.select(timeout=1.0):
+                stream = key.fileobj
+                data = os.read(key.fd, chunk_size)
+                if data:
+                    text = pending[stream] + decoders[stream].decode(data)
+                    text = text.replace("\r\n", "\n").replace("\r", "\n")
+                    *lines, pending[stream] = text.split("\n")
+                else:
+                    sel.unregister(stream)
+                    tail = pending[stream] + decoders[stream].decode(b"", final=True)
+                    lines = [tail] if tail else []
+                if stream is proc.stdout:
+                    yield from lines
+                elif lines:
+                    stderr_tail.extend(lines)
+                    del stderr_tail[:-tail_limit]
+    finally:
+        sel.close()
+
+
+def mlx_worker_persistent() -> bool:
+    """Whether the MLX worker (and its loaded model) outlives a single job."""
+    return os.environ.get("AMIR_MLX_PERSISTENT_WORKER", "1") not in ("0", "false", "False")
+
+
+class MLXWorker:
+    """Client for the long-lived mlx_worker.py process.
+
+    Jobs are JSON lines on the worker's stdin; the caller drains stdout with
+    iter_worker_output_lines until a MLX_WORKER_DONE line, then calls
+    release(). The process (and the model mlx-whisper keeps loaded) is
+    reused across videos unless AMIR_MLX_PERSISTENT_WORKER=0.
+
+    One job runs at a time: submit() takes a per-worker lock that release()
+    gives back, so concurrent callers queue instead of interleaving their
+    stdin/stdout. Every submit() must be paired with release(), also when
+    submit() raises.
+    """
+
+    def __init__(self):
+        self.proc: Optional[subprocess.Popen] = None
+        self._job_lock = threading.Lock()
+
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def _start(self) -> None:
+        self.proc = subprocess.Popen(
+            ["python3", "-u", "-c", _MLX_WORKER_BOOTSTRAP, MLX_WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    def submit(self, job: Dict[str, Any]) -> subprocess.Popen:
+        """Send one job, (re)starting the worker if needed; returns the process to read from."""
+        payload = (json.dumps(job) + "\n").encode("utf-8")
+        self._job_lock.acquire()
+        for attempt in range(2):
+            if not self.alive():
+                self.close()
+                self._start()
+            try:
+                self.proc.stdin.write(payload)
+                self.proc.stdin.flush()
+                return self.proc
+            except (BrokenPipeError, OSError):
+                if attempt:
+                    raise
+                self.close()
+        return self.proc
+
+    def release(self, status: Optional[str]) -> None:
+        """Finish a job; keep the worker only if it completed cleanly and persistence is on."""
+        try:
+            if status is None:
+                # Interrupted or crashed mid-job: its output stream is no longer in sync.
+                self.close(kill=True)
+            elif not mlx_worker_persistent():
+                self.close()
+        finally:
+            self._job_lock.release()
+
+    def close(self, kill: bool = False, timeout: float = 10.0) -> None:
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            if kill:
+                proc.kill()
+            elif proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        for stream in (proc.stdin, proc.stdout, proc.stderr):
+            try:
+                if stream:
+                    stream.close()
+            except OSError:
+                pass
+
+
+_mlx_worker: Optional[MLXWorker] = None
+_mlx_worker_lock = threading.Lock()
+
+
+def get_mlx_worker() -> MLXWorker:
+    """Return the process-wide MLX worker client (closed at interpreter exit)."""
+    global _mlx_worker
+    with _mlx_worker_lock:
+        if _mlx_worker is None:
+            _mlx_worker = MLXWorker()
+            atexit.register(_mlx_worker.close)
+        return _mlx_worker
+
+
 def cleanup_paths(paths: List[str]) -> None:
     """Best-effort cleanup of temporary files."""
     for path in paths:
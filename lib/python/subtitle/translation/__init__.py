@@ -1,5 +1,6 @@
 from .parser import parse_translated_batch_output
 from .fallback_chain import translate_with_batch_fallback_chain
+from .prompt import build_translation_prompt
 from .postfix import apply_final_target_text_fixes
 from .resegment import resegment_translation
 from .single_attempt import translate_batch_single_attempt
@@ -13,6 +14,7 @@ from .minimax_pipeline import run_minimax_translation_pipeline
 
 __all__ = [
 	"parse_translated_batch_output",
+	"build_translation_prompt",
 	"translate_batch_single_attempt",
 	"translate_with_batch_fallback_chain",
 	"validate_and_retry_translations",
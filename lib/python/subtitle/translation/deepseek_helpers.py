@@ -1,5 +1,7 @@
 from typing import Dict, List, Optional
 
+from subtitle.io import write_translated_srt_file
+
 
 def build_contextual_batch_text(texts: List[str], target_indices: List[int]) -> str:
     """Build numbered translation payload with nearby non-translated context lines."""
@@ -32,13 +34,14 @@ def write_partial_translation_srt(
     output_srt: Optional[str],
     original_entries: Optional[List[Dict]],
     final_result: List[Optional[str]],
+    headers: Optional[List[str]] = None,
 ) -> None:
-    """Persist current translation state to output SRT as checkpoint."""
+    """Persist current translation state to output SRT as checkpoint.
+
+    Pass headers from srt_headers(original_entries) when checkpointing
+    repeatedly so the timing lines are formatted only once.
+    """
     if not output_srt or not original_entries:
         return
 
-    with open(output_srt, "w", encoding="utf-8-sig") as f:
-        for idx_srt, entry in enumerate(original_entries, 1):
-            trans = final_result[idx_srt - 1]
-            t_text = trans if trans is not None else entry["text"]
-            f.write(f"{idx_srt}\n{entry['start']} --> {entry['end']}\n{t_text}\n\n")
+    write_translated_srt_file(output_srt, original_entries, final_result, headers)
@@ -1,16 +1,18 @@
+import importlib.util
 import time
 from typing import Dict, List, Optional
 
-try:
-    from openai import OpenAI
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
 from tqdm import tqdm
 
+from subtitle.concurrency import run_batches
 from subtitle.config import has_target_language_chars
+from subtitle.io import flush_live_checkpoint, live_checkpoint
 
 from .deepseek_helpers import build_contextual_batch_text, write_partial_translation_srt
+from .local_cache import fill_from_local_cache
+from .prefilter import dedupe_source_lines, fan_out_duplicates, prefill_untranslatable
+
+HAS_OPENAI = importlib.util.find_spec("openai") is not None
 
 
 def run_deepseek_translation_pipeline(
@@ -24,12 +26,20 @@ def run_deepseek_translation_pipeline(
     existing_translations: Optional[Dict[int, str]] = None,
     has_gemini: bool = False,
 ) -> List[str]:
-    """DeepSeek-first translation pipeline with per-batch Gemini fallback."""
+    """DeepSeek-first translation pipeline with per-batch Gemini fallback.
+
+    Batches are numbered multi-line prompts dispatched concurrently
+    (processor.translate_concurrency workers) and paced by the processor's
+    shared translate_limiter; lines missing from a reply are retried on their
+    own until the batch is complete. Lines already in the local translation
+    cache, markup-only lines and lines already in the target script are never
+    sent, and repeated lines are sent once.
+    """
     if not texts or target_lang == source_lang:
         return texts
 
     indices = list(range(len(texts)))
-    client = OpenAI(api_key=processor.api_key, base_url='https://api.deepseek.com/v1')
+    client = processor.deepseek_client
 
     final_result = [None] * len(texts)
     if existing_translations:
@@ -37,15 +47,40 @@ def run_deepseek_translation_pipeline(
             if 0 <= idx < len(final_result) and txt and txt.strip():
                 final_result[idx] = txt
 
+    local_hits = fill_from_local_cache(processor, texts, target_lang, final_result)
+    local_hits += prefill_untranslatable(processor, texts, source_lang, target_lang, final_result)
+
     indices_to_translate = [i for i in indices if final_result[i] is None]
     if not indices_to_translate:
+        if local_hits:
+            write_partial_translation_srt(output_srt, original_entries, final_result)
         return [final_result[i] if final_result[i] is not None else texts[i] for i in range(len(texts))]
 
+    # Identical source lines are translated once and copied to their repeats
+    indices_to_translate, repeats = dedupe_source_lines(texts, indices_to_translate)
+
     batch_indices_list = processor._create_balanced_batches(indices_to_translate, texts, batch_size)
     batch_count = len(batch_indices_list)
     pbar = tqdm(total=len(indices), unit='item', desc=f'  Translating ({target_lang.upper()})')
+    pbar.update(len(indices) - len(indices_to_translate) - sum(map(len, repeats.values())))
+
+    # Batches own disjoint indices of final_result; only the checkpoint is shared
+    # (it locks internally and rewrites the file every few batches, not every batch).
+    live = live_checkpoint(output_srt, original_entries, final_result)
+
+    limiter = processor.translate_limiter
 
-    for i, batch_indices in enumerate(batch_indices_list):
+    def _save_partial(changed: List[int]) -> None:
+        copied = fan_out_duplicates(final_result, repeats, changed)
+        pbar.update(len(copied))
+        if live is None:
+            return
+        try:
+            live.update(list(changed) + copied, final_result)
+        except Exception:
+            pass
+
+    def _translate_batch(i: int, batch_indices: List[int]) -> None:
         batch = [texts[idx] for idx in batch_indices]
         pbar.set_postfix({'batch': f'{i + 1}/{batch_count}'})
 
@@ -65,6 +100,7 @@ def run_deepseek_translation_pipeline(
             selected_model = 'deepseek-v4-flash'
             
             try:
+                limiter.wait()
                 response = client.chat.completions.create(
                     model=selected_model,
                     messages=[
@@ -101,33 +137,25 @@ def run_deepseek_translation_pipeline(
 
                     raw_t = str(trans)
                     if target_lang == 'fa':
-                        if not any('\u0600' <= c <= '\u06FF' for c in raw_t):
+                        if not has_target_language_chars(raw_t, 'fa'):
                             continue
                         val = processor.fix_persian_text(processor.strip_english_echo(raw_t))
                     else:
                         val = raw_t
 
                     final_result[abs_idx] = val
+                    processor._store_local_cache(texts[abs_idx], target_lang, val)
                     successful_indices.append(abs_idx)
 
                 missing_indices = [idx for idx in current_target_indices if idx not in successful_indices]
 
                 if successful_indices:
                     pbar.update(len(successful_indices))
-
-                if successful_indices and output_srt and original_entries:
-                    try:
-                        write_partial_translation_srt(
-                            output_srt=output_srt,
-                            original_entries=original_entries,
-                            final_result=final_result,
-                        )
-                    except Exception:
-                        pass
+                    processor._save_local_translation_cache()
+                    _save_partial(successful_indices)
 
                 if not missing_indices:
                     success_batch = True
-                    time.sleep(1)
                     break
 
                 current_target_indices = missing_indices
@@ -155,9 +183,7 @@ def run_deepseek_translation_pipeline(
                     f'⚠️ DeepSeek batch {i+1} failed ({last_error_msg}). Switching to Gemini for this batch...'
                 )
                 try:
-                    from google import genai as _genai
-
-                    gclient = _genai.Client(api_key=processor.google_api_key)
+                    gclient = processor.gemini_client
                     models = processor._get_available_gemini_models(gclient)
                     prompt = f"{processor.get_translation_prompt(target_lang)}\n\nLines to translate:\n{batch_text}"
                     for model in models[:3]:
@@ -176,15 +202,7 @@ def run_deepseek_translation_pipeline(
                             if len(tlist) >= len(batch):
                                 for rel_idx, trans in enumerate(tlist[: len(batch)]):
                                     final_result[batch_indices[rel_idx]] = trans
-                                if output_srt and original_entries:
-                                    try:
-                                        write_partial_translation_srt(
-                                            output_srt=output_srt,
-                                            original_entries=original_entries,
-                                            final_result=final_result,
-                                        )
-                                    except Exception:
-                                        pass
+                                _save_partial(batch_indices)
                                 pbar.update(len(batch))
                                 gemini_ok = True
                                 processor.logger.info(f'✅ Gemini saved batch {i+1} via {model}')
@@ -196,8 +214,16 @@ def run_deepseek_translation_pipeline(
 
             if not gemini_ok:
                 processor.logger.error(f'❌ TERMINATING: Batch {i+1} failed on both DeepSeek and Gemini.')
-                pbar.close()
                 raise RuntimeError(f'Translation halted: batch {i+1} failed — DeepSeek: {last_error_msg}')
 
-    pbar.close()
+    try:
+        run_batches(
+            _translate_batch, batch_indices_list,
+            getattr(processor, 'translate_concurrency', 4), thread_name_prefix='deepseek',
+        )
+    finally:
+        pbar.close()
+        flush_live_checkpoint(live)
+
     return final_result
+
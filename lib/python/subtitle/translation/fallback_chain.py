@@ -1,9 +1,14 @@
-import time
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from tqdm import tqdm
 
+from subtitle.concurrency import run_batches
+from subtitle.io import flush_live_checkpoint, live_checkpoint, write_translated_srt_file
+
+from .local_cache import fill_from_local_cache
+
 
 def translate_with_batch_fallback_chain(
     processor,
@@ -14,7 +19,11 @@ def translate_with_batch_fallback_chain(
     output_srt: Optional[str] = None,
     existing_translations: Optional[Dict[int, str]] = None,
 ) -> List[str]:
-    """Translate texts using per-batch model fallback with cache and dedup."""
+    """Translate texts using per-batch model fallback with cache and dedup.
+
+    Batches run concurrently (processor.translate_concurrency workers) and
+    share the processor's RateLimiter instead of sleeping after every batch.
+    """
     if not texts or target_lang == source_lang:
         return texts
 
@@ -33,16 +42,7 @@ def translate_with_batch_fallback_chain(
             if 0 <= idx < len(final_result) and txt and txt.strip():
                 final_result[idx] = txt
 
-    local_hits = 0
-    for i, text in enumerate(texts):
-        if final_result[i] is None:
-            cached = processor._lookup_local_cache(text, target_lang)
-            if cached:
-                final_result[i] = cached
-                local_hits += 1
-    if local_hits:
-        processor._cost_savings["local_cache_hits"] += local_hits
-        processor.logger.info(f"💾 Local cache: {local_hits} translations reused (100% cost saved)")
+    fill_from_local_cache(processor, texts, target_lang, final_result)
 
     indices_to_translate = [i for i in range(len(texts)) if final_result[i] is None]
     if not indices_to_translate:
@@ -50,10 +50,7 @@ def translate_with_batch_fallback_chain(
         result_texts = [final_result[i] if final_result[i] is not None else texts[i] for i in range(len(texts))]
         if output_srt and original_entries:
             try:
-                with open(output_srt, "w", encoding="utf-8-sig") as f:
-                    for idx_srt, entry in enumerate(original_entries, 1):
-                        t_text = result_texts[idx_srt - 1] if idx_srt - 1 < len(result_texts) else entry["text"]
-                        f.write(f"{idx_srt}\n{entry['start']} --> {entry['end']}\n{t_text}\n\n")
+                write_translated_srt_file(output_srt, original_entries, result_texts)
                 processor.logger.info(f"✓ Cache-only save completed: {Path(output_srt).name}")
             except Exception as e:
                 processor.logger.warning(f"Failed to save cache-only SRT: {e}")
@@ -77,7 +74,15 @@ def translate_with_batch_fallback_chain(
 
     pbar = tqdm(total=len(unique_texts), unit="item", desc=f"  Translating ({target_lang.upper()}) [Fallback Chain]")
 
-    for batch_num, batch_indices in enumerate(batch_indices_list):
+    # Batches own disjoint unique texts, so their final_result writes never
+    # collide; the checkpoint, progress counter and rate limiter are shared.
+    live = live_checkpoint(output_srt, original_entries, final_result)
+    limiter = processor.translate_limiter
+    progress_lock = threading.Lock()
+    done_batches = 0
+
+    def _translate_batch(batch_num: int, batch_indices: List[int]) -> None:
+        nonlocal done_batches
         batch = [unique_texts[idx] for idx in batch_indices]
         success_batch = False
 
@@ -89,6 +94,7 @@ def translate_with_batch_fallback_chain(
                 batch_size = batch_sizes[model_name]
                 pbar.set_postfix_str(f"Batch {batch_num + 1}/{batch_count} via {model_name.upper()}")
 
+                limiter.wait()
                 trans_list = processor.translate_batch_single_attempt(
                     batch,
                     target_lang,
@@ -98,29 +104,30 @@ def translate_with_batch_fallback_chain(
                     max_retries=2,
                 )
 
+                changed: List[int] = []
                 for rel_idx, trans in enumerate(trans_list):
                     unique_text = batch[rel_idx]
                     processor._store_local_cache(unique_text, target_lang, trans)
                     for abs_idx in unique_text_map.get(unique_text, []):
                         final_result[abs_idx] = trans
+                        changed.append(abs_idx)
+                # One cache transaction per batch keeps progress durable without per-line fsyncs.
+                processor._save_local_translation_cache()
 
-                if output_srt and original_entries:
+                if live is not None:
                     try:
-                        with open(output_srt, "w", encoding="utf-8-sig") as f:
-                            for idx, entry in enumerate(original_entries, 1):
-                                trans = final_result[idx - 1]
-                                t_text = trans if trans is not None else entry["text"]
-                                f.write(f"{idx}\n{entry['start']} --> {entry['end']}\n{t_text}\n\n")
+                        live.update(changed, final_result)
                     except Exception as e:
                         pbar.write(f"⚠️ Could not save intermediate SRT: {e}")
 
                 pbar.update(len(batch))
                 success_batch = True
 
-                done_frac = (batch_num + 1) / max(1, batch_count)
-                batch_pct = int(55 + done_frac * 22)
-                processor.logger.info(f"PROGRESS:{batch_pct}:🌐 Translation ({batch_num+1}/{batch_count})")
-                time.sleep(1)
+                with progress_lock:
+                    done_batches += 1
+                    done = done_batches
+                batch_pct = int(55 + done / max(1, batch_count) * 22)
+                processor.logger.info(f"PROGRESS:{batch_pct}:🌐 Translation ({done}/{batch_count})")
 
             except Exception as e:
                 error_msg = f"{type(e).__name__}: {str(e)}"
@@ -143,6 +150,14 @@ def translate_with_batch_fallback_chain(
                         final_result[abs_idx] = unique_text
             pbar.update(len(batch))
 
+    try:
+        run_batches(
+            _translate_batch, batch_indices_list,
+            getattr(processor, "translate_concurrency", 4), thread_name_prefix="fallback-chain",
+        )
+    finally:
+        flush_live_checkpoint(live)
+
     pbar.close()
     processor._save_local_translation_cache()
     processor._log_cost_savings()
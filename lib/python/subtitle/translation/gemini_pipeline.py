@@ -8,21 +8,41 @@ Features:
   • Model discovery & ranking (top 6 models)
   • Per-batch context awareness (3 lines before/after)
   • 2-attempt retry per model with backoff
+  • Local translation cache: cached lines skipped, finished batches stored
   • Emergency DeepSeek fallback on complete failure
+  • Concurrent batches (processor.translate_concurrency) behind a shared rate limiter
   • Live SRT checkpoint saving during processing
+  • Translation prompt sent as a stable system instruction (prompt caching)
   • Language-specific text fixes (Persian chars, English echo stripping)
 """
 
 from typing import List, Dict, Optional
+import importlib.util
+import threading
 import time
 from tqdm import tqdm
 
+from subtitle.concurrency import is_throttle_error, run_batches
+from subtitle.io import flush_live_checkpoint, live_checkpoint
+
 from . import (
     build_contextual_batch_text, 
-    write_partial_translation_srt,
     filter_gemini_generation_models,
     rank_gemini_model_name
 )
+from .local_cache import fill_from_local_cache, store_batch_in_local_cache
+from .prefilter import dedupe_source_lines, fan_out_duplicates, prefill_untranslatable
+
+# Rough prompt tokens per batch (Gemini); ~4 characters per token.
+_TOKEN_BUDGET = 3000
+
+
+def _has_genai() -> bool:
+    """True when the google-genai SDK is importable (without importing it)."""
+    try:
+        return importlib.util.find_spec("google.genai") is not None
+    except ImportError:
+        return False
 
 
 def run_gemini_translation_pipeline(
@@ -59,13 +79,7 @@ def run_gemini_translation_pipeline(
         RuntimeError: If both Gemini and DeepSeek emergency fallback fail
     """
     # Early exit checks
-    try:
-        from google import genai
-        HAS_GEMINI = True
-    except ImportError:
-        HAS_GEMINI = False
-    
-    if not HAS_GEMINI:
+    if not _has_genai():
         processor.logger.warning("google-genai SDK not installed. Falling back to DeepSeek.")
         return processor.translate_with_deepseek(
             texts, target_lang, source_lang, 30, 
@@ -79,19 +93,6 @@ def run_gemini_translation_pipeline(
             original_entries, output_srt, existing_translations
         )
 
-    # ── Initialize Gemini Client ──────────────────────────────────────────
-    from google import genai
-    client = genai.Client(api_key=processor.google_api_key)
-    
-    # ── Discover and rank available models ─────────────────────────────────
-    available_models = _get_available_gemini_models_internal(
-        client, processor
-    )
-    processor.logger.info(
-        f"📡 Discovered {len(available_models)} Gemini models. "
-        f"Top pick: {available_models[0] if available_models else 'NONE'}"
-    )
-
     # ── Initialize translation tracking ───────────────────────────────────
     indices = list(range(len(texts)))
     final_result = [None] * len(texts)
@@ -101,6 +102,11 @@ def run_gemini_translation_pipeline(
         for idx, txt in existing_translations.items():
             if 0 <= idx < len(final_result) and txt and txt.strip():
                 final_result[idx] = txt
+
+    # Lines translated in earlier runs (by any pipeline) are never re-sent
+    fill_from_local_cache(processor, texts, target_lang, final_result)
+    # Markup-only and already-translated lines never reach the API
+    prefill_untranslatable(processor, texts, source_lang, target_lang, final_result)
     
     # Early exit if nothing to translate
     indices_to_translate = [i for i in indices if final_result[i] is None]
@@ -110,11 +116,58 @@ def run_gemini_translation_pipeline(
             for i in range(len(texts))
         ]
 
+    # Identical source lines are translated once and copied to their repeats
+    indices_to_translate, repeats = dedupe_source_lines(texts, indices_to_translate)
+    if repeats:
+        processor.logger.info(
+            f"♻️ {sum(map(len, repeats.values()))} repeated lines share a translation"
+        )
+
+    # ── Initialize Gemini Client ──────────────────────────────────────────
+    client = processor.gemini_client
+    
+    # ── Discover and rank available models ─────────────────────────────────
+    available_models = _get_available_gemini_models_internal(
+        client, processor
+    )
+    processor.logger.info(
+        f"📡 Discovered {len(available_models)} Gemini models. "
+        f"Top pick: {available_models[0] if available_models else 'NONE'}"
+    )
+
+    # ── Stable prompt prefix ─────────────────────────────────────────────
+    # The translation prompt is identical for every batch, so it is sent as
+    # the system instruction instead of being glued onto each batch. The
+    # configured model reuses the explicit server-side cache; the other
+    # ranked models get Gemini's implicit prefix caching.
+    from google.genai import types as genai_types
+    system_config = genai_types.GenerateContentConfig(
+        system_instruction=processor.get_translation_prompt(target_lang)
+    )
+    cached_model = processor.llm_models["gemini"].split("/")[-1]
+    cached_config = None
+    if any(m.split("/")[-1] == cached_model for m in available_models[:6]):
+        cache_name = processor._get_gemini_content_cache(target_lang)
+        if cache_name:
+            cached_config = genai_types.GenerateContentConfig(cached_content=cache_name)
+    # Cached prompt tokens of this run only; the processor total is shared
+    # with other target languages and files translating at the same time.
+    run_cached_tokens = 0
+    run_cached_lock = threading.Lock()
+
     # ── Create batches ───────────────────────────────────────────────────
+    # The character budget follows the backpressure controller: it grows
+    # while the provider answers fast and halves after throttling.
+    bp = processor.backpressure
     batch_indices_list = processor._create_balanced_batches(
-        indices_to_translate, texts, batch_size
+        indices_to_translate, texts, batch_size,
+        max_chars=bp.batch_char_budget(_TOKEN_BUDGET * 4),
     )
     batch_count = len(batch_indices_list)
+    # Batches own disjoint indices of final_result; the checkpoint, rate
+    # limiter and backpressure controller are the only shared state (all lock).
+    live = live_checkpoint(output_srt, original_entries, final_result)
+    limiter = processor.translate_limiter
     pbar = tqdm(
         total=len(indices_to_translate),
         unit="item",
@@ -122,7 +175,8 @@ def run_gemini_translation_pipeline(
     )
 
     # ── Process each batch ───────────────────────────────────────────────
-    for i, batch_indices in enumerate(batch_indices_list):
+    def _translate_batch(i: int, batch_indices: List[int]) -> None:
+        nonlocal run_cached_tokens
         batch = [texts[idx] for idx in batch_indices]
 
         # ── Build context-aware prompt ────────────────────────────────────
@@ -161,15 +215,26 @@ def run_gemini_translation_pipeline(
             
             for attempt in range(2):
                 try:
-                    prompt = (
-                        f"{processor.get_translation_prompt(target_lang)}\n\n"
-                        f"Text to translate (numbered list):\n{batch_text}"
-                    )
-                    
-                    response = client.models.generate_content(
-                        model=model_name,
-                        contents=prompt
-                    )
+                    if cached_config is not None and model_name.split("/")[-1] == cached_model:
+                        config = cached_config
+                    else:
+                        config = system_config
+
+                    limiter.wait()
+                    with bp.slot():
+                        t0 = time.perf_counter()
+                        response = client.models.generate_content(
+                            model=model_name,
+                            contents=f"Text to translate (numbered list):\n{batch_text}",
+                            config=config,
+                        )
+                    bp.on_success(time.perf_counter() - t0)
+                    usage = getattr(response, "usage_metadata", None)
+                    cached = getattr(usage, "cached_content_token_count", 0) or 0
+                    if cached:
+                        processor._add_cost_savings("gemini_cached_tokens", cached)
+                        with run_cached_lock:
+                            run_cached_tokens += cached
                     output = response.text.strip()
                     trans_list = processor._parse_translated_batch_output(
                         output, len(batch)
@@ -206,22 +271,22 @@ def run_gemini_translation_pipeline(
                         for rel_idx, trans in enumerate(result_batch):
                             abs_idx = batch_indices[rel_idx]
                             final_result[abs_idx] = trans
+                        store_batch_in_local_cache(processor, batch, result_batch, target_lang)
+                        copied = fan_out_duplicates(final_result, repeats, batch_indices)
                         
                         # Live checkpoint saving
-                        if output_srt and original_entries:
-                            write_partial_translation_srt(
-                                output_srt, final_result, original_entries
-                            )
+                        if live is not None:
+                            live.update(batch_indices + copied, final_result)
                         
                         success = True
                         pbar.update(len(batch))
                         break
                     else:
-                        delay = min(4 + attempt, 10)
+                        delay = bp.next_backoff(attempt + 1, base=4.0, cap=10.0)
                         processor.logger.warning(
                             f"⚠️ {model_name} batch incomplete: "
                             f"got {len(trans_list)}/{len(batch)}. "
-                            f"Retrying in {delay}s..."
+                            f"Retrying in {delay:.1f}s..."
                         )
                         time.sleep(delay)
 
@@ -230,7 +295,8 @@ def run_gemini_translation_pipeline(
                         processor.logger.warning(
                             f"🛡️ {model_name} attempt {attempt} failed: {e}"
                         )
-                    time.sleep(1)
+                    bp.on_error(e)
+                    time.sleep(bp.next_backoff(attempt + 1, cap=10.0) if is_throttle_error(e) else 1)
             
             if not success:
                 processor.logger.debug(
@@ -249,10 +315,13 @@ def run_gemini_translation_pipeline(
                 )
                 for idx_in_batch, txt in zip(batch_indices, ds_result):
                     final_result[idx_in_batch] = txt
+                copied = fan_out_duplicates(final_result, repeats, batch_indices)
+                if live is not None:
+                    live.update(batch_indices + copied, final_result)
             except Exception as e:
                 processor.logger.error(
                     f"❌ CRITICAL FAILURE: Both Gemini and DeepSeek failed "
-                    f"for batch {i // batch_size + 1}"
+                    f"for batch {i + 1}"
                 )
                 raise RuntimeError(
                     f"Translation halted to prevent data loss: {e}"
@@ -260,7 +329,16 @@ def run_gemini_translation_pipeline(
             
             pbar.update(len(batch))
 
-    pbar.close()
+    try:
+        run_batches(
+            _translate_batch, batch_indices_list,
+            getattr(processor, "translate_concurrency", 4), thread_name_prefix="gemini",
+        )
+    finally:
+        pbar.close()
+        if run_cached_tokens:
+            processor.logger.info(f"🧊 Gemini prompt cache: {run_cached_tokens:,} prompt tokens served from cache")
+        flush_live_checkpoint(live)
     return final_result
 
 
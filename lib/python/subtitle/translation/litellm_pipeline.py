@@ -8,15 +8,26 @@ Features:
   • Smart provider prefix resolution (auto-detect service from model name)
   • 10-attempt nuclear retry with temperature nudging
   • Per-batch validation + live SRT checkpointing
+  • Concurrent batches (processor.translate_concurrency) behind a shared rate limiter
+  • Local translation cache: cached lines skipped, finished batches stored
+  • Stable system message (Anthropic cache_control) for provider prompt caching
   • Graceful fallback to DeepSeek on exhaustion
   • Language-specific text fixes (Persian chars, echo cleaning)
 """
 
 from typing import List, Dict, Optional
+import threading
 import time
 from tqdm import tqdm
 
-from . import write_partial_translation_srt
+from subtitle.concurrency import run_batches
+from subtitle.io import flush_live_checkpoint, live_checkpoint
+
+from .local_cache import fill_from_local_cache, store_batch_in_local_cache
+from .prefilter import dedupe_source_lines, fan_out_duplicates, prefill_untranslatable
+
+# Rough prompt tokens per batch (LiteLLM); ~4 characters per token.
+_TOKEN_BUDGET = 1500
 
 
 def run_litellm_translation_pipeline(
@@ -87,6 +98,11 @@ def run_litellm_translation_pipeline(
         for idx, txt in existing_translations.items():
             if 0 <= idx < len(final_result) and txt and txt.strip():
                 final_result[idx] = txt
+
+    # Lines translated in earlier runs (by any pipeline) are never re-sent
+    fill_from_local_cache(processor, texts, target_lang, final_result)
+    # Markup-only and already-translated lines never reach the API
+    prefill_untranslatable(processor, texts, source_lang, target_lang, final_result)
     
     indices_to_translate = [i for i in indices if final_result[i] is None]
     if not indices_to_translate:
@@ -95,11 +111,45 @@ def run_litellm_translation_pipeline(
             for i in range(len(texts))
         ]
 
+    # Identical source lines are translated once and copied to their repeats
+    indices_to_translate, repeats = dedupe_source_lines(texts, indices_to_translate)
+    if repeats:
+        processor.logger.info(
+            f"♻️ {sum(map(len, repeats.values()))} repeated lines share a translation"
+        )
+
+    # ── Stable prompt prefix ─────────────────────────────────────────────
+    # One system message shared by every batch, so providers can serve it
+    # from their prompt cache. OpenAI, DeepSeek and Gemini cache a repeated
+    # prefix on their own; Anthropic needs an explicit cache_control marker.
+    system_prompt = processor.get_translation_prompt(target_lang)
+    if model_name.startswith("anthropic/"):
+        system_message = {
+            "role": "system",
+            "content": [
+                {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+            ],
+        }
+    else:
+        system_message = {"role": "system", "content": system_prompt}
+    # Cached prompt tokens of this run only; the processor total is shared
+    # with other target languages and files translating at the same time.
+    run_cached_tokens = 0
+    run_cached_lock = threading.Lock()
+
     # ── Create batches ───────────────────────────────────────────────────
+    # The character budget follows the backpressure controller: it grows
+    # while the provider answers fast and halves after throttling.
+    bp = processor.backpressure
     batch_indices_list = processor._create_balanced_batches(
-        indices_to_translate, texts, batch_size
+        indices_to_translate, texts, batch_size,
+        max_chars=bp.batch_char_budget(_TOKEN_BUDGET * 4),
     )
     batch_count = len(batch_indices_list)
+    # Batches own disjoint indices of final_result; the checkpoint, rate
+    # limiter and backpressure controller are the only shared state (all lock).
+    live = live_checkpoint(output_srt, original_entries, final_result)
+    limiter = processor.translate_limiter
     pbar = tqdm(
         total=len(indices_to_translate),
         unit="item",
@@ -107,7 +157,8 @@ def run_litellm_translation_pipeline(
     )
     
     # ── Process each batch ───────────────────────────────────────────────
-    for i, batch_indices in enumerate(batch_indices_list):
+    def _translate_batch(i: int, batch_indices: List[int]) -> None:
+        nonlocal run_cached_tokens
         batch = [texts[idx] for idx in batch_indices]
         batch_text = "\n".join([f"{idx+1}. {t}" for idx, t in enumerate(batch)])
         
@@ -126,18 +177,26 @@ def run_litellm_translation_pipeline(
                     attempt * 0.05 if attempt > 3 else 0
                 )
                 
-                response = completion(
-                    model=model_name,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": processor.get_translation_prompt(target_lang)
-                        },
-                        {"role": "user", "content": batch_text}
-                    ],
-                    temperature=min(1.0, current_temp),  # Cap at 1.0
-                    timeout=90
+                limiter.wait()
+                with bp.slot():
+                    t0 = time.perf_counter()
+                    response = completion(
+                        model=model_name,
+                        messages=[system_message, {"role": "user", "content": batch_text}],
+                        temperature=min(1.0, current_temp),  # Cap at 1.0
+                        timeout=90
+                    )
+                bp.on_success(time.perf_counter() - t0)
+                usage = getattr(response, "usage", None)
+                cached = (
+                    getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", 0)
+                    or getattr(usage, "prompt_cache_hit_tokens", 0)
+                    or 0
                 )
+                if cached:
+                    processor._add_cost_savings("litellm_cached_tokens", cached)
+                    with run_cached_lock:
+                        run_cached_tokens += cached
                 
                 output = response.choices[0].message.content.strip()
                 trans_list = processor._parse_translated_batch_output(
@@ -173,32 +232,42 @@ def run_litellm_translation_pipeline(
                     for rel_idx, trans in enumerate(trans_list[:len(batch)]):
                         abs_idx = batch_indices[rel_idx]
                         final_result[abs_idx] = trans
+                    store_batch_in_local_cache(processor, batch, trans_list[:len(batch)], target_lang)
+                    copied = fan_out_duplicates(final_result, repeats, batch_indices)
                     
                     # Live checkpoint saving
-                    if output_srt and original_entries:
-                        write_partial_translation_srt(
-                            output_srt, final_result, original_entries
-                        )
+                    if live is not None:
+                        live.update(batch_indices + copied, final_result)
                     
                     success = True
                     pbar.update(len(batch))
                 else:
-                    delay = min(5 + attempt, 12)
+                    delay = bp.next_backoff(attempt, base=5.0, cap=12.0)
                     processor.logger.warning(
                         f"⚠️ LiteLLM attempt {attempt}/{max_retries} incomplete: "
-                        f"{len(trans_list)}/{len(batch)}. Retrying in {delay}s..."
+                        f"{len(trans_list)}/{len(batch)}. Retrying in {delay:.1f}s..."
                     )
                     time.sleep(delay)
 
             except Exception as e:
                 processor.logger.error(f"❌ LiteLLM attempt {attempt} failed: {e}")
+                bp.on_error(e)
                 if attempt >= max_retries:
                     raise RuntimeError(
                         f"Halted: LiteLLM failed after {max_retries} attempts: {e}"
                     )
-                time.sleep(5)
+                time.sleep(bp.next_backoff(attempt, base=5.0, cap=60.0))
 
-    pbar.close()
+    try:
+        run_batches(
+            _translate_batch, batch_indices_list,
+            getattr(processor, "translate_concurrency", 4), thread_name_prefix="litellm",
+        )
+    finally:
+        pbar.close()
+        if run_cached_tokens:
+            processor.logger.info(f"🧊 LiteLLM prompt cache: {run_cached_tokens:,} prompt tokens served from cache")
+        flush_live_checkpoint(live)
     return final_result
 
 
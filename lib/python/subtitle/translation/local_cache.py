@@ -0,0 +1,48 @@
+from typing import List, Optional, Sequence
+
+
+def fill_from_local_cache(
+    processor,
+    texts: Sequence[str],
+    target_lang: str,
+    final_result: List[Optional[str]],
+) -> int:
+    """Fill still-empty final_result slots from the local translation cache.
+
+    One batched lookup for all pending lines; hits are counted in the
+    processor's cost savings and logged. Returns the number of hits.
+    """
+    pending = [i for i, value in enumerate(final_result) if value is None]
+    if not pending:
+        return 0
+    cached_map = processor._lookup_local_cache_many([texts[i] for i in pending], target_lang)
+    hits = 0
+    for i in pending:
+        cached = cached_map.get(texts[i])
+        if cached:
+            final_result[i] = cached
+            hits += 1
+    if hits:
+        processor._add_cost_savings("local_cache_hits", hits)
+        processor.logger.info(f"💾 Local cache: {hits} translations reused (100% cost saved)")
+    return hits
+
+
+def store_batch_in_local_cache(
+    processor,
+    sources: Sequence[str],
+    translations: Sequence[Optional[str]],
+    target_lang: str,
+) -> None:
+    """Cache a finished batch and commit it in one transaction.
+
+    Lines that came back empty or unchanged (the pipelines' "keep the
+    source" fallback) are not cached, so a failed line is retried next run.
+    """
+    stored = False
+    for source, trans in zip(sources, translations):
+        if trans and trans.strip() and trans != source:
+            processor._store_local_cache(source, target_lang, trans)
+            stored = True
+    if stored:
+        processor._save_local_translation_cache()
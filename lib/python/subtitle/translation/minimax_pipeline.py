@@ -16,7 +16,7 @@ from typing import List, Dict, Optional
 import time
 from tqdm import tqdm
 
-from . import write_partial_translation_srt
+from subtitle.io import flush_live_checkpoint, live_checkpoint
 
 
 def run_minimax_translation_pipeline(
@@ -85,6 +85,7 @@ def run_minimax_translation_pipeline(
         indices_to_translate, texts, batch_size
     )
     batch_count = len(batch_indices_list)
+    live = live_checkpoint(output_srt, original_entries, final_result)
     pbar = tqdm(
         total=len(indices_to_translate),
         unit="item",
@@ -150,12 +151,10 @@ def run_minimax_translation_pipeline(
                         final_result[batch_indices[rel_idx]] = trans
 
                     # Live checkpoint saving
-                    if output_srt and original_entries:
+                    if live is not None:
                         try:
-                            write_partial_translation_srt(
-                                output_srt, final_result, original_entries
-                            )
-                        except:
+                            live.update(batch_indices, final_result)
+                        except Exception:
                             pass
 
                     pbar.update(len(batch))
@@ -189,11 +188,13 @@ def run_minimax_translation_pipeline(
                 f"{last_error_msg}"
             )
             pbar.close()
+            flush_live_checkpoint(live)
             raise RuntimeError(
                 f"MiniMax translation halted at batch {i+1}: {last_error_msg}"
             )
 
     pbar.close()
+    flush_live_checkpoint(live)
     return final_result
 
 
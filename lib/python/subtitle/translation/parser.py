@@ -1,6 +1,31 @@
 import json
 import re
-from typing import Callable, List, Optional
+from typing import Any, Callable, List, Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_SALVAGE_JSON_RE = re.compile(r'\{"1".*?\}', re.DOTALL)
+_FENCE_OPEN_RE = re.compile(r"^```(?:json|text)?\s*", re.IGNORECASE)
+_FENCE_CLOSE_RE = re.compile(r"\s*```$")
+_NUMBERED_LINE_RE = re.compile(r"^[\-\*•\u2022]?\s*[\(\[]?(\d+)[\)\]\.\-:\s]+(.*)")
+
+
+def _loads(text: str) -> Any:
+    """Parse model JSON (orjson when installed, stdlib otherwise).
+
+    orjson is stricter (no NaN/Infinity, 64-bit integers only); anything it
+    rejects gets a second try with the stdlib so results do not change.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
 
 
 def parse_translated_batch_output(
@@ -17,10 +42,10 @@ def parse_translated_batch_output(
     if "</think>" in output or "I'm capturing" in output or "I am capturing" in output:
         if logger is not None:
             logger.error("❌ LLM thinking detected in output! Model returned internal reasoning.")
-        match = re.search(r'\{"1".*?\}', output, re.DOTALL)
+        match = _SALVAGE_JSON_RE.search(output)
         if match:
             try:
-                parsed_json = json.loads(match.group())
+                parsed_json = _loads(match.group())
                 items = [str(parsed_json.get(str(i + 1), "")).strip() for i in range(expected_count)]
                 if any(items):
                     if logger is not None:
@@ -31,13 +56,13 @@ def parse_translated_batch_output(
         return []
 
     cleaned = output.strip()
-    cleaned = re.sub(r"^```(?:json|text)?\s*", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s*```$", "", cleaned)
+    cleaned = _FENCE_OPEN_RE.sub("", cleaned)
+    cleaned = _FENCE_CLOSE_RE.sub("", cleaned)
     cleaned = normalize_digits(cleaned)
 
     if cleaned.startswith("[") or cleaned.startswith("{"):
         try:
-            parsed_json = json.loads(cleaned)
+            parsed_json = _loads(cleaned)
             if isinstance(parsed_json, list):
                 items = [str(item).strip() for item in parsed_json if str(item).strip()]
                 if items:
@@ -58,12 +83,13 @@ def parse_translated_batch_output(
 
     parsed_lines = {}
     current_num = None
+    # cleaned is already digit-normalized as a whole.
     for raw_line in cleaned.split("\n"):
-        line = normalize_digits(raw_line.strip())
+        line = raw_line.strip()
         if not line:
             continue
 
-        match = re.match(r"^[\-\*•\u2022]?\s*[\(\[]?(\d+)[\)\]\.\-:\s]+(.*)", line)
+        match = _NUMBERED_LINE_RE.match(line)
         if match:
             num = int(match.group(1))
             content = match.group(2).strip().strip('"').strip("'")
@@ -75,13 +101,24 @@ def parse_translated_batch_output(
             prev = parsed_lines.get(current_num, "")
             parsed_lines[current_num] = f"{prev} {line}".strip()
 
+    needed = int(expected_count * threshold)
+    if expected_count and len(parsed_lines) < needed:
+        # Not enough numbered lines parsed to ever pass the threshold.
+        return []
+
+    # Build the ordered list and count usable lines in the same pass.
     ordered: List[Optional[str]] = []
+    valid_count = 0
     for i in range(1, expected_count + 1):
         value = parsed_lines.get(i)
-        ordered.append(value if value else None)
+        if value:
+            ordered.append(value)
+            if not value.isspace():
+                valid_count += 1
+        else:
+            ordered.append(None)
 
-    valid_count = sum(1 for v in ordered if v and v.strip())
-    if expected_count == 0 or valid_count >= int(expected_count * threshold):
+    if expected_count == 0 or valid_count >= needed:
         return ordered
 
     return []
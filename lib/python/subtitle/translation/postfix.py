@@ -2,6 +2,7 @@ import os
 from typing import Any, Dict, List
 
 from subtitle.config import get_language_config
+from subtitle.io import write_srt_file
 
 
 _HIDDEN_NATIVE_CUE_MARKER = "\u061c"
@@ -102,6 +103,4 @@ def apply_final_target_text_fixes(
                     )
 
             if changed:
-                with open(tgt_path, "w", encoding="utf-8-sig") as f:
-                    for idx, entry in enumerate(tgt_entries, 1):
-                        f.write(f"{idx}\n{entry['start']} --> {entry['end']}\n{entry['text']}\n\n")
\ No newline at end of file
+                write_srt_file(tgt_path, tgt_entries)
\ No newline at end of file
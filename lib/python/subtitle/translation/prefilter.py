@@ -0,0 +1,93 @@
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from subtitle.config import get_language_config
+
+_ASS_TAG_RE = re.compile(r"\{[^}]*\}")
+_NO_WORDS_RE = re.compile(r"[\d\W_]*")
+_LATIN_WORD_RE = re.compile(r"[A-Za-z]{2,}")
+
+
+def prefill_untranslatable(
+    processor,
+    texts: Sequence[str],
+    source_lang: str,
+    target_lang: str,
+    final_result: List[Optional[str]],
+) -> int:
+    """Fill still-empty slots whose line needs no API call.
+
+    Two kinds of line are kept as they are: lines with only numbers,
+    punctuation or SSA override tags, and lines already written in the
+    target script. The second check only runs when the source uses a
+    different script (e.g. en -> fa) and the line has no Latin words and
+    no source-script characters, so mixed lines, and lines of scripts
+    that overlap (ja kanji fall in the zh range), are still sent.
+    Persian lines go through fix_persian_text like model output. Returns
+    the number filled.
+    """
+    target_config = get_language_config(target_lang)
+    source_config = get_language_config(source_lang)
+    source_pattern = source_config.char_pattern
+    # Same-script pairs (e.g. ar -> fa) cannot be told apart by script.
+    if target_config.char_range != source_config.char_range:
+        target_pattern = target_config.char_pattern
+    else:
+        target_pattern = None
+
+    skipped = 0
+    for i, value in enumerate(final_result):
+        if value is not None:
+            continue
+        text = texts[i] or ""
+        if _NO_WORDS_RE.fullmatch(_ASS_TAG_RE.sub("", text)):
+            final_result[i] = text
+        elif (target_pattern is not None and target_pattern.search(text) and not _LATIN_WORD_RE.search(text)
+              and (source_pattern is None or not source_pattern.search(text))):
+            final_result[i] = processor.fix_persian_text(text) if target_lang == "fa" else text
+        else:
+            continue
+        skipped += 1
+    if skipped:
+        processor.logger.info(f"⏭ Skipped {skipped} pre-translated/markup lines")
+    return skipped
+
+
+def dedupe_source_lines(
+    texts: Sequence[str],
+    indices: Sequence[int],
+) -> Tuple[List[int], Dict[int, List[int]]]:
+    """Keep the first index of each distinct (stripped) line.
+
+    Returns the kept indices, in their original order so batch context is
+    unchanged, and a map from each kept index to the later indices that
+    repeat it. After a batch lands, fan_out_duplicates() copies the result.
+    """
+    first_seen: Dict[str, int] = {}
+    kept: List[int] = []
+    repeats: Dict[int, List[int]] = {}
+    for i in indices:
+        key = (texts[i] or "").strip()
+        first = first_seen.setdefault(key, i)
+        if first == i:
+            kept.append(i)
+        else:
+            repeats.setdefault(first, []).append(i)
+    return kept, repeats
+
+
+def fan_out_duplicates(
+    final_result: List[Optional[str]],
+    repeats: Dict[int, List[int]],
+    indices: Sequence[int],
+) -> List[int]:
+    """Copy translated first occurrences in indices to their repeats; return the indices written."""
+    written: List[int] = []
+    for i in indices:
+        value = final_result[i]
+        if value is None:
+            continue
+        for j in repeats.get(i, ()):
+            final_result[j] = value
+            written.append(j)
+    return written
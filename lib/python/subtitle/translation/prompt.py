@@ -0,0 +1,44 @@
+from functools import lru_cache
+
+from subtitle.config import get_language_config
+
+
+@lru_cache(maxsize=32)
+def build_translation_prompt(target_lang: str) -> str:
+    """Universal translation prompt with structural constraints (constant per language)."""
+    lang_config = get_language_config(target_lang)
+    lang_name = lang_config.name
+    
+    # Special handling for Persian (informal tone)
+    if target_lang == 'fa':
+        return (
+            f"You are a professional {lang_name} subtitle translator.\n"
+            "SYSTEM: Tehrani informal tone.\n"
+            "FORMAT: Return ONLY a valid JSON object where keys are the input line numbers and values are the translations.\n"
+            "EXAMPLE: {\"1\": \"سلام\", \"2\": \"چطوری؟\"}\n"
+            f"RULE: For ACRONYMS ONLY (API, AGI, CapEx), write the {lang_name} translation first, then the English acronym in parentheses. "
+            "For ALL other words, translate directly into Persian WITHOUT any English in parentheses.\n"
+            "CRITICAL 1: You MUST translate EACH numbered item independently. The output JSON must have the EXACT SAME NUMBER of keys as the input items.\n"
+            "CRITICAL 2: Each item is a RAW SUBTITLE SEGMENT — it may be an incomplete sentence fragment that continues from the previous line or continues into the next. "
+            "Translate ONLY the exact words given. Do NOT complete the thought. Do NOT add words from context. Do NOT summarize multiple items into one.\n"
+            "CRITICAL 3: The translation for line N MUST cover the SAME semantic content as the input for line N — nothing more, nothing less. "
+            "If the input is short (e.g. 'guy but it almost'), the translation must also be short and faithful.\n"
+            "CRITICAL 4: NEVER echo or repeat the original English source text in your output.\n"
+            "CRITICAL 5: NEVER put English words inside parentheses as clarification. "
+            "Do NOT write things like 'اطلاعاتی (intelligence)' — just write 'اطلاعاتی'. "
+            "If a fragment seems incomplete, translate what is given faithfully without annotation.\n"
+            "NO commentary, NO extra text."
+        )
+
+    # Generic prompt for other languages
+    return (
+        f"You are a professional {lang_name} subtitle translator.\n"
+        "FORMAT: Return ONLY a valid JSON object where keys are the input line numbers and values are the translations.\n"
+        "EXAMPLE: {\"1\": \"Hello\", \"2\": \"How are you?\"}\n"
+        "CRITICAL 1: You MUST translate EACH line strictly independently. Do NOT merge two lines into one key. The output JSON must have the EXACT SAME NUMBER of keys as the input TARGET LINES, with NO skipped numbers.\n"
+        "CRITICAL 2: Each item is a RAW SUBTITLE SEGMENT and may be an incomplete sentence fragment. "
+        "Translate ONLY the exact words given — do NOT complete the thought or add words from surrounding context.\n"
+        "CRITICAL 3: The translation for line N MUST correspond EXACTLY to the English text in line N. Do NOT shift translations up or down keys.\n"
+        "CRITICAL 4: NEVER add parenthetical clarifications with English words. Translate directly without annotation.\n"
+        "NO commentary, NO extra text."
+    )
@@ -1,11 +1,7 @@
 import time
 from typing import List
 
-try:
-    from openai import OpenAI
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
+from subtitle.config import has_target_language_chars
 
 
 def translate_batch_single_attempt(
@@ -21,9 +17,7 @@ def translate_batch_single_attempt(
     """Run one model translation flow with limited retries and strict output size."""
 
     if model_name == "deepseek":
-        if not HAS_OPENAI:
-            raise ImportError("OpenAI package required for DeepSeek translation. Please install with 'pip install openai'")
-        client = OpenAI(api_key=processor.api_key, base_url="https://api.deepseek.com/v1")
+        client = processor.deepseek_client
 
         for attempt in range(1, max_retries + 1):
             try:
@@ -44,7 +38,7 @@ def translate_batch_single_attempt(
                 if hasattr(response, "usage") and response.usage:
                     cached_tokens = getattr(response.usage, "prompt_cache_hit_tokens", 0) or 0
                     if cached_tokens:
-                        processor._cost_savings["deepseek_cache_hit_tokens"] += cached_tokens
+                        processor._add_cost_savings("deepseek_cache_hit_tokens", cached_tokens)
 
                 trans_list = processor._parse_translated_batch_output(output, len(batch))
 
@@ -55,7 +49,7 @@ def translate_batch_single_attempt(
                             if not t or not t.strip():
                                 processed_list.append(batch[idx_in_batch])
                                 continue
-                            if not any("\u0600" <= c <= "\u06FF" for c in t):
+                            if not has_target_language_chars(t, "fa"):
                                 processed_list.append(batch[idx_in_batch])
                             else:
                                 processed_list.append(processor.fix_persian_text(processor.strip_english_echo(t)))
@@ -128,10 +122,9 @@ def translate_batch_single_attempt(
                 if not has_gemini or not processor.google_api_key:
                     raise ValueError("Gemini SDK not available or API key not set")
 
-                from google import genai
                 from google.genai import types as genai_types
 
-                client = genai.Client(api_key=processor.google_api_key)
+                client = processor.gemini_client
 
                 batch_text = "\n".join([f"{idx+1}. {t}" for idx, t in enumerate(batch)])
                 model = processor.llm_models["gemini"]
@@ -155,7 +148,7 @@ def translate_batch_single_attempt(
                 if hasattr(response, "usage_metadata") and response.usage_metadata:
                     cached = getattr(response.usage_metadata, "cached_content_token_count", 0) or 0
                     if cached:
-                        processor._cost_savings["gemini_cached_tokens"] += cached
+                        processor._add_cost_savings("gemini_cached_tokens", cached)
 
                 trans_list = processor._parse_translated_batch_output(output, len(batch))
                 if trans_list and len(trans_list) >= len(batch):
@@ -176,12 +169,10 @@ def translate_batch_single_attempt(
     elif model_name == "grok":
         for attempt in range(1, max_retries + 1):
             try:
-                from openai import OpenAI as XAI_Client
-
                 if not processor.grok_api_key:
                     raise ValueError("GROK_API_KEY not set")
 
-                client = XAI_Client(api_key=processor.grok_api_key, base_url="https://api.x.ai/v1")
+                client = processor.grok_client
                 batch_text = "\n".join([f"{idx+1}. {t}" for idx, t in enumerate(batch)])
 
                 response = client.chat.completions.create(
@@ -201,7 +192,7 @@ def translate_batch_single_attempt(
                 if hasattr(response, "usage") and response.usage:
                     cached_tokens = getattr(response.usage, "prompt_cache_hit_tokens", 0) or 0
                     if cached_tokens:
-                        processor._cost_savings["grok_cache_hit_tokens"] += cached_tokens
+                        processor._add_cost_savings("grok_cache_hit_tokens", cached_tokens)
 
                 trans_list = processor._parse_translated_batch_output(output, len(batch))
                 if trans_list and len(trans_list) >= len(batch):
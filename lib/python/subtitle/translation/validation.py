@@ -3,6 +3,9 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 from subtitle.config import get_language_config
+from subtitle.io import write_srt_file
+
+_PAREN_LATIN_RE = re.compile(r"\([A-Za-z0-9\s\-]+\)")
 
 
 def validate_and_retry_translations(
@@ -30,9 +33,7 @@ def validate_and_retry_translations(
                 for e in tgt_entries:
                     e["text"] = processor.fix_persian_text(e["text"])
 
-                with open(tgt_srt, "w", encoding="utf-8-sig") as f:
-                    for idx, entry in enumerate(tgt_entries, 1):
-                        f.write(f"{idx}\n{entry['start']} --> {entry['end']}\n{entry['text']}\n\n")
+                write_srt_file(tgt_srt, tgt_entries)
 
                 src_entries = processor.parse_srt(src_srt)
                 untranslated_indices = []
@@ -44,12 +45,9 @@ def validate_and_retry_translations(
                         untranslated_indices.append(i)
                         continue
 
-                    if lang_config.char_range:
-                        char_start, char_end = lang_config.char_range
-                        has_target_chars = any(char_start <= c <= char_end for c in text)
-                        if not has_target_chars:
-                            has_parenthetical_english = bool(re.search(r"\([A-Za-z0-9\s\-]+\)", text))
-                            if not has_parenthetical_english:
+                    if lang_config.char_pattern is not None:
+                        if not lang_config.char_pattern.search(text):
+                            if not _PAREN_LATIN_RE.search(text):
                                 untranslated_indices.append(i)
                     else:
                         if i < len(src_entries) and text == src_entries[i]["text"].strip():
@@ -133,9 +131,7 @@ def validate_and_retry_translations(
                     if new_translation and new_translation.strip() and idx < len(tgt_entries):
                         tgt_entries[idx]["text"] = new_translation
 
-                with open(tgt_srt, "w", encoding="utf-8-sig") as f:
-                    for idx, entry in enumerate(tgt_entries, 1):
-                        f.write(f"{idx}\n{entry['start']} --> {entry['end']}\n{entry['text']}\n\n")
+                write_srt_file(tgt_srt, tgt_entries)
 
                 print("\n✅ Retried translations results:\n")
                 success_rows = []
@@ -1,4 +1,4 @@
-from .rendering import run_rendering_stage
+from .rendering import find_subtitle_fonts_dir, find_up_to_date_render, render_options_signature, run_rendering_stage
 from .finalize import run_finalize_stage
 from .translation_stage import run_translation_stage
 from .source_stage import prepare_source_srt
@@ -23,6 +23,9 @@ from .util import (
 
 __all__ = [
 	"run_rendering_stage",
+	"find_subtitle_fonts_dir",
+	"find_up_to_date_render",
+	"render_options_signature",
 	"run_finalize_stage",
 	"run_translation_stage",
 	"prepare_source_srt",
@@ -5,6 +5,33 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 
+def _scan_dir_sizes(directory: str) -> Dict[str, int]:
+    """Map file name -> size for one directory using a single scandir pass."""
+    sizes: Dict[str, int] = {}
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_file():
+                        sizes[entry.name] = entry.stat().st_size
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return sizes
+
+
+def _strip_temp_prefix(stem: str) -> str:
+    """Drop one leading "temp_<digits>_" or "safe_" prefix left by earlier runs."""
+    if stem.startswith("temp_"):
+        digits, sep, rest = stem[5:].partition("_")
+        if sep and digits.isdecimal():
+            return rest
+    if stem.startswith("safe_"):
+        return stem[5:]
+    return stem
+
+
 def resolve_workflow_base(
     processor,
     video_path: str,
@@ -30,7 +57,7 @@ def resolve_workflow_base(
     original_stem = Path(video_path).stem
 
     if "safe_input" in original_stem or "temp_" in original_stem:
-        original_stem = re.sub(r"^(temp_\d+_|safe_)", "", original_stem)
+        original_stem = _strip_temp_prefix(original_stem)
 
     original_stem = re.sub(r"_\d{3,4}p(?:_q\d+)?(?:_\d+)?$", "", original_stem)
 
@@ -78,6 +105,16 @@ def resolve_workflow_base(
         if re.fullmatch(r"[a-z]{2,3}", str(l or "").lower())
     ]
 
+    # Candidate bases share a handful of directories: list each one once
+    # and answer every existence probe from memory instead of stat-ing.
+    dir_listings: Dict[str, Dict[str, int]] = {}
+
+    def dir_files(directory: str) -> Dict[str, int]:
+        listing = dir_listings.get(directory)
+        if listing is None:
+            listing = dir_listings[directory] = _scan_dir_sizes(directory)
+        return listing
+
     if source_lang in ("auto", "detect", ""):
         for fallback_lang in (
             "en",
@@ -108,20 +145,19 @@ def resolve_workflow_base(
             if d and os.path.isdir(d) and d not in scan_dirs:
                 scan_dirs.append(d)
         for scan_dir in scan_dirs:
-            try:
-                for p in Path(scan_dir).glob("*_*.srt"):
-                    m = re.search(r"_([a-z]{2,3})\.srt$", p.name.lower())
-                    if m:
-                        lang = m.group(1)
-                        if lang not in probe_langs:
-                            probe_langs.append(lang)
-            except Exception:
-                continue
+            for name in dir_files(scan_dir):
+                m = re.search(r"_([a-z]{2,3})\.srt$", name.lower())
+                if m:
+                    lang = m.group(1)
+                    if lang not in probe_langs:
+                        probe_langs.append(lang)
 
     existing_base = None
     for b in candidate_bases:
+        files = dir_files(os.path.dirname(b))
+        b_name = os.path.basename(b)
         for l in probe_langs:
-            if os.path.exists(f"{b}_{l}.srt"):
+            if f"{b_name}_{l}.srt" in files:
                 existing_base = b
                 break
         if existing_base:
@@ -140,19 +176,17 @@ def resolve_workflow_base(
                 search_dirs.append(d)
 
         for search_dir in search_dirs:
+            names = sorted(dir_files(search_dir))
             for l in probe_langs:
-                try:
-                    for p in Path(search_dir).glob(f"*_{l}.srt"):
-                        if not p.is_file():
-                            continue
-                        cand_base = str(p)[: -len(f"_{l}.srt")]
-                        cand_stem = os.path.basename(cand_base)
-                        cand_norm = normalize_candidate_stem(cand_stem)
-                        if cand_norm == normalized_target_stem or stem_match_key(cand_norm) == target_stem_key:
-                            existing_base = cand_base
-                            break
-                except Exception:
-                    continue
+                suffix = f"_{l}.srt"
+                for name in names:
+                    if not name.endswith(suffix) or len(name) == len(suffix):
+                        continue
+                    cand_stem = name[: -len(suffix)]
+                    cand_norm = normalize_candidate_stem(cand_stem)
+                    if cand_norm == normalized_target_stem or stem_match_key(cand_norm) == target_stem_key:
+                        existing_base = os.path.join(search_dir, cand_stem)
+                        break
                 if existing_base:
                     break
             if existing_base:
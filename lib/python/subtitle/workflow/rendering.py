@@ -1,10 +1,217 @@
+import glob
+import hashlib
 import os
 import shutil
 import subprocess
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from subtitle.io import drop_page_cache, link_or_clone_file
+
+
+_FONT_SEARCH_DIRS = (
+    "~/Library/Fonts",
+    "/Library/Fonts",
+    "~/.local/share/fonts",
+    "/usr/share/fonts/truetype",
+    "/usr/share/fonts",
+)
+
+
+@lru_cache(maxsize=1)
+def find_subtitle_fonts_dir() -> Optional[str]:
+    """Return the first font directory holding a Vazirmatn .ttf/.otf, if any.
+
+    Cached: the scan is only worth doing once per process, and the workflow
+    warms it while translation is still waiting on the network.
+    """
+    for p in _FONT_SEARCH_DIRS:
+        p = os.path.expanduser(p)
+        if not os.path.isdir(p):
+            continue
+        try:
+            for f in os.listdir(p):
+                fl = f.lower()
+                if "vazirmatn" in fl and (fl.endswith(".ttf") or fl.endswith(".otf")):
+                    return p
+        except OSError:
+            continue
+    return None
+
+
+def _partial_split_parts(partial_path: str) -> List[str]:
+    # media_lib.sh names split chunks "${input%.*}_partNNN.${ext}".
+    stem, ext = os.path.splitext(partial_path)
+    return sorted(glob.glob(f"{glob.escape(stem)}_part[0-9][0-9][0-9]{ext}"))
+
+
+def _remove_partial(path: str) -> None:
+    for p in [path] + _partial_split_parts(path):
+        try:
+            os.remove(p)
+        except OSError:
+            pass
+
+
+def _finalize_split_parts(partial_path: str, output_video: str) -> List[str]:
+    """Rename split chunks of the hidden partial render after the final output.
+
+    --split runs on the file the engine wrote, so its chunks carry the partial
+    name (".clip.partial_part001.mp4"); they become "clip_part001.mp4".
+    """
+    partial_stem = os.path.splitext(partial_path)[0]
+    output_stem = os.path.splitext(output_video)[0]
+    renamed = []
+    for part in _partial_split_parts(partial_path):
+        final_part = output_stem + part[len(partial_stem):]
+        os.replace(part, final_part)
+        renamed.append(final_part)
+    return renamed
+
+
+def _resolve_render_quality(render_quality: Optional[int], get_default_quality_fn) -> int:
+    try:
+        if render_quality and int(render_quality) > 0:
+            return int(render_quality)
+        return int(get_default_quality_fn())
+    except Exception:
+        return 65
+
+
+def rendered_output_path(
+    processor,
+    original_base: str,
+    video_input: str,
+    render_resolution: Optional[int],
+    render_quality: Optional[int],
+    get_default_quality_fn,
+) -> str:
+    """Return the `{base}[_{h}p]_q{q}_subbed.mp4` path a render would produce."""
+    try:
+        if render_resolution and int(render_resolution) > 0:
+            render_h = int(render_resolution)
+        else:
+            _dw, _dh = processor._detect_video_dimensions(video_input)
+            render_h = int(_dh) if _dh else 0
+    except Exception:
+        render_h = 0
+
+    render_q = _resolve_render_quality(render_quality, get_default_quality_fn)
+    return (
+        f"{original_base}_{render_h}p_q{render_q}_subbed.mp4"
+        if render_h > 0
+        else f"{original_base}_q{render_q}_subbed.mp4"
+    )
+
+
+_RENDER_FONT_ATTRS = ("fa_font_name", "fa_font_scale", "en_font_scale", "sec_font_size")
+
+
+def render_options_signature(processor, options: Dict[str, Any]) -> str:
+    """Hash of the style, font settings and render options a `_subbed.mp4` is burned with.
+
+    Uses the style as configured, not the per-video geometry written into
+    style_config, so the hash does not depend on what ran before.
+    """
+    style = getattr(processor, "_configured_style", None) or getattr(processor, "style_config", None)
+    fonts = tuple(getattr(processor, attr, None) for attr in _RENDER_FONT_ATTRS)
+    ident = repr((sorted(options.items()), style, fonts))
+    return hashlib.blake2b(ident.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _render_signature_path(output_video: str) -> str:
+    head, tail = os.path.split(output_video)
+    return os.path.join(head, f".{tail}.render")
+
+
+def _render_signature_matches(output_video: str, signature: Optional[str]) -> bool:
+    """True when no signature is tracked or the sidecar holds the same one."""
+    if signature is None:
+        return True
+    try:
+        with open(_render_signature_path(output_video), "r", encoding="utf-8") as f:
+            return f.read().strip() == signature
+    except OSError:
+        return False
+
+
+def _write_render_signature(output_video: str, signature: Optional[str]) -> None:
+    if signature is None:
+        return
+    try:
+        with open(_render_signature_path(output_video), "w", encoding="utf-8") as f:
+            f.write(signature)
+    except OSError:
+        pass
+
+
+def find_up_to_date_render(
+    processor,
+    original_base: str,
+    video_path: str,
+    source_lang: str,
+    target_langs: List[str],
+    render_resolution: Optional[int],
+    render_quality: Optional[int],
+    get_default_quality_fn,
+    render_signature: Optional[str] = None,
+) -> Optional[Dict[str, str]]:
+    """Return the sidecar result map if the rendered video is already current.
+
+    Current means: the `_subbed.mp4` is non-trivial, was rendered with the
+    same style/render options (render_signature), and is at least as new as
+    the input video, every target SRT and the ASS it was burned from. The
+    sidecars are collected with a single directory scan. Returns None when
+    any piece is missing or stale, so the caller runs the full pipeline.
+    """
+    output_video = rendered_output_path(
+        processor, original_base, video_path, render_resolution, render_quality, get_default_quality_fn
+    )
+    if not _render_signature_matches(output_video, render_signature):
+        return None
+    try:
+        out_stat = os.stat(output_video)
+        if out_stat.st_size <= 1024 or out_stat.st_mtime < os.stat(video_path).st_mtime:
+            return None
+    except OSError:
+        return None
+
+    base_dir, base_name = os.path.split(original_base)
+    mtimes: Dict[str, float] = {}
+    try:
+        with os.scandir(base_dir or ".") as it:
+            for entry in it:
+                if entry.name.startswith(base_name) and entry.is_file():
+                    mtimes[entry.name] = entry.stat().st_mtime
+    except OSError:
+        return None
+
+    primary = target_langs[0] if target_langs else source_lang
+    secondary = target_langs[1] if len(target_langs) >= 2 else None
+    ass_name = f"{base_name}_{primary}" + (f"_{secondary}" if secondary else "") + ".ass"
+
+    result: Dict[str, str] = {}
+    for lang in [source_lang, *target_langs]:
+        srt_name = f"{base_name}_{lang}.srt"
+        if srt_name in mtimes:
+            result[lang] = os.path.join(base_dir, srt_name)
+        elif lang != source_lang:
+            return None
+    if ass_name not in mtimes:
+        return None
+
+    required = [ass_name] + [f"{base_name}_{t}.srt" for t in target_langs if t != source_lang]
+    if out_stat.st_mtime < max(mtimes[name] for name in required):
+        return None
+
+    result["ass_file"] = os.path.join(base_dir, ass_name)
+    result["rendered_video"] = output_video
+    if f"{base_name}.zip" in mtimes:
+        result["bundle_zip"] = os.path.join(base_dir, f"{base_name}.zip")
+    return result
+
 
 def run_rendering_stage(
     processor,
@@ -30,6 +237,7 @@ def run_rendering_stage(
     get_default_quality_fn,
     subtitle_shift: float = 0.0,
     direct_ass_path: Optional[str] = None,
+    render_signature: Optional[str] = None,
     subtitle_banner_image: Optional[str] = None,
     subtitle_banner_color: Optional[str] = None,
     subtitle_banner_height: Optional[int] = None,
@@ -87,58 +295,48 @@ def run_rendering_stage(
                 f.write("Dialogue: 0,0:00:00.00,0:00:01.00,Default,,0,0,0,, \n")
     result["ass_file"] = ass_path
 
-    render_h = 0
-    render_q = 0
-    try:
-        if render_resolution and int(render_resolution) > 0:
-            render_h = int(render_resolution)
-        else:
-            _dw, _dh = processor._detect_video_dimensions(current_video_input)
-            render_h = int(_dh) if _dh else 0
-    except Exception:
-        render_h = 0
-
-    try:
-        if render_quality and int(render_quality) > 0:
-            render_q = int(render_quality)
-        else:
-            render_q = int(get_default_quality_fn())
-    except Exception:
-        render_q = 65
-
-    output_video = (
-        f"{original_base}_{render_h}p_q{render_q}_subbed.mp4"
-        if render_h > 0
-        else f"{original_base}_q{render_q}_subbed.mp4"
+    render_q = _resolve_render_quality(render_quality, get_default_quality_fn)
+    output_video = rendered_output_path(
+        processor,
+        original_base=original_base,
+        video_input=current_video_input,
+        render_resolution=render_resolution,
+        render_quality=render_quality,
+        get_default_quality_fn=get_default_quality_fn,
     )
     if os.path.exists(output_video) and not force:
-        try:
-            output_mtime = os.path.getmtime(output_video)
-            ass_mtime = os.path.getmtime(ass_path)
-            video_mtime = os.path.getmtime(current_video_input)
-            if output_mtime >= max(ass_mtime, video_mtime):
+        if not _render_signature_matches(output_video, render_signature):
+            processor.logger.info("♻️ Render options changed since the existing render; re-rendering.")
+        else:
+            try:
+                output_mtime = os.path.getmtime(output_video)
+                ass_mtime = os.path.getmtime(ass_path)
+                video_mtime = os.path.getmtime(current_video_input)
+                if output_mtime >= max(ass_mtime, video_mtime):
+                    processor.logger.info(f"✅ Reusing existing rendered video: {Path(output_video).name}")
+                    result["rendered_video"] = output_video
+                    return True
+                processor.logger.info("♻️ Existing rendered video is stale vs ASS/video input; re-rendering.")
+            except Exception:
                 processor.logger.info(f"✅ Reusing existing rendered video: {Path(output_video).name}")
                 result["rendered_video"] = output_video
                 return True
-            processor.logger.info("♻️ Existing rendered video is stale vs ASS/video input; re-rendering.")
-        except Exception:
-            processor.logger.info(f"✅ Reusing existing rendered video: {Path(output_video).name}")
-            result["rendered_video"] = output_video
-            return True
 
     with tempfile.TemporaryDirectory() as temp_dir:
         safe_video_name = "safe_input.mp4"
         safe_ass_name = "safe_subs.ass"
-        safe_output_name = "safe_output.mp4"
 
         safe_video_path = os.path.join(temp_dir, safe_video_name)
         safe_ass_path = os.path.join(temp_dir, safe_ass_name)
-        safe_output_path = os.path.join(temp_dir, safe_output_name)
+        # Encode next to the destination so finalizing is a rename, not a
+        # multi-GB copy out of the temp filesystem. Only the subtitle path is
+        # used inside the filtergraph, so the output needs no safe name.
+        safe_output_path = os.path.join(
+            os.path.dirname(os.path.abspath(output_video)), f".{Path(output_video).stem}.partial.mp4"
+        )
 
-        try:
-            os.symlink(os.path.abspath(current_video_input), safe_video_path)
-        except OSError:
-            shutil.copy(current_video_input, safe_video_path)
+        if link_or_clone_file(current_video_input, safe_video_path) == "copy":
+            processor.logger.info("ℹ️ Could not link or clone the input video; rendering from a full copy.")
 
         shutil.copy(ass_path, safe_ass_path)
 
@@ -151,31 +349,9 @@ def run_rendering_stage(
         processor.logger.info("🚀 Delegating rendering to 'amir video' engine...")
         emit_progress(88, "🎞️ Rendering final video...")
 
-        fonts_dir = None
-        font_paths = [
-            os.path.expanduser("~/Library/Fonts"),
-            "/Library/Fonts",
-            os.path.expanduser("~/.local/share/fonts"),
-            "/usr/share/fonts/truetype",
-            "/usr/share/fonts",
-        ]
-
-        for p in font_paths:
-            if os.path.exists(p):
-                found_font = None
-                try:
-                    for f in os.listdir(p):
-                        fl = f.lower()
-                        if "vazirmatn" in fl and (fl.endswith(".ttf") or fl.endswith(".otf")):
-                            found_font = os.path.join(p, f)
-                            break
-                except OSError:
-                    continue
-
-                if found_font:
-                    processor.logger.info(f"Found font: {found_font}")
-                    fonts_dir = p
-                    break
+        fonts_dir = find_subtitle_fonts_dir()
+        if fonts_dir:
+            processor.logger.info(f"Found font directory: {fonts_dir}")
 
         cover_frame_path = None
         cover_candidates = [
@@ -259,23 +435,28 @@ def run_rendering_stage(
             process = subprocess.run(render_cmd, env=current_env, check=False)
         except KeyboardInterrupt:
             processor.logger.warning("Rendering interrupted by user.")
+            _remove_partial(safe_output_path)
             return False
         except Exception as run_err:
             processor.logger.error(f"❌ Rendering failed to start: {run_err}")
+            _remove_partial(safe_output_path)
             return False
 
         print()
         if process.returncode != 0:
             processor.logger.error("❌ Rendering failed in 'amir video' engine.")
+            _remove_partial(safe_output_path)
             return False
 
         processor.logger.info("✅ Rendering completed successfully via centralized engine.")
         emit_progress(98, "✅ Video rendering complete!")
 
-        if os.path.exists(output_video):
-            os.remove(output_video)
-
-        shutil.move(safe_output_path, output_video)
+        os.replace(safe_output_path, output_video)
+        _finalize_split_parts(safe_output_path, output_video)
+        _write_render_signature(output_video, render_signature)
+        # Both files were streamed through once; keep them from crowding out the page cache.
+        drop_page_cache(safe_video_path)
+        drop_page_cache(output_video, written=True)
         result["rendered_video"] = output_video
         processor.logger.info(f"Rendering process finalized: {Path(output_video).name}")
 
@@ -1,9 +1,31 @@
 import os
+import shutil
 import subprocess
 import tempfile
 import time
 from typing import Any, Dict, List, Optional
 
+_RAM_TMP_DIR = "/dev/shm"
+
+
+def _trim_temp_dir(video_path: str) -> str:
+    """Pick where the time-range clip is written.
+
+    The clip is re-read by detection, transcription and rendering, so it has
+    to be a seekable file (a FIFO cannot serve several readers). When a
+    RAM-backed tmpfs can hold it, use that so the clip never touches disk.
+    """
+    override = os.environ.get("AMIR_TRIM_TMPDIR", "").strip()
+    if override:
+        return override
+    try:
+        # A stream-copied clip is never larger than its source.
+        if os.path.isdir(_RAM_TMP_DIR) and shutil.disk_usage(_RAM_TMP_DIR).free > 2 * os.path.getsize(video_path):
+            return _RAM_TMP_DIR
+    except OSError:
+        pass
+    return tempfile.gettempdir()
+
 
 def prepare_runtime_execution(
     processor,
@@ -52,7 +74,7 @@ def prepare_runtime_execution(
             )
         else:
             temp_vid = os.path.join(
-                tempfile.gettempdir(), f"temp_{int(time.time())}_{original_stem}.mp4"
+                _trim_temp_dir(video_path), f"temp_{int(time.time())}_{original_stem}.mp4"
             )
             cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error"]
             if limit_start_val > 0:
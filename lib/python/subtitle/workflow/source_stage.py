@@ -6,6 +6,8 @@ import tempfile
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+from subtitle.io import write_srt_file, write_srt_text
+
 
 def _download_yt_source_srt(processor, video_path: str, source_lang: str, dest_srt: str) -> bool:
     """Attempt to download YouTube subtitles for source_lang via yt-dlp.
@@ -334,11 +336,7 @@ def _auto_yt_check(
             )
             if all_words:
                 entries = processor.resegment_to_sentences(all_words, None)
-                with open(src_srt, "w", encoding="utf-8-sig") as f:
-                    for idx, entry in enumerate(entries, 1):
-                        f.write(
-                            f"{idx}\n{entry['start']} --> {entry['end']}\n{entry['text']}\n\n"
-                        )
+                write_srt_file(src_srt, entries)
                 processor.logger.info(
                     f"✅ Language-timeline transcription complete → {Path(src_srt).name}"
                 )
@@ -399,11 +397,7 @@ def _auto_yt_check(
                     )
                     if all_words:
                         entries = processor.resegment_to_sentences(all_words, None)
-                        with open(src_srt, "w", encoding="utf-8-sig") as f:
-                            for idx, entry in enumerate(entries, 1):
-                                f.write(
-                                    f"{idx}\n{entry['start']} --> {entry['end']}\n{entry['text']}\n\n"
-                                )
+                        write_srt_file(src_srt, entries)
                         processor.logger.info(
                             f"✅ Language-timeline transcription complete → {Path(src_srt).name}"
                         )
@@ -525,8 +519,7 @@ def prepare_source_srt(
                     shutil.move(generated_srt_path, src_srt)
             elif generated_is_raw_srt:
                 processor.logger.info(f"📝 Writing transcription content to: {Path(src_srt).name}")
-                with open(src_srt, "w", encoding="utf-8-sig") as f:
-                    f.write(generated_srt)
+                write_srt_text(src_srt, generated_srt)
             else:
                 raise FileNotFoundError(
                     "transcribe_video did not return a valid SRT path or raw SRT content"
@@ -610,9 +603,7 @@ def prepare_source_srt(
             src_entries = re_sanitized
             
     # Always commit the sanitized output back to disk to enforce geometry bounds
-    with open(src_srt, "w", encoding="utf-8-sig") as f:
-        for idx, entry in enumerate(src_entries, 1):
-            f.write(f"{idx}\n{entry['start']} --> {entry['end']}\n{entry['text']}\n\n")
+    write_srt_file(src_srt, src_entries)
 
     result[source_lang] = src_srt
     return src_srt
\ No newline at end of file
@@ -1,10 +1,11 @@
 import os
-import re
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Callable, Dict, List
 
 from subtitle.config import has_target_language_chars
+from subtitle.io import srt_headers, write_translated_srt_file
 
 
 def _env_flag(name: str, default: bool) -> bool:
@@ -39,7 +40,7 @@ def _env_float(name: str, default: float) -> float:
 
 
 def _word_count(text: str) -> int:
-    return len([w for w in re.split(r"\s+", (text or "").strip()) if w])
+    return len((text or "").split())
 
 
 def _is_probable_mismatch(src_text: str, tgt_text: str, target_lang: str) -> bool:
@@ -215,6 +216,143 @@ def _translate_with_selected_provider(
     )
 
 
+def _translate_target(
+    processor,
+    tgt: str,
+    source_lang: str,
+    src_entries: List[Dict[str, Any]],
+    src_headers: List[str],
+    tgt_srt: str,
+    original_base: str,
+    force: bool,
+    semantic_line_lock: bool,
+) -> str:
+    """Translate the source entries into one target language and write its SRT."""
+    # Each target gets its own copy: workers run concurrently and must not share entry dicts.
+    entries = [dict(entry) for entry in src_entries]
+
+    recovered_map = {}
+    if not force:
+        recovered_partial = processor._ingest_partial_srt(
+            entries, tgt_srt.replace(".srt", "_partial.srt"), tgt
+        )
+        if isinstance(recovered_partial, dict):
+            recovered_map.update(recovered_partial)
+
+        recovered_full = processor._ingest_partial_srt(entries, tgt_srt, tgt)
+        if isinstance(recovered_full, dict):
+            recovered_map.update(recovered_full)
+
+    if semantic_line_lock:
+        processor.logger.info(
+            "🧠 Semantic line-lock mode ON: preserving 1:1 source/target subtitle alignment"
+        )
+
+        source_texts = [str(entry.get("text", "")) for entry in entries if isinstance(entry, dict)]
+        translated = _translate_with_selected_provider(
+            processor,
+            source_texts,
+            tgt,
+            source_lang,
+            entries,
+            tgt_srt,
+            recovered_map,
+        )
+        if not isinstance(translated, list):
+            translated = list(source_texts)
+
+        translated, qc_report = _run_semantic_quality_gate(
+            processor,
+            source_texts,
+            translated,
+            tgt,
+            source_lang,
+        )
+
+        qc_report_path = f"{original_base}_{tgt}_semantic_qc.json"
+        _save_qc_report(qc_report_path, qc_report)
+        processor.logger.info(f"🧾 Semantic QC report: {Path(qc_report_path).name}")
+
+        if tgt == "fa":
+            translated = [
+                processor.fix_persian_text(processor.strip_english_echo(t)) if t and t.strip() else t
+                for t in translated
+            ]
+
+        write_translated_srt_file(tgt_srt, entries, translated, src_headers)
+
+        if tgt == "fa" and translated:
+            lang_specific_count = sum(
+                1 for t in translated if has_target_language_chars(str(t), tgt)
+            )
+            if lang_specific_count < len(translated) // 2:
+                processor.logger.warning(
+                    "⚠️ Translation audit failed: "
+                    f"Only {lang_specific_count}/{len(translated)} lines are Persian. "
+                    "LLM may have hallucinated or failed."
+                )
+
+        processor.logger.info(f"✓ Final save completed: {Path(tgt_srt).name}")
+        return tgt_srt
+
+    paragraph_groups = processor._group_entries_into_paragraphs(entries)
+    if not isinstance(paragraph_groups, list):
+        paragraph_groups = []
+    paragraph_texts = []
+    for group in paragraph_groups:
+        paragraph_texts.append(" ".join(entries[idx]["text"] for idx in group))
+
+    processor.logger.info(
+        f"📐 Paragraph grouping: {len(entries)} fragments → {len(paragraph_texts)} paragraphs"
+    )
+
+    para_entries = []
+    for group in paragraph_groups:
+        para_entries.append(
+            {
+                "start": entries[group[0]]["start"],
+                "end": entries[group[-1]]["end"],
+                "text": " ".join(entries[idx]["text"] for idx in group),
+            }
+        )
+
+    translated_paragraphs = _translate_with_selected_provider(
+        processor,
+        paragraph_texts,
+        tgt,
+        source_lang,
+        para_entries,
+        tgt_srt,
+        recovered_map,
+    )
+    if not isinstance(translated_paragraphs, list):
+        translated_paragraphs = list(paragraph_texts)
+
+    translated = processor._resegment_translation(entries, paragraph_groups, translated_paragraphs)
+
+    if tgt == "fa":
+        translated = [
+            processor.fix_persian_text(processor.strip_english_echo(t)) if t and t.strip() else t
+            for t in translated
+        ]
+
+    write_translated_srt_file(tgt_srt, entries, translated, src_headers)
+
+    if tgt == "fa" and translated:
+        lang_specific_count = sum(
+            1 for t in translated if has_target_language_chars(str(t), tgt)
+        )
+        if lang_specific_count < len(translated) // 2:
+            processor.logger.warning(
+                "⚠️ Translation audit failed: "
+                f"Only {lang_specific_count}/{len(translated)} lines are Persian. "
+                "LLM may have hallucinated or failed."
+            )
+
+    processor.logger.info(f"✓ Final save completed: {Path(tgt_srt).name}")
+    return tgt_srt
+
+
 def run_translation_stage(
     processor,
     result: Dict[str, Any],
@@ -226,7 +364,11 @@ def run_translation_stage(
     emit_progress,
     migrate_legacy_resolution_srt_fn: Callable[[str, str], bool],
 ) -> None:
-    """Translate source SRT into target languages with resume and resegmentation."""
+    """Translate source SRT into target languages with resume and resegmentation.
+
+    Targets are independent network-bound jobs, so the ones that still need
+    translating run concurrently (AMIR_TRANSLATION_TARGET_WORKERS, default 8).
+    """
     semantic_line_lock = _env_flag("AMIR_SUBTITLE_SEMANTIC_LINE_LOCK", True)
 
     tgt_langs_to_translate = [t for t in target_langs if t != source_lang]
@@ -236,16 +378,28 @@ def run_translation_stage(
         f"🌐 Starting translation to {', '.join(t.upper() for t in tgt_langs_to_translate)}...",
     )
 
+    try:
+        src_entries = processor.parse_srt(src_srt)
+    except Exception as e:
+        # Every target needs the source entries; fail them all the way a single target fails.
+        for tgt in tgt_langs_to_translate:
+            processor.logger.error(f"❌ Translation to {tgt} failed: {e}")
+        if processor.fail_on_translation_error:
+            raise
+        return
+    if not isinstance(src_entries, list):
+        src_entries = result.get("entries", []) if isinstance(result.get("entries"), list) else []
+
+    pending: Dict[str, str] = {}
     for tgt in target_langs:
-        if tgt == source_lang:
+        if tgt == source_lang or tgt in pending:
             continue
 
         tgt_srt = f"{original_base}_{tgt}.srt"
         migrate_legacy_resolution_srt_fn(tgt, tgt_srt)
 
         if os.path.exists(tgt_srt) and not force:
-            src_entries_count = len(processor.parse_srt(src_srt))
-            if processor.validate_srt(tgt_srt, src_entries_count, tgt):
+            if processor.validate_srt(tgt_srt, len(src_entries), tgt):
                 resegment_existing_target = _env_flag("AMIR_RESEGMENT_EXISTING_TARGET", False)
                 if resegment_existing_target:
                     try:
@@ -266,156 +420,49 @@ def run_translation_stage(
                 "is incomplete or untranslated. Recovering good segments..."
             )
 
+        pending[tgt] = tgt_srt
+
+    if not pending:
+        return
+
+    # Timing headers are identical for every target; format them once.
+    src_headers = srt_headers(src_entries)
+
+    def _start(tgt: str) -> None:
         processor.logger.info(f"--- Translation Sequence initiated (Target ISO: {tgt.upper()}) ---")
         tgt_idx = tgt_langs_to_translate.index(tgt) if tgt in tgt_langs_to_translate else 0
         start_pct = 55 + int(tgt_idx / max(1, tgt_count) * 20)
         emit_progress(start_pct, f"🌐 Translating to {tgt.upper()}...")
 
-        try:
-            entries = processor.parse_srt(src_srt)
-            if not isinstance(entries, list):
-                entries = result.get("entries", []) if isinstance(result.get("entries"), list) else []
-
-            recovered_map = {}
-            if not force:
-                recovered_partial = processor._ingest_partial_srt(
-                    entries, tgt_srt.replace(".srt", "_partial.srt"), tgt
-                )
-                if isinstance(recovered_partial, dict):
-                    recovered_map.update(recovered_partial)
-
-                recovered_full = processor._ingest_partial_srt(entries, tgt_srt, tgt)
-                if isinstance(recovered_full, dict):
-                    recovered_map.update(recovered_full)
-
-            if semantic_line_lock:
-                processor.logger.info(
-                    "🧠 Semantic line-lock mode ON: preserving 1:1 source/target subtitle alignment"
-                )
-
-                source_texts = [str(entry.get("text", "")) for entry in entries if isinstance(entry, dict)]
-                translated = _translate_with_selected_provider(
-                    processor,
-                    source_texts,
-                    tgt,
-                    source_lang,
-                    entries,
-                    tgt_srt,
-                    recovered_map,
-                )
-                if not isinstance(translated, list):
-                    translated = list(source_texts)
-
-                translated, qc_report = _run_semantic_quality_gate(
-                    processor,
-                    source_texts,
-                    translated,
-                    tgt,
-                    source_lang,
-                )
-
-                qc_report_path = f"{original_base}_{tgt}_semantic_qc.json"
-                _save_qc_report(qc_report_path, qc_report)
-                processor.logger.info(f"🧾 Semantic QC report: {Path(qc_report_path).name}")
-
-                if tgt == "fa":
-                    translated = [
-                        processor.fix_persian_text(processor.strip_english_echo(t)) if t and t.strip() else t
-                        for t in translated
-                    ]
-
-                with open(tgt_srt, "w", encoding="utf-8-sig") as f:
-                    for idx_srt, entry in enumerate(entries, 1):
-                        if not isinstance(entry, dict):
-                            continue
-                        start = str(entry.get("start", "00:00:00,000"))
-                        end = str(entry.get("end", "00:00:00,000"))
-                        src_text = str(entry.get("text", ""))
-                        t_text = translated[idx_srt - 1] if idx_srt - 1 < len(translated) else src_text
-                        f.write(f"{idx_srt}\n{start} --> {end}\n{t_text}\n\n")
-
-                if tgt == "fa" and translated:
-                    lang_specific_count = sum(
-                        1 for t in translated if has_target_language_chars(str(t), tgt)
-                    )
-                    if lang_specific_count < len(translated) // 2:
-                        processor.logger.warning(
-                            "⚠️ Translation audit failed: "
-                            f"Only {lang_specific_count}/{len(translated)} lines are Persian. "
-                            "LLM may have hallucinated or failed."
-                        )
-
-                result[tgt] = tgt_srt
-                processor.logger.info(f"✓ Final save completed: {Path(tgt_srt).name}")
-                continue
-
-            paragraph_groups = processor._group_entries_into_paragraphs(entries)
-            if not isinstance(paragraph_groups, list):
-                paragraph_groups = []
-            paragraph_texts = []
-            for group in paragraph_groups:
-                paragraph_texts.append(" ".join(entries[idx]["text"] for idx in group))
-
-            processor.logger.info(
-                f"📐 Paragraph grouping: {len(entries)} fragments → {len(paragraph_texts)} paragraphs"
-            )
-
-            para_entries = []
-            for group in paragraph_groups:
-                para_entries.append(
-                    {
-                        "start": entries[group[0]]["start"],
-                        "end": entries[group[-1]]["end"],
-                        "text": " ".join(entries[idx]["text"] for idx in group),
-                    }
-                )
-
-            translated_paragraphs = _translate_with_selected_provider(
-                processor,
-                paragraph_texts,
-                tgt,
-                source_lang,
-                para_entries,
-                tgt_srt,
-                recovered_map,
-            )
-            if not isinstance(translated_paragraphs, list):
-                translated_paragraphs = list(paragraph_texts)
-
-            translated = processor._resegment_translation(entries, paragraph_groups, translated_paragraphs)
-
-            if tgt == "fa":
-                translated = [
-                    processor.fix_persian_text(processor.strip_english_echo(t)) if t and t.strip() else t
-                    for t in translated
-                ]
-
-            with open(tgt_srt, "w", encoding="utf-8-sig") as f:
-                for idx_srt, entry in enumerate(entries, 1):
-                        if not isinstance(entry, dict):
-                            continue
-                        start = str(entry.get("start", "00:00:00,000"))
-                        end = str(entry.get("end", "00:00:00,000"))
-                        src_text = str(entry.get("text", ""))
-                        t_text = translated[idx_srt - 1] if idx_srt - 1 < len(translated) else src_text
-                        f.write(f"{idx_srt}\n{start} --> {end}\n{t_text}\n\n")
-
-            if tgt == "fa" and translated:
-                lang_specific_count = sum(
-                    1 for t in translated if has_target_language_chars(str(t), tgt)
-                )
-                if lang_specific_count < len(translated) // 2:
-                    processor.logger.warning(
-                        "⚠️ Translation audit failed: "
-                        f"Only {lang_specific_count}/{len(translated)} lines are Persian. "
-                        "LLM may have hallucinated or failed."
-                    )
-
-            result[tgt] = tgt_srt
-            processor.logger.info(f"✓ Final save completed: {Path(tgt_srt).name}")
+    def _args(tgt: str) -> tuple:
+        return (
+            processor, tgt, source_lang, src_entries, src_headers, pending[tgt], original_base, force, semantic_line_lock
+        )
 
-        except Exception as e:
-            processor.logger.error(f"❌ Translation to {tgt} failed: {e}")
-            if processor.fail_on_translation_error:
-                raise
-            continue
\ No newline at end of file
+    max_workers = min(len(pending), _env_int("AMIR_TRANSLATION_TARGET_WORKERS", 8))
+    if max_workers <= 1:
+        for tgt in pending:
+            _start(tgt)
+            try:
+                result[tgt] = _translate_target(*_args(tgt))
+            except Exception as e:
+                processor.logger.error(f"❌ Translation to {tgt} failed: {e}")
+                if processor.fail_on_translation_error:
+                    raise
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="translate") as pool:
+        futures = {}
+        for tgt in pending:
+            _start(tgt)
+            futures[pool.submit(_translate_target, *_args(tgt))] = tgt
+        for future in as_completed(futures):
+            tgt = futures[future]
+            try:
+                result[tgt] = future.result()
+            except Exception as e:
+                processor.logger.error(f"❌ Translation to {tgt} failed: {e}")
+                if processor.fail_on_translation_error:
+                    for other in futures:
+                        other.cancel()
+                    raise